@@ -1,3 +1,5 @@
+from django.core.exceptions import PermissionDenied
+
 from core.exceptions import ApplicationError
 
 
@@ -88,6 +90,19 @@ class PasswordResetTokenInvalidException(AccountError):
     message_id = "ERR_AUTH_003"
 
 
+class LoginThrottledException(AccountLockedException, PermissionDenied):
+    """
+    ログインの失敗回数が上限に達し、一時的にログインを制限している場合。
+    (PermissionDenied を継承し、django.contrib.auth.authenticate() 経由 (管理サイト) では認証失敗として扱われる)
+    """
+
+    default_message = (
+        "ログインの失敗回数が上限に達したため、一時的にログインを制限しています。"
+        "しばらく時間をおいてから再度お試しください。"
+    )
+    message_id = "ERR_AUTH_004"
+
+
 # サービス層での利用
 # raise TokenExpiredOrNotFoundException(details={"token": raw_token_value})
 
@@ -36,12 +36,23 @@ class UserSearchForm(forms.Form):
         label="スキルタグ",
         widget=forms.TextInput(
             attrs={
-                "placeholder": "例: Python",
+                "placeholder": "例: Python, Django",
                 "class": "input input-bordered w-full",
             }
         ),
     )
 
+    # 複数タグ指定時の検索方法（AND/OR）
+    skill_tag_mode = forms.ChoiceField(
+        required=False,
+        label="タグの一致条件",
+        choices=[
+            ("all", "全てのタグを含む"),
+            ("any", "いずれかのタグを含む"),
+        ],
+        widget=forms.Select(attrs={"class": "select select-bordered w-full"}),
+    )
+
     def clean_search_word(self):
         """search_wordのバリデーション"""
         search_word = self.cleaned_data.get("search_word", "").strip()
@@ -56,3 +67,7 @@ class UserSearchForm(forms.Form):
         """skill_tagのバリデーション"""
         skill_tag = self.cleaned_data.get("skill_tag", "").strip()
         return skill_tag if skill_tag else None
+
+    def clean_skill_tag_mode(self):
+        """skill_tag_modeのバリデーション（未指定の場合はAND検索）"""
+        return self.cleaned_data.get("skill_tag_mode") or "all"
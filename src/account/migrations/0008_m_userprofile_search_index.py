@@ -0,0 +1,65 @@
+from django.db import migrations
+
+# プロフィール検索用のインデックスを作成する
+# (DBエンジンごとに方式が異なるため、モデル定義ではなくマイグレーションで直接作成する)
+
+SQLITE_FTS_TABLE = "m_user_profile_fts"
+
+POSTGRESQL_TRGM_INDEXES = {
+    "m_user_profile_display_name_trgm": "display_name",
+    "m_user_profile_skill_tags_raw_trgm": "skill_tags_raw",
+    "m_user_profile_location_trgm": "location",
+}
+
+
+def create_search_index(apps, schema_editor):
+    """
+    SQLite: FTS5仮想テーブル(trigram)を作成し、既存プロフィールを登録する
+    PostgreSQL: pg_trgm拡張とGINトライグラムインデックスを作成する
+    """
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} "
+            "USING fts5(display_name, skill_tags_raw, location, tokenize='trigram')"
+        )
+        # 既存データの登録 (rowid = m_user_id)
+        schema_editor.execute(
+            f"INSERT INTO {SQLITE_FTS_TABLE} "
+            "(rowid, display_name, skill_tags_raw, location) "
+            "SELECT m_user_id, COALESCE(display_name, ''), "
+            "COALESCE(skill_tags_raw, ''), COALESCE(location, '') "
+            "FROM m_user_profile"
+        )
+
+    elif vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for index_name, column in POSTGRESQL_TRGM_INDEXES.items():
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON m_user_profile USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    """ロールバック時の処理（検索インデックスを削除）"""
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+
+    elif vendor == "postgresql":
+        for index_name in POSTGRESQL_TRGM_INDEXES:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0007_remove_notification_fields_from_profile'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
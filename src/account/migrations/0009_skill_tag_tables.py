@@ -0,0 +1,139 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:34
+
+import unicodedata
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# ※マイグレーションはモデル/アプリのコード変更の影響を受けないよう、正規化処理をここに固定で記述する
+
+
+def split_skill_tags(raw):
+    """カンマ区切りの技術タグ文字列を重複なしのリストに変換する（表記は入力のまま）"""
+    tags = {}
+    for name in (raw or "").split(","):
+        name = name.strip()[:64]
+        key = unicodedata.normalize("NFKC", name).casefold()
+        if key and key not in tags:
+            tags[key] = name
+    return tags
+
+
+def backfill_skill_tags(apps, schema_editor):
+    """
+    M_UserProfile.skill_tags_raw から技術タグマスタと紐付けを作成する
+    """
+    M_UserProfile = apps.get_model('account', 'M_UserProfile')
+    M_SkillTag = apps.get_model('account', 'M_SkillTag')
+    M_UserProfileSkillTag = apps.get_model('account', 'M_UserProfileSkillTag')
+
+    profiles = (
+        M_UserProfile.objects.exclude(skill_tags_raw__isnull=True)
+        .exclude(skill_tags_raw="")
+        .values_list('m_user_id', 'skill_tags_raw')
+    )
+
+    # 1. タグマスタの作成
+    tags_by_profile = {}
+    all_tags = {}
+    for m_user_id, skill_tags_raw in profiles.iterator(chunk_size=2000):
+        tags = split_skill_tags(skill_tags_raw)
+        tags_by_profile[m_user_id] = list(tags.keys())
+        for key, name in tags.items():
+            all_tags.setdefault(key, name)
+
+    M_SkillTag.objects.bulk_create(
+        [
+            M_SkillTag(
+                name=name,
+                normalized_name=key,
+                created_method='Migration:0009',
+                updated_method='Migration:0009',
+            )
+            for key, name in all_tags.items()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    tag_ids = dict(M_SkillTag.objects.values_list('normalized_name', 'id'))
+
+    # 2. プロフィールとタグの紐付けを作成
+    links = []
+    for m_user_id, keys in tags_by_profile.items():
+        for sort_order, key in enumerate(keys):
+            links.append(
+                M_UserProfileSkillTag(
+                    m_user_profile_id=m_user_id,
+                    m_skill_tag_id=tag_ids[key],
+                    sort_order=sort_order,
+                    created_method='Migration:0009',
+                    updated_method='Migration:0009',
+                )
+            )
+    M_UserProfileSkillTag.objects.bulk_create(
+        links, batch_size=1000, ignore_conflicts=True
+    )
+
+
+def reverse_backfill(apps, schema_editor):
+    """
+    ロールバック時の処理（テーブル自体が削除されるため何もしない）
+    """
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0008_m_userprofile_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='M_SkillTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(db_column='name', db_comment='タグ名（表示用）', max_length=64, verbose_name='タグ名')),
+                ('normalized_name', models.CharField(db_column='normalized_name', db_comment='正規化タグ名（NFKC正規化+小文字化した検索キー）', max_length=64, unique=True, verbose_name='正規化タグ名')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_column='created_at', db_comment='作成日時', null=True, verbose_name='作成日時')),
+                ('created_method', models.CharField(blank=True, db_column='created_method', db_comment='作成処理', max_length=128, null=True, verbose_name='作成処理')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_column='updated_at', db_comment='更新日時', null=True, verbose_name='更新日時')),
+                ('updated_method', models.CharField(blank=True, db_column='updated_method', db_comment='更新処理', max_length=128, null=True, verbose_name='更新処理')),
+                ('deleted_at', models.DateTimeField(blank=True, db_column='deleted_at', db_comment='削除日時', db_default=None, default=None, null=True, verbose_name='削除日時')),
+                ('created_by', models.ForeignKey(blank=True, db_column='created_by', db_comment='作成を行ったユーザー', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='作成者')),
+                ('updated_by', models.ForeignKey(blank=True, db_column='updated_by', db_comment='更新を行ったユーザー', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='更新者')),
+            ],
+            options={
+                'verbose_name': '技術タグマスタ',
+                'verbose_name_plural': '技術タグマスタ',
+                'db_table': 'm_skill_tag',
+                'db_table_comment': '技術タグマスタ',
+            },
+        ),
+        migrations.CreateModel(
+            name='M_UserProfileSkillTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sort_order', models.IntegerField(db_column='sort_order', db_comment='表示順', db_default=0, default=0, verbose_name='表示順')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_column='created_at', db_comment='作成日時', null=True, verbose_name='作成日時')),
+                ('created_method', models.CharField(blank=True, db_column='created_method', db_comment='作成処理', max_length=128, null=True, verbose_name='作成処理')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_column='updated_at', db_comment='更新日時', null=True, verbose_name='更新日時')),
+                ('updated_method', models.CharField(blank=True, db_column='updated_method', db_comment='更新処理', max_length=128, null=True, verbose_name='更新処理')),
+                ('deleted_at', models.DateTimeField(blank=True, db_column='deleted_at', db_comment='削除日時', db_default=None, default=None, null=True, verbose_name='削除日時')),
+                ('created_by', models.ForeignKey(blank=True, db_column='created_by', db_comment='作成を行ったユーザー', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='作成者')),
+                ('m_skill_tag', models.ForeignKey(db_column='m_skill_tag_id', db_comment='技術タグマスタ', on_delete=django.db.models.deletion.CASCADE, related_name='profile_links', to='account.m_skilltag', verbose_name='技術タグマスタ')),
+                ('m_user_profile', models.ForeignKey(db_column='m_user_profile_id', db_comment='ユーザプロフィールマスタ', on_delete=django.db.models.deletion.CASCADE, related_name='skill_tag_links', to='account.m_userprofile', verbose_name='ユーザプロフィールマスタ')),
+                ('updated_by', models.ForeignKey(blank=True, db_column='updated_by', db_comment='更新を行ったユーザー', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='更新者')),
+            ],
+            options={
+                'verbose_name': 'ユーザプロフィール技術タグ',
+                'verbose_name_plural': 'ユーザプロフィール技術タグ',
+                'db_table': 'm_user_profile_skill_tag',
+                'db_table_comment': 'ユーザプロフィール技術タグ',
+                'indexes': [models.Index(fields=['m_skill_tag', 'm_user_profile'], name='idx_skill_tag_profile')],
+                'constraints': [models.UniqueConstraint(fields=('m_user_profile', 'm_skill_tag'), name='unique_profile_skill_tag')],
+            },
+        ),
+        migrations.RunPython(backfill_skill_tags, reverse_backfill),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0009_skill_tag_tables'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='m_userprofile',
+            index=models.Index(fields=['created_at', 'm_user'], name='idx_user_profile_created'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def copy_sessions(apps, schema_editor):
+    """
+    django_session の有効なセッションを t_user_session へ移行する
+    (セッションエンジン切替時に全ユーザーがログアウトされないようにするため、一度だけ全件をデコードする)
+    """
+    from django.contrib.auth import SESSION_KEY
+    from django.contrib.sessions.backends.db import SessionStore
+
+    Session = apps.get_model('sessions', 'Session')
+    T_UserSession = apps.get_model('account', 'T_UserSession')
+    M_User = apps.get_model('account', 'M_User')
+    db_alias = schema_editor.connection.alias
+
+    user_ids = set(M_User.objects.using(db_alias).values_list('pk', flat=True))
+    store = SessionStore()
+    rows = []
+    sessions = Session.objects.using(db_alias).filter(expire_date__gt=timezone.now())
+    for session in sessions.iterator(chunk_size=2000):
+        try:
+            m_user_id = int(store.decode(session.session_data).get(SESSION_KEY))
+        except (ValueError, TypeError):
+            m_user_id = None
+        rows.append(
+            T_UserSession(
+                session_key=session.session_key,
+                session_data=session.session_data,
+                expire_date=session.expire_date,
+                m_user_id=m_user_id if m_user_id in user_ids else None,
+            )
+        )
+        if len(rows) >= 2000:
+            T_UserSession.objects.using(db_alias).bulk_create(rows, ignore_conflicts=True)
+            rows = []
+    if rows:
+        T_UserSession.objects.using(db_alias).bulk_create(rows, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0010_m_userprofile_created_index'),
+        ('sessions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='T_UserSession',
+            fields=[
+                ('session_key', models.CharField(max_length=40, primary_key=True, serialize=False, verbose_name='session key')),
+                ('session_data', models.TextField(verbose_name='session data')),
+                ('expire_date', models.DateTimeField(db_index=True, verbose_name='expire date')),
+                ('m_user', models.ForeignKey(blank=True, db_column='m_user_id', db_comment='ユーザマスタ', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='user_sessions', to=settings.AUTH_USER_MODEL, verbose_name='ユーザマスタ')),
+            ],
+            options={
+                'verbose_name': 'ユーザセッショントラン',
+                'verbose_name_plural': 'ユーザセッショントラン',
+                'db_table': 't_user_session',
+                'db_table_comment': 'ユーザセッショントラン',
+            },
+        ),
+        migrations.RunPython(copy_sessions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0011_t_user_session'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='m_user',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['email', 'is_active'], name='idx_user_email_active'),
+        ),
+        migrations.AddIndex(
+            model_name='m_userprofile',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['is_public', 'created_at'], name='idx_user_profile_public'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0012_alive_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='t_loginhisory',
+            index=models.Index(fields=['created_at'], name='idx_login_history_created'),
+        ),
+    ]
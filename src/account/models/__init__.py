@@ -1,6 +1,9 @@
 # setting.pyで参照できるように設定/循環インポート対策
+from .m_skill_tag import M_SkillTag
 from .m_user import M_User
 from .m_user_profile import M_UserProfile
+from .m_user_profile_skill_tag import M_UserProfileSkillTag
 from .m_user_settings import M_UserSettings
 from .t_login_history import T_LoginHisory
+from .t_user_session import T_UserSession
 from .t_user_token import T_UserToken
@@ -1,9 +1,35 @@
 from django.conf import settings
 from django.db import models
 
+from core.models import BaseModel
 
-class BaseModel(models.Model):
-    # created_by = models.CharField(db_column='created_by', verbose_name='作成者', db_comment='作成者', max_length=32, null=True, blank=True)
+
+# 技術タグマスタ
+class M_SkillTag(BaseModel):
+    """
+    プロフィールに設定される技術タグのマスタ。
+    表記ゆれ（大文字/小文字、全角/半角）は normalized_name で吸収し、完全一致検索に使用する。
+    """
+
+    # Fields
+    # ID (BIGINT PRIMARY KEY) はDjangoが自動で付与
+
+    # タグ名（最初に登録された表記）
+    name = models.CharField(
+        db_column="name",
+        verbose_name="タグ名",
+        db_comment="タグ名（表示用）",
+        max_length=64,
+    )
+    # 正規化タグ名（検索キー）
+    normalized_name = models.CharField(
+        db_column="normalized_name",
+        verbose_name="正規化タグ名",
+        db_comment="正規化タグ名（NFKC正規化+小文字化した検索キー）",
+        max_length=64,
+        unique=True,
+    )
+    # --- 各テーブル共通(AbstractBaseModelは列順が変わってしまうので使用しない) ---
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,  # M_Userモデルを参照
         db_column="created_by",
@@ -14,8 +40,6 @@ class BaseModel(models.Model):
         null=True,
         blank=True,
     )
-    # auto_now_add はインスタンスの作成(DBにINSERT)する度に更新
-    # created_at = models.DateTimeField(db_column='created_at', verbose_name='作成日時', db_comment='作成日時', auto_now_add=True, null=True, blank=True)
     created_at = models.DateTimeField(
         db_column="created_at",
         verbose_name="作成日時",
@@ -32,7 +56,6 @@ class BaseModel(models.Model):
         null=True,
         blank=True,
     )
-    # updated_by = models.CharField(db_column='updated_by', verbose_name='更新者', db_comment='更新者', max_length=32, null=True, blank=True)
     updated_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         db_column="updated_by",
@@ -43,8 +66,6 @@ class BaseModel(models.Model):
         null=True,
         blank=True,
     )
-    # auto_now=Trueの場合はモデルインスタンスを保存する度に現在の時間で更新
-    # updated_at = models.DateTimeField(db_column='updated_at', verbose_name='更新日時', db_comment='更新日時', auto_now=True, null=True, blank=True)
     updated_at = models.DateTimeField(
         db_column="updated_at",
         verbose_name="更新日時",
@@ -70,6 +91,14 @@ class BaseModel(models.Model):
         db_default=None,
         default=None,
     )
+    # --- 各テーブル共通 ---
 
+    # テーブル名
     class Meta:
-        abstract = True
+        db_table = "m_skill_tag"
+        db_table_comment = "技術タグマスタ"
+        verbose_name = "技術タグマスタ"
+        verbose_name_plural = "技術タグマスタ"
+
+    def __str__(self):
+        return f"{self.name}"
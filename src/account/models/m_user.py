@@ -4,9 +4,8 @@ from django.contrib.auth.models import PermissionsMixin
 from django.db import models
 from django.db.models import Q, UniqueConstraint
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
-from core.models import BaseModel
+from core.models import BaseModel, SelectiveHistoricalRecords, alive_index
 
 
 class M_UserManager(BaseUserManager):
@@ -237,7 +236,8 @@ class M_User(AbstractBaseUser, BaseModel, PermissionsMixin):
     USERNAME_FIELD = "email"
     # REQUIRED_FIELDS = ["user_id"]
     # django-simple-historyを使用
-    history = HistoricalRecords()
+    # (最終ログイン日時のみの更新では履歴を登録しない)
+    history = SelectiveHistoricalRecords(ignored_fields=["last_login"])
 
     # MetaSettings
     class Meta:
@@ -253,6 +253,10 @@ class M_User(AbstractBaseUser, BaseModel, PermissionsMixin):
                 name="unique_active_email",
             ),
         ]
+        indexes = [
+            # ログイン・メールアドレスでの検索 (未削除のユーザーのみ)
+            alive_index("email", "is_active", name="idx_user_email_active"),
+        ]
 
     def __str__(self):
         return f"{self.email}"
@@ -1,8 +1,7 @@
 from django.conf import settings
 from django.db import models
-from simple_history.models import HistoricalRecords
 
-from core.models import BaseModel
+from core.models import BaseModel, SelectiveHistoricalRecords, alive_index
 
 
 # ユーザプロフィールマスタ
@@ -183,7 +182,7 @@ class M_UserProfile(BaseModel):
     # --- 各テーブル共通 ---
 
     # django-simple-historyを使用
-    history = HistoricalRecords()
+    history = SelectiveHistoricalRecords()
 
     # テーブル名
     class Meta:
@@ -191,6 +190,15 @@ class M_UserProfile(BaseModel):
         db_table_comment = "ユーザプロフィールマスタ"
         verbose_name = "ユーザプロフィールマスタ"
         verbose_name_plural = "ユーザプロフィールマスタ"
+        indexes = [
+            # 公開プロフィール一覧のキーセットページネーション (作成日時, ユーザID) 用
+            models.Index(
+                fields=["created_at", "m_user"],
+                name="idx_user_profile_created",
+            ),
+            # 公開プロフィール検索 (公開フラグ + 作成日時の降順、未削除のプロフィールのみ)
+            alive_index("is_public", "created_at", name="idx_user_profile_public"),
+        ]
 
     def __str__(self):
         return f"{self.m_user}"
@@ -0,0 +1,133 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import UniqueConstraint
+
+from core.models import BaseModel
+
+
+# ユーザプロフィール技術タグ
+class M_UserProfileSkillTag(BaseModel):
+    """
+    ユーザプロフィールと技術タグマスタの紐付け（中間テーブル）。
+    M_UserProfile.skill_tags_raw から同期され、タグ検索の転置インデックスとして使用する。
+    同期時は論理削除せず、不要になった紐付けは物理削除する。
+    """
+
+    # Fields
+    # ID (BIGINT PRIMARY KEY) はDjangoが自動で付与
+
+    # ユーザプロフィールマスタ
+    m_user_profile = models.ForeignKey(
+        "account.M_UserProfile",
+        db_column="m_user_profile_id",
+        verbose_name="ユーザプロフィールマスタ",
+        db_comment="ユーザプロフィールマスタ",
+        on_delete=models.CASCADE,
+        # 逆参照名を定義(例: m_user_profile_instance.skill_tag_links)
+        related_name="skill_tag_links",
+    )
+    # 技術タグマスタ
+    m_skill_tag = models.ForeignKey(
+        "account.M_SkillTag",
+        db_column="m_skill_tag_id",
+        verbose_name="技術タグマスタ",
+        db_comment="技術タグマスタ",
+        on_delete=models.CASCADE,
+        # 逆参照名を定義(例: m_skill_tag_instance.profile_links)
+        related_name="profile_links",
+    )
+    # 表示順（skill_tags_raw 内での並び順）
+    sort_order = models.IntegerField(
+        db_column="sort_order",
+        verbose_name="表示順",
+        db_comment="表示順",
+        db_default=0,
+        default=0,
+    )
+    # --- 各テーブル共通(AbstractBaseModelは列順が変わってしまうので使用しない) ---
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,  # M_Userモデルを参照
+        db_column="created_by",
+        verbose_name="作成者",
+        db_comment="作成を行ったユーザー",
+        related_name="%(app_label)s_%(class)s_created",  # 関連名の一意性を確保
+        on_delete=models.SET_NULL,  # ユーザーが消えてもデータは残す
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        db_column="created_at",
+        verbose_name="作成日時",
+        db_comment="作成日時",
+        null=True,
+        blank=True,
+        auto_now_add=True,
+    )
+    created_method = models.CharField(
+        db_column="created_method",
+        verbose_name="作成処理",
+        db_comment="作成処理",
+        max_length=128,
+        null=True,
+        blank=True,
+    )
+    updated_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        db_column="updated_by",
+        verbose_name="更新者",
+        db_comment="更新を行ったユーザー",
+        related_name="%(app_label)s_%(class)s_updated",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    updated_at = models.DateTimeField(
+        db_column="updated_at",
+        verbose_name="更新日時",
+        db_comment="更新日時",
+        null=True,
+        blank=True,
+        auto_now=True,
+    )
+    updated_method = models.CharField(
+        db_column="updated_method",
+        verbose_name="更新処理",
+        db_comment="更新処理",
+        max_length=128,
+        null=True,
+        blank=True,
+    )
+    deleted_at = models.DateTimeField(
+        db_column="deleted_at",
+        verbose_name="削除日時",
+        db_comment="削除日時",
+        null=True,
+        blank=True,
+        db_default=None,
+        default=None,
+    )
+    # --- 各テーブル共通 ---
+
+    # テーブル名
+    class Meta:
+        db_table = "m_user_profile_skill_tag"
+        db_table_comment = "ユーザプロフィール技術タグ"
+        verbose_name = "ユーザプロフィール技術タグ"
+        verbose_name_plural = "ユーザプロフィール技術タグ"
+        constraints = [
+            # 1つのプロフィールに同じタグは1件のみ
+            UniqueConstraint(
+                fields=["m_user_profile", "m_skill_tag"],
+                name="unique_profile_skill_tag",
+            ),
+        ]
+        indexes = [
+            # タグ → プロフィールの逆引き（転置インデックス）
+            models.Index(
+                fields=["m_skill_tag", "m_user_profile"],
+                name="idx_skill_tag_profile",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.m_user_profile_id}/{self.m_skill_tag_id}"
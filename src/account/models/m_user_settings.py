@@ -1,8 +1,7 @@
 from django.conf import settings
 from django.db import models
-from simple_history.models import HistoricalRecords
 
-from core.models import BaseModel
+from core.models import BaseModel, SelectiveHistoricalRecords
 
 
 class M_UserSettings(BaseModel):
@@ -122,7 +121,7 @@ class M_UserSettings(BaseModel):
     # --- 各テーブル共通 ---
 
     # 履歴管理
-    history = HistoricalRecords(
+    history = SelectiveHistoricalRecords(
         # table_name="h_m_user_settings",
         # history_id_field=models.BigAutoField(),
         # excluded_fields=["deleted_at"],
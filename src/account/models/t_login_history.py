@@ -135,6 +135,10 @@ class T_LoginHisory(BaseModel):
         verbose_name_plural = "ログイン履歴トラン"
         # ログイン試行が多い場合、created_atとis_successfulで複合インデックスを貼ると効率が良い
         # indexes = [models.Index(fields=['created_at', 'is_successful'])]
+        indexes = [
+            # 保存期間を過ぎた履歴の削除 (common_expired_data_sweeper) で作成日時の範囲を絞り込む
+            models.Index(fields=["created_at"], name="idx_login_history_created"),
+        ]
 
     def __str__(self):
         return f"{self.m_user_id if self.m_user_id.user_id else '未認証'} - {self.created_at}"
@@ -0,0 +1,46 @@
+from django.contrib.sessions.base_session import AbstractBaseSession
+from django.db import models
+
+
+# ユーザセッショントラン
+class T_UserSession(AbstractBaseSession):
+    """
+    ユーザーIDの列を持つセッションテーブル。
+
+    django_session はセッションデータが暗号化・シリアライズされているため、
+    特定ユーザーのセッションを探すには全件をデコードする必要がある。
+    本テーブルではセッション保存時にログインユーザーのIDを列として保持し、
+    ユーザー単位のセッション削除 (強制ログアウト) をインデックスで解決する。
+    (セッションデータの読み書きは account.session_backends.db.SessionStore が行う)
+    """
+
+    # Fields
+    # session_key (主キー) / session_data / expire_date は AbstractBaseSession で定義
+    # ユーザマスタ (未ログインのセッションはNULL)
+    m_user = models.ForeignKey(
+        "account.M_User",
+        db_column="m_user_id",
+        verbose_name="ユーザマスタ",
+        db_comment="ユーザマスタ",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        db_index=True,
+        # 逆参照名を定義(例: m_user_instance.user_sessions/通常参照はt_user_session_instance.m_user(_id)で取得可能)
+        related_name="user_sessions",
+    )
+
+    class Meta:
+        db_table = "t_user_session"
+        db_table_comment = "ユーザセッショントラン"
+        verbose_name = "ユーザセッショントラン"
+        verbose_name_plural = "ユーザセッショントラン"
+
+    @classmethod
+    def get_session_store_class(cls):
+        from account.session_backends.db import SessionStore
+
+        return SessionStore
+
+    def __str__(self):
+        return f"{self.m_user_id}/{self.session_key}"
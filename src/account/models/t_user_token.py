@@ -1,8 +1,7 @@
 from django.conf import settings
 from django.db import models
-from simple_history.models import HistoricalRecords
 
-from core.models import BaseModel
+from core.models import BaseModel, SelectiveHistoricalRecords
 
 
 class TokenTypes(models.TextChoices):
@@ -122,7 +121,7 @@ class T_UserToken(BaseModel):
     # --- 各テーブル共通 ---
 
     # django-simple-historyを使用
-    history = HistoricalRecords()
+    history = SelectiveHistoricalRecords()
 
     # テーブル名
     class Meta:
@@ -130,6 +129,8 @@ class T_UserToken(BaseModel):
         db_table_comment = "ユーザ発行トークントラン"
         verbose_name = "ユーザ発行トークントラン"
         verbose_name_plural = "ユーザ発行トークントラン"
+        # ※トークンの検索 (token_hash + token_type) は token_hash の一意制約のインデックスで1件に絞り込めるため、
+        #   alive_index() による部分インデックスは追加しない
 
     def __str__(self):
         return f"{self.m_user}/{self.token_hash[:10]}..."
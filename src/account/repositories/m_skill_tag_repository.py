@@ -0,0 +1,89 @@
+from typing import Dict, List
+
+from django.contrib.auth import get_user_model
+
+from account.models import M_SkillTag
+from core.repositories import BaseRepository
+from core.utils.common import normalize_tag
+
+User = get_user_model()
+
+
+class M_SkillTagRepository(BaseRepository):
+    """
+    技術タグマスタ(M_SkillTag)モデル専用のリポジトリクラス。
+    """
+
+    model: M_SkillTag = M_SkillTag
+
+    # BaseRepositoryから継承される主なメソッド:
+    # - get_alive_by_pk(pk)
+    # - get_alive_one_or_none(**kwargs)
+    # - create(**kwargs)
+    # - update(instance, **kwargs)
+    # - soft_delete(instance)
+
+    # ------------------------------------------------------------------
+    # モデルに対する固有のデータ取得処理
+    # ------------------------------------------------------------------
+    def get_ids_by_names(self, names: List[str]) -> List[int]:
+        """
+        タグ名（正規化前）から、登録済みのタグIDを取得する（正規化タグ名のユニークインデックスで検索）。
+        """
+        normalized_names = {normalize_tag(name) for name in names}
+        return list(
+            self._get_alive_queryset()
+            .filter(normalized_name__in=normalized_names)
+            .values_list("pk", flat=True)
+        )
+
+    def get_or_create_by_names(
+        self, names: List[str], user: User, process_name: str
+    ) -> Dict[str, M_SkillTag]:
+        """
+        タグ名のリストに対応するタグマスタを取得し、未登録のタグは一括作成する。
+
+        Returns:
+            正規化タグ名をキーとしたタグマスタの辞書
+        """
+        # 正規化後に重複する場合は最初の表記を採用する
+        names_by_key = {}
+        for name in names:
+            names_by_key.setdefault(normalize_tag(name), name)
+        if not names_by_key:
+            return {}
+
+        tags = {
+            tag.normalized_name: tag
+            for tag in self._get_all_queryset().filter(
+                normalized_name__in=names_by_key.keys()
+            )
+        }
+
+        missing_keys = [key for key in names_by_key if key not in tags]
+        if missing_keys:
+            # 同時更新で先に作成された場合に備えて重複は無視し、作成後に取得し直す
+            self.model.objects.bulk_create(
+                [
+                    self.model(
+                        name=names_by_key[key],
+                        normalized_name=key,
+                        created_by=user,
+                        updated_by=user,
+                        created_method=process_name,
+                        updated_method=process_name,
+                    )
+                    for key in missing_keys
+                ],
+                ignore_conflicts=True,
+            )
+            tags.update(
+                {
+                    tag.normalized_name: tag
+                    for tag in self._get_all_queryset().filter(
+                        normalized_name__in=missing_keys
+                    )
+                }
+            )
+
+        return tags
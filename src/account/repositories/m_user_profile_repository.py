@@ -2,11 +2,18 @@ from typing import overload, Optional
 
 from django.db.models import QuerySet, Q
 
-from account.models import M_UserProfile
-from core.repositories import BaseRepository
+from account.models import M_User, M_UserProfile
+from account.search_backends import PROFILE_SEARCH_FIELDS, get_profile_search_backend
+from core.auth_scheme.user_auth_backend import invalidate_user_caches
+from core.repositories import COUNT_MODE_NONE, BaseRepository, KeysetPage
+from core.utils.identity_map import MISSING, IdentityMap, get_current_identity_map
 
 M_UserProfileQuerySet = QuerySet[M_UserProfile]
 
+# 公開プロフィール検索で取得する列 (find_public_profiles の projection)
+PROFILE_PROJECTION_FULL = "full"  # 全列とユーザー (m_user) を取得する
+PROFILE_PROJECTION_LIST = "list"  # 一覧表示に必要な列のみを取得する
+
 
 class M_UserProfileRepository(BaseRepository):
     """
@@ -49,6 +56,21 @@ class M_UserProfileRepository(BaseRepository):
     # * hard_delete(instance)      # レコードの物理削除
     # * restore(instance)          # レコードの復元 (deleted_atをNULLに)
 
+    # 【全件走査（主キー順に一定件数ずつ取得）】
+    # * iter_chunks(queryset, chunk_size, only)   # chunk_size 件ずつのリストで取得
+    # * iter_alive_records(chunk_size, only)      # 「生存している」レコードを1件ずつ取得
+    # * iter_all_records(chunk_size, only)        # 論理削除の状態を問わず1件ずつ取得
+
+    # 【一括データ操作】
+    # * bulk_create(instances, user, process_name)          # レコードの一括作成
+    # * bulk_update(instances, fields, user, process_name)  # レコードの一括更新
+    # * bulk_soft_delete(targets, user, process_name)       # レコードの一括論理削除
+    # * bulk_restore(targets, user, process_name)           # レコードの一括復元
+
+    # 【ページネーション】
+    # * paginate_by_keyset(queryset, cursor, ...)  # キーセット方式で1ページ分を取得
+    # * count_approximately(queryset, limit)       # 上限付きで件数を取得
+
     # ------------------------------------------------------------------
     # 共通で追加されるメソッドの型付けだけ行う
     # ------------------------------------------------------------------
@@ -76,39 +98,158 @@ class M_UserProfileRepository(BaseRepository):
     # @overload
     # def get_all_records(self) -> M_UserProfileQuerySet: ...
 
+    # ------------------------------------------------------------------
+    # 単一取得 (リクエスト内のアイデンティティマップを共有する)
+    # ------------------------------------------------------------------
+    # プロフィールの主キーとして扱う条件 (主キーはユーザID)
+    IDENTITY_LOOKUPS = ("pk", "m_user", "m_user_id")
+
+    def get_alive_by_pk(self, pk: int) -> M_UserProfile | None:
+        """主キー (ユーザID) で論理削除されていないプロフィールを取得"""
+        return self.get_alive_one_or_none(pk=pk)
+
+    def get_alive_one_or_none(self, **kwargs) -> M_UserProfile | None:
+        """
+        論理削除されていないプロフィールを条件で1件取得する。
+
+        ユーザID (主キー) のみを条件とする場合は、リクエスト内のアイデンティティマップを参照し、
+        同じリクエストで同じプロフィールを2回以上取得しない。
+        このリクエストでログインユーザーと共にDBから取得したプロフィール (UserAuthBackend.get_user) も
+        そのまま使用する (キャッシュから復元したユーザーはアイデンティティマップに登録されない)。
+        """
+        identity_map = get_current_identity_map()
+        user_id = self._get_identity_key(kwargs)
+        if identity_map is None or user_id is None:
+            return super().get_alive_one_or_none(**kwargs)
+
+        profile = identity_map.get(M_UserProfile, user_id)
+        if profile is MISSING:
+            profile = self._get_profile_loaded_with_user(identity_map, user_id)
+        if profile is MISSING:
+            profile = super().get_alive_one_or_none(pk=user_id)
+        identity_map.add(M_UserProfile, user_id, profile)
+        return self._track(profile)
+
+    def _get_identity_key(self, kwargs: dict):
+        """条件がユーザID (主キー) のみの場合はその値を返す"""
+        if len(kwargs) != 1:
+            return None
+        key, value = next(iter(kwargs.items()))
+        if key not in self.IDENTITY_LOOKUPS:
+            return None
+        return value.pk if isinstance(value, M_User) else value
+
+    @staticmethod
+    def _get_profile_loaded_with_user(identity_map: IdentityMap, user_id):
+        """アイデンティティマップに登録済みのユーザーが、プロフィールも取得済みであれば返す"""
+        user = identity_map.get(M_User, user_id)
+        if user is MISSING or user is None:
+            return MISSING
+        if not M_User._meta.get_field("user_profile").is_cached(user):
+            return MISSING
+
+        try:
+            profile = user.user_profile
+        except M_UserProfile.DoesNotExist:
+            return None
+        return profile if profile.deleted_at is None else None
+
+    def _after_bulk_write(self, pks, instances=None, fields=None) -> None:
+        """
+        一括操作ではシグナルが発行されないため、プロフィールを含めてキャッシュした
+        認証済みユーザー・アイデンティティマップのプロフィールをここで破棄する。
+        作成したプロフィール、検索対象の項目 (PROFILE_SEARCH_FIELDS) を更新したプロフィールは
+        検索インデックスに反映する (sync_profile_search_index の代わり)。
+        """
+        invalidate_user_caches(pks)
+        identity_map = get_current_identity_map()
+        if identity_map is not None:
+            for pk in pks:
+                identity_map.discard(M_UserProfile, pk)
+
+        if instances and (fields is None or PROFILE_SEARCH_FIELDS & set(fields)):
+            search_backend = get_profile_search_backend()
+            for instance in instances:
+                search_backend.index_profile(instance)
+
     # ------------------------------------------------------------------
     # モデルに対する固有のデータ取得処理
     # ------------------------------------------------------------------
+    # 一覧表示 (PROFILE_PROJECTION_LIST) で取得する列
+    # (主キーは常に取得される。created_at はキーセットページネーションの並び順に使用する)
+    LIST_PROJECTION_FIELDS = ("display_name", "icon", "bio", "skill_tags_raw", "created_at")
+
     def find_public_profiles(
         self,
         search_word: Optional[str] = None,
         location: Optional[str] = None,
-        skill_tag: Optional[str] = None,
+        profile_ids: Optional[QuerySet] = None,
+        projection: str = PROFILE_PROJECTION_FULL,
     ) -> M_UserProfileQuerySet:
         """
         公開プロフィールを検索する
 
+        検索条件の適用とランキングはDBエンジンに応じた検索バックエンドに委譲する。
+        (SQLite: FTS5 / PostgreSQL: pg_trgm / その他: 部分一致)
+
         Args:
             search_word: 表示名またはスキルタグで検索するキーワード
             location: 所在地で検索するキーワード
-            skill_tag: スキルタグで検索するキーワード
+            profile_ids: 絞り込み対象のプロフィールIDのQuerySet (タグ検索結果などのサブクエリ)
+            projection: 取得する列 (PROFILE_PROJECTION_*)。PROFILE_PROJECTION_LIST の場合は
+                LIST_PROJECTION_FIELDS のみを取得し、ユーザーを結合しない
+                (それ以外の列を参照すると1件ごとにクエリが発行されるため、一覧表示でのみ使用する)
 
         Returns:
-            検索条件に合致するプロフィールのQuerySet
+            検索条件に合致するプロフィールのQuerySet (関連度順、同順位は作成日時の降順)
         """
-        queryset = self._get_alive_queryset().filter(is_public=True).select_related("m_user")
-
-        # 検索条件を組み立て
-        if search_word:
-            queryset = queryset.filter(
-                Q(display_name__icontains=search_word)
-                | Q(skill_tags_raw__icontains=search_word)
-            )
+        # 検索はリードレプリカ (設定時) から読み込む
+        queryset = self._get_alive_read_queryset().filter(is_public=True)
+        if projection == PROFILE_PROJECTION_LIST:
+            queryset = queryset.only(*self.LIST_PROJECTION_FIELDS)
+        else:
+            queryset = queryset.select_related("m_user")
+
+        if profile_ids is not None:
+            queryset = queryset.filter(pk__in=profile_ids)
+
+        return get_profile_search_backend().search(
+            queryset,
+            search_word=search_word,
+            location=location,
+        )
+
+    def paginate_public_profiles(
+        self,
+        queryset: M_UserProfileQuerySet,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        count_mode: str = COUNT_MODE_NONE,
+    ) -> KeysetPage:
+        """
+        find_public_profiles の検索結果をキーセット方式でページ分割する
 
-        if location:
-            queryset = queryset.filter(location__icontains=location)
+        並び順は (作成日時, ユーザID) の降順。検索バックエンドがランキングを付与している場合は
+        ランキング値を先頭キーに加え、関連度順のままページを辿れるようにする。
 
-        if skill_tag:
-            queryset = queryset.filter(skill_tags_raw__icontains=skill_tag)
+        Args:
+            queryset: find_public_profiles の戻り値
+            cursor: 前回返却したカーソル (None の場合は先頭ページ)
+            page_size: 1ページの件数
+            count_mode: 件数の取得方法 (core.repositories.COUNT_MODE_*)
 
-        return queryset.order_by("-created_at")
+        Returns:
+            KeysetPage
+        """
+        ordering = ["-created_at", "-pk"]
+        rank_annotation = get_profile_search_backend().rank_annotation
+        if rank_annotation in queryset.query.annotations:
+            ordering.insert(0, rank_annotation)
+
+        return self.paginate_by_keyset(
+            queryset,
+            cursor=cursor,
+            page_size=page_size,
+            ordering=ordering,
+            count_mode=count_mode,
+        )
@@ -0,0 +1,109 @@
+from typing import List
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, QuerySet
+
+from account.models import M_SkillTag, M_UserProfile, M_UserProfileSkillTag
+from core.repositories import BaseRepository
+
+User = get_user_model()
+
+
+class M_UserProfileSkillTagRepository(BaseRepository):
+    """
+    ユーザプロフィール技術タグ(M_UserProfileSkillTag)モデル専用のリポジトリクラス。
+    """
+
+    model: M_UserProfileSkillTag = M_UserProfileSkillTag
+
+    # BaseRepositoryから継承される主なメソッド:
+    # - get_alive_by_pk(pk)
+    # - get_alive_one_or_none(**kwargs)
+    # - create(**kwargs)
+    # - update(instance, **kwargs)
+    # - soft_delete(instance)
+
+    # ------------------------------------------------------------------
+    # モデルに対する固有のデータ取得処理
+    # ------------------------------------------------------------------
+    def find_profile_ids_by_tag_ids(
+        self, tag_ids: List[int], match_all: bool = True
+    ) -> QuerySet:
+        """
+        タグIDに紐付くプロフィールIDを取得する（タグ→プロフィールの複合インデックスで検索）。
+
+        Args:
+            tag_ids: 検索対象のタグIDリスト
+            match_all: True の場合は全てのタグを持つプロフィール (AND)、
+                       False の場合はいずれかのタグを持つプロフィール (OR)
+
+        Returns:
+            プロフィールID (m_user_profile_id) のQuerySet (サブクエリとして使用可能)
+        """
+        queryset = self._get_alive_queryset().filter(m_skill_tag_id__in=tag_ids)
+
+        if match_all and len(tag_ids) > 1:
+            queryset = (
+                queryset.values("m_user_profile_id")
+                .annotate(matched_count=Count("m_skill_tag_id", distinct=True))
+                .filter(matched_count=len(set(tag_ids)))
+            )
+
+        return queryset.values("m_user_profile_id")
+
+    # ------------------------------------------------------------------
+    # データ操作
+    # ------------------------------------------------------------------
+    def replace_profile_tags(
+        self,
+        profile: M_UserProfile,
+        tags: List[M_SkillTag],
+        user: User,
+        process_name: str,
+    ) -> None:
+        """
+        プロフィールの紐付けタグを指定されたタグ（並び順を含む）に置き換える。
+        中間テーブルのため論理削除は行わず、不要になった紐付けは物理削除する。
+        """
+        desired = {tag.pk: sort_order for sort_order, tag in enumerate(tags)}
+        current = {
+            link.m_skill_tag_id: link
+            for link in self._get_all_queryset().filter(m_user_profile=profile)
+        }
+
+        # 1. 不要になった紐付けを削除
+        removed_ids = [tag_id for tag_id in current if tag_id not in desired]
+        if removed_ids:
+            self._get_all_queryset().filter(
+                m_user_profile=profile, m_skill_tag_id__in=removed_ids
+            ).delete()
+
+        # 2. 並び順が変わった紐付けを更新
+        changed_links = []
+        for tag_id, link in current.items():
+            if tag_id in desired and link.sort_order != desired[tag_id]:
+                link.sort_order = desired[tag_id]
+                link.updated_by = user
+                link.updated_method = process_name
+                changed_links.append(link)
+        if changed_links:
+            self.model.objects.bulk_update(
+                changed_links, ["sort_order", "updated_by", "updated_method"]
+            )
+
+        # 3. 新しい紐付けを作成
+        new_links = [
+            self.model(
+                m_user_profile=profile,
+                m_skill_tag_id=tag_id,
+                sort_order=sort_order,
+                created_by=user,
+                updated_by=user,
+                created_method=process_name,
+                updated_method=process_name,
+            )
+            for tag_id, sort_order in desired.items()
+            if tag_id not in current
+        ]
+        if new_links:
+            self.model.objects.bulk_create(new_links)
@@ -3,6 +3,7 @@ from typing import overload
 from django.contrib.auth import get_user_model
 from django.db.models import QuerySet
 
+from core.auth_scheme.user_auth_backend import invalidate_user_caches
 from core.repositories import BaseRepository
 
 User = get_user_model()
@@ -50,6 +51,17 @@ class M_UserRepository(BaseRepository):
     # * hard_delete(instance)      # レコードの物理削除
     # * restore(instance)          # レコードの復元 (deleted_atをNULLに)
 
+    # 【全件走査（主キー順に一定件数ずつ取得）】
+    # * iter_chunks(queryset, chunk_size, only)   # chunk_size 件ずつのリストで取得
+    # * iter_alive_records(chunk_size, only)      # 「生存している」レコードを1件ずつ取得
+    # * iter_all_records(chunk_size, only)        # 論理削除の状態を問わず1件ずつ取得
+
+    # 【一括データ操作】
+    # * bulk_create(instances, user, process_name)          # レコードの一括作成
+    # * bulk_update(instances, fields, user, process_name)  # レコードの一括更新
+    # * bulk_soft_delete(targets, user, process_name)       # レコードの一括論理削除
+    # * bulk_restore(targets, user, process_name)           # レコードの一括復元
+
     # ------------------------------------------------------------------
     # 共通で追加されるメソッドの型付けだけ行う
     # ------------------------------------------------------------------
@@ -95,6 +107,10 @@ class M_UserRepository(BaseRepository):
             status_code=User.AccountStatus.ACTIVE,
         )
 
+    def _after_bulk_write(self, pks, instances=None, fields=None) -> None:
+        """一括操作ではシグナルが発行されないため、認証済みユーザーのキャッシュをここで破棄する"""
+        invalidate_user_caches(pks)
+
     # ------------------------------------------------------------------
     # 特殊処理/カスタムマネージャへの依存の隠蔽等
     # ------------------------------------------------------------------
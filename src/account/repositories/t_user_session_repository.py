@@ -0,0 +1,43 @@
+import datetime
+
+from django.db.models import QuerySet
+
+from account.models import T_UserSession
+from core.repositories import BaseRepository
+
+T_UserSessionQuerySet = QuerySet[T_UserSession]
+
+
+class T_UserSessionRepository(BaseRepository):
+    """
+    ユーザセッショントラン(T_UserSession)モデル専用のリポジトリクラス。
+
+    セッションは論理削除の列 (deleted_at) を持たず、無効にする場合は物理削除する。
+    (セッションデータの読み書きは account.session_backends.db.SessionStore が行う)
+    """
+
+    model: T_UserSession = T_UserSession
+
+    # ------------------------------------------------------------------
+    # 内部QuerySet (論理削除の列を持たないため、全てのレコードを対象とする)
+    # ------------------------------------------------------------------
+    def _get_alive_queryset(self) -> T_UserSessionQuerySet:
+        return self.model.objects.all()
+
+    # ------------------------------------------------------------------
+    # モデルに対する固有のデータ取得・削除処理
+    # ------------------------------------------------------------------
+    def delete_by_user(self, user) -> int:
+        """
+        ユーザーの全てのセッションを削除し、削除した件数を返す
+        (強制ログアウトで使用。t_user_session.m_user_id のインデックスで絞り込む)。
+        """
+        deleted, _ = self.model.objects.filter(m_user=user).delete()
+        return deleted
+
+    def get_expired_records(self, expired_before: datetime.datetime) -> T_UserSessionQuerySet:
+        """
+        有効期限が expired_before より前のセッションを取得する
+        (期限切れセッションの削除処理で使用。expire_date のインデックスで絞り込む)。
+        """
+        return self.model.objects.filter(expire_date__lt=expired_before)
@@ -1,3 +1,4 @@
+import datetime
 from typing import overload
 
 from django.db.models import QuerySet
@@ -49,6 +50,17 @@ class T_UserTokenRepository(BaseRepository):
     # * hard_delete(instance)      # レコードの物理削除
     # * restore(instance)          # レコードの復元 (deleted_atをNULLに)
 
+    # 【全件走査（主キー順に一定件数ずつ取得）】
+    # * iter_chunks(queryset, chunk_size, only)   # chunk_size 件ずつのリストで取得
+    # * iter_alive_records(chunk_size, only)      # 「生存している」レコードを1件ずつ取得
+    # * iter_all_records(chunk_size, only)        # 論理削除の状態を問わず1件ずつ取得
+
+    # 【一括データ操作】
+    # * bulk_create(instances, user, process_name)          # レコードの一括作成
+    # * bulk_update(instances, fields, user, process_name)  # レコードの一括更新
+    # * bulk_soft_delete(targets, user, process_name)       # レコードの一括論理削除
+    # * bulk_restore(targets, user, process_name)           # レコードの一括復元
+
     # ------------------------------------------------------------------
     # 共通で追加されるメソッドの型付けだけ行う
     # ------------------------------------------------------------------
@@ -79,3 +91,9 @@ class T_UserTokenRepository(BaseRepository):
     # ------------------------------------------------------------------
     # モデルに対する固有のデータ取得処理
     # ------------------------------------------------------------------
+    def get_expired_records(self, expired_before: datetime.datetime) -> T_UserTokenQuerySet:
+        """
+        有効期限が expired_before より前のトークンを、論理削除 (使用済み・無効化) の状態を問わず取得する
+        (期限切れトークンの削除処理で使用。expired_at のインデックスで絞り込む)。
+        """
+        return self._get_all_queryset().filter(expired_at__lt=expired_before)
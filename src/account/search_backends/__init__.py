@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+
+from .base import BaseProfileSearchBackend
+from .default_backend import DefaultProfileSearchBackend
+
+# 検索インデックスに登録しているプロフィールの項目 (保存・一括更新時に索引を更新するかの判定に使用する)
+PROFILE_SEARCH_FIELDS = {"display_name", "skill_tags_raw", "location"}
+
+# DBエンジン(vendor)ごとの既定バックエンド
+BACKENDS_BY_VENDOR = {
+    "sqlite": "account.search_backends.sqlite_fts5_backend.SQLiteFTS5ProfileSearchBackend",
+    "postgresql": "account.search_backends.postgresql_trgm_backend.PostgreSQLTrigramProfileSearchBackend",
+}
+
+# プロセス内で使い回すバックエンドインスタンス
+_backend_instance: BaseProfileSearchBackend | None = None
+
+
+def get_profile_search_backend() -> BaseProfileSearchBackend:
+    """
+    プロフィール検索バックエンドを取得する。
+
+    settings.PROFILE_SEARCH_BACKEND が設定されていればそのクラスを、
+    未設定の場合はDBエンジンに応じた既定のバックエンドを使用する。
+    """
+    global _backend_instance
+
+    if _backend_instance is None:
+        backend_path = getattr(settings, "PROFILE_SEARCH_BACKEND", None)
+        if not backend_path:
+            backend_path = BACKENDS_BY_VENDOR.get(connection.vendor)
+
+        if backend_path:
+            _backend_instance = import_string(backend_path)()
+        else:
+            _backend_instance = DefaultProfileSearchBackend()
+
+    return _backend_instance
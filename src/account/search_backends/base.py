@@ -0,0 +1,74 @@
+from typing import Optional
+
+from django.db.models import Q, QuerySet
+
+
+class BaseProfileSearchBackend:
+    """
+    公開プロフィール検索のバックエンド基底クラス。
+
+    M_UserProfileRepository.find_public_profiles から呼び出され、
+    検索条件の適用・ランキング・検索インデックスの同期を担う。
+    DBエンジンごとの全文検索/インデックスの差異はサブクラスで吸収する。
+    """
+
+    # ランキング値を格納するアノテーション名 (値が小さいほど上位)
+    rank_annotation: str = "search_rank"
+
+    def search(
+        self,
+        queryset: QuerySet,
+        search_word: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> QuerySet:
+        """
+        検索条件をQuerySetに適用し、ランキング順に並べ替えたQuerySetを返す。
+
+        Args:
+            queryset: 検索対象のベースQuerySet (公開・未削除で絞り込み済み)
+            search_word: 表示名またはスキルタグで検索するキーワード
+            location: 所在地で検索するキーワード
+
+        Returns:
+            検索条件に合致するプロフィールのQuerySet
+        """
+        raise NotImplementedError
+
+    def index_profile(self, profile, using: str = "default") -> None:
+        """プロフィールの保存内容を検索インデックスに反映する"""
+        # インデックスをDB側で自動管理するバックエンドでは何もしない
+        return None
+
+    def remove_profile(self, profile_pk: int, using: str = "default") -> None:
+        """検索インデックスからプロフィールを除去する"""
+        return None
+
+    def rebuild_index(self, using: str = "default") -> int:
+        """
+        検索インデックスを全件再構築する。
+
+        Returns:
+            インデックスに登録した件数
+        """
+        return 0
+
+    # ------------------------------------------------------------------
+    # 共通ヘルパー
+    # ------------------------------------------------------------------
+    def _apply_icontains_filters(
+        self,
+        queryset: QuerySet,
+        search_word: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> QuerySet:
+        """インデックスを使用しない部分一致 (icontains) で検索条件を適用する"""
+        if search_word:
+            queryset = queryset.filter(
+                Q(display_name__icontains=search_word)
+                | Q(skill_tags_raw__icontains=search_word)
+            )
+
+        if location:
+            queryset = queryset.filter(location__icontains=location)
+
+        return queryset
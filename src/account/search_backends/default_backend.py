@@ -0,0 +1,25 @@
+from typing import Optional
+
+from django.db.models import QuerySet
+
+from account.search_backends.base import BaseProfileSearchBackend
+
+
+class DefaultProfileSearchBackend(BaseProfileSearchBackend):
+    """
+    全文検索インデックスを持たないDBエンジン向けのフォールバックバックエンド。
+    従来通り icontains による部分一致検索を行い、作成日時の降順で返す。
+    """
+
+    def search(
+        self,
+        queryset: QuerySet,
+        search_word: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> QuerySet:
+        queryset = self._apply_icontains_filters(
+            queryset,
+            search_word=search_word,
+            location=location,
+        )
+        return queryset.order_by("-created_at")
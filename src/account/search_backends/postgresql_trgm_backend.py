@@ -0,0 +1,45 @@
+from typing import Optional
+
+from django.db.models import F, QuerySet
+
+from account.search_backends.base import BaseProfileSearchBackend
+
+
+class PostgreSQLTrigramProfileSearchBackend(BaseProfileSearchBackend):
+    """
+    PostgreSQLのpg_trgm (GINトライグラムインデックス) を使用した検索バックエンド。
+
+    icontains (ILIKE '%...%') はマイグレーションで作成したGINインデックスで解決されるため、
+    検索条件はそのまま適用し、キーワードとの類似度でランキングのみを付与する。
+    インデックスはDB側で自動更新されるため、保存時の同期処理は不要。
+    """
+
+    def search(
+        self,
+        queryset: QuerySet,
+        search_word: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> QuerySet:
+        queryset = self._apply_icontains_filters(
+            queryset,
+            search_word=search_word,
+            location=location,
+        )
+
+        if not search_word:
+            return queryset.order_by("-created_at")
+
+        # psycopgへの依存をPostgreSQL利用時のみに限定するため遅延インポート
+        from django.contrib.postgres.search import TrigramWordSimilarity
+        from django.db.models.functions import Greatest
+
+        queryset = queryset.annotate(
+            **{
+                # 類似度は値が大きいほど関連度が高いため、符号を反転して基底クラスの規約に合わせる
+                self.rank_annotation: -Greatest(
+                    TrigramWordSimilarity(search_word, F("display_name")),
+                    TrigramWordSimilarity(search_word, F("skill_tags_raw")),
+                )
+            }
+        )
+        return queryset.order_by(self.rank_annotation, "-created_at")
@@ -0,0 +1,140 @@
+from typing import List, Optional, Tuple
+
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.models.expressions import RawSQL
+
+from account.search_backends.base import BaseProfileSearchBackend
+
+# FTS5仮想テーブル名 (rowid = m_user_profile.m_user_id)
+FTS_TABLE_NAME = "m_user_profile_fts"
+
+# trigramトークナイザは3文字未満の語句ではインデックス検索できない
+TRIGRAM_MIN_LENGTH = 3
+
+
+class SQLiteFTS5ProfileSearchBackend(BaseProfileSearchBackend):
+    """
+    SQLiteのFTS5 (trigramトークナイザ) を使用した検索バックエンド。
+
+    trigramトークナイザは日本語を含む任意の部分文字列検索をインデックスで解決できるため、
+    従来の icontains と同じ検索結果をテーブルの全件走査なしで返せる。
+    3文字未満の検索語のみ、インデックスを使わない部分一致にフォールバックする。
+    """
+
+    def search(
+        self,
+        queryset: QuerySet,
+        search_word: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> QuerySet:
+        # 1. インデックス検索できる語句とフォールバックする語句に振り分け
+        match_clauses: List[str] = []
+        fallback_conditions = {}
+
+        for columns, term, condition_name in (
+            ("{display_name skill_tags_raw}", search_word, "search_word"),
+            ("location", location, "location"),
+        ):
+            if not term:
+                continue
+            if len(term) >= TRIGRAM_MIN_LENGTH:
+                match_clauses.append(f"{columns} : {self._quote(term)}")
+            else:
+                fallback_conditions[condition_name] = term
+
+        # 2. 短い語句は部分一致で絞り込む (FTSで候補が絞られた後に評価される)
+        queryset = self._apply_icontains_filters(queryset, **fallback_conditions)
+
+        if not match_clauses:
+            return queryset.order_by("-created_at")
+
+        # 3. FTSインデックスで候補を絞り込み、bm25でランキングする
+        match_expression = " AND ".join(match_clauses)
+        table = queryset.model._meta.db_table
+        pk_column = queryset.model._meta.pk.column
+
+        queryset = queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {FTS_TABLE_NAME} WHERE {FTS_TABLE_NAME} MATCH %s",
+                [match_expression],
+            )
+        ).annotate(
+            **{
+                self.rank_annotation: RawSQL(
+                    f"SELECT bm25({FTS_TABLE_NAME}) FROM {FTS_TABLE_NAME} "
+                    f'WHERE {FTS_TABLE_NAME}.rowid = "{table}"."{pk_column}" '
+                    f"AND {FTS_TABLE_NAME} MATCH %s",
+                    [match_expression],
+                )
+            }
+        )
+        # bm25は値が小さいほど関連度が高い
+        return queryset.order_by(self.rank_annotation, "-created_at")
+
+    def index_profile(self, profile, using: str = "default") -> None:
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE_NAME} WHERE rowid = %s", [profile.pk]
+            )
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE_NAME} "
+                "(rowid, display_name, skill_tags_raw, location) "
+                "VALUES (%s, %s, %s, %s)",
+                self._to_row(profile),
+            )
+
+    def remove_profile(self, profile_pk: int, using: str = "default") -> None:
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE_NAME} WHERE rowid = %s", [profile_pk]
+            )
+
+    def rebuild_index(self, using: str = "default") -> int:
+        from account.models import M_UserProfile
+
+        profiles = (
+            M_UserProfile.objects.using(using)
+            .only("m_user", "display_name", "skill_tags_raw", "location")
+            .iterator(chunk_size=2000)
+        )
+
+        count = 0
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE_NAME}")
+            rows = []
+            for profile in profiles:
+                rows.append(self._to_row(profile))
+                if len(rows) >= 2000:
+                    count += self._insert_rows(cursor, rows)
+                    rows = []
+            if rows:
+                count += self._insert_rows(cursor, rows)
+        return count
+
+    # ------------------------------------------------------------------
+    # Helper Methods
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _quote(term: str) -> str:
+        """FTS5のフレーズ文字列としてエスケープする (ダブルクォートは二重化)"""
+        return '"' + term.replace('"', '""') + '"'
+
+    @staticmethod
+    def _to_row(profile) -> Tuple:
+        return (
+            profile.pk,
+            profile.display_name or "",
+            profile.skill_tags_raw or "",
+            profile.location or "",
+        )
+
+    @staticmethod
+    def _insert_rows(cursor, rows: List[Tuple]) -> int:
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE_NAME} "
+            "(rowid, display_name, skill_tags_raw, location) "
+            "VALUES (%s, %s, %s, %s)",
+            rows,
+        )
+        return len(rows)
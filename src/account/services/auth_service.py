@@ -4,7 +4,6 @@ import os
 # 必要なDjango標準のインポート
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.contrib.sessions.models import Session
 from django.db import IntegrityError as DjangoIntegrityError
 from django.db import transaction
 from django.utils import timezone
@@ -19,6 +18,7 @@ from account.exceptions import (
 from account.models.t_user_token import TokenTypes
 from account.repositories.m_user_profile_repository import M_UserProfileRepository
 from account.repositories.m_user_repository import M_UserRepository
+from account.repositories.t_user_session_repository import T_UserSessionRepository
 from account.repositories.t_user_token_repository import T_UserTokenRepository
 from core.auth_scheme.user_auth_backend import UserAuthBackend
 from core.consts import LOG_METHOD
@@ -41,6 +41,7 @@ class AuthService:
         self.user_repo = M_UserRepository()
         self.profile_repo = M_UserProfileRepository()
         self.token_repo = T_UserTokenRepository()
+        self.session_repo = T_UserSessionRepository()
         self.notification_service = NotificationService()
 
     # ------------------------------------------------------------------
@@ -49,23 +50,21 @@ class AuthService:
     def _force_logout_all_sessions(self, user: User):
         """
         指定されたユーザーに関連付けられている全ての既存のセッションを強制的に無効化する。
+        (t_user_session.m_user_id のインデックスを使用した一括削除)
         """
-        sessions = Session.objects.filter(expire_date__gte=timezone.now())
-
-        for session in sessions:
-            session_data = session.get_decoded()
-            if str(session_data.get("_auth_user_id")) == str(user.pk):
-                session.delete()
+        self.session_repo.delete_by_user(user)
 
     # ------------------------------------------------------------------
     # ログイン処理
     # ------------------------------------------------------------------
-    def login(self, email: str, password: str, process_name: str) -> User:
+    def login(self, email: str, password: str, process_name: str, request=None) -> User:
         """
         メールアドレスとパスワードで認証済みユーザーインスタンスを返す。
+        request はログイン試行の制限 (IPアドレスごとの失敗回数) とログイン履歴に使用する。
+        失敗回数が上限に達している場合は LoginThrottledException (AccountLockedException) を送出する。
         """
         user = self.user_auth_backend.authenticate(
-            None, username=email, password=password
+            request, username=email, password=password
         )
 
         if user is None:
@@ -74,12 +73,8 @@ class AuthService:
         if not user.is_active:
             raise AccountLockedException()
 
-        self.user_repo.update(
-            user, 
-            last_login=timezone.now(), 
-            updated_by=user, 
-            updated_method=process_name
-        )
+        # 最終ログイン日時は django.contrib.auth.login() の user_logged_in シグナルで記録し、
+        # 一定間隔でまとめて更新する (account.signals.record_last_login)
 
         return user
 
@@ -9,14 +9,23 @@ from django.db.models import QuerySet
 
 from account.models.m_user_profile import M_UserProfile
 from account.models.m_user_settings import M_UserSettings
-from account.repositories.m_user_profile_repository import M_UserProfileRepository
+from account.repositories.m_skill_tag_repository import M_SkillTagRepository
+from account.repositories.m_user_profile_repository import (
+    PROFILE_PROJECTION_FULL,
+    M_UserProfileRepository,
+)
+from account.repositories.m_user_profile_skill_tag_repository import (
+    M_UserProfileSkillTagRepository,
+)
 from account.repositories.m_user_repository import M_UserRepository
 from account.repositories.m_user_settings_repository import M_UserSettingsRepository
 from account.repositories.t_user_token_repository import T_UserTokenRepository
 from account.exceptions import ProfileNotFoundException, ProfileAccessDeniedException
 from core.consts import LOG_METHOD
 from core.exceptions import ExternalServiceError, IntegrityError
+from core.repositories import COUNT_MODE_NONE, KeysetPage
 from core.services.storage_service import StorageService
+from core.utils.common import normalize_tag, split_tags
 
 # import cloudinary.uploader # ⚠️ 本番環境でのみ有効化/呼び出しを検討
 
@@ -35,6 +44,8 @@ class UserService:
         self.profile_repo = M_UserProfileRepository()
         self.settings_repo = M_UserSettingsRepository()
         self.token_repo = T_UserTokenRepository()
+        self.skill_tag_repo = M_SkillTagRepository()
+        self.profile_skill_tag_repo = M_UserProfileSkillTagRepository()
         self.storage_service = StorageService()
 
     # ------------------------------------------------------------------
@@ -64,6 +75,22 @@ class UserService:
             # FileFieldがローカルに保存できるよう、ファイルオブジェクトをそのまま返す
             return uploaded_file
 
+    def _sync_skill_tags(
+        self, profile: M_UserProfile, user: User, process_name: str
+    ) -> None:
+        """
+        プロフィールの skill_tags_raw を技術タグマスタと紐付けテーブルに反映する。
+        """
+        tag_names = split_tags(profile.skill_tags_raw)
+        tags_by_key = self.skill_tag_repo.get_or_create_by_names(
+            tag_names, user=user, process_name=process_name
+        )
+        # skill_tags_raw 内の並び順を維持する
+        tags = [tags_by_key[normalize_tag(name)] for name in tag_names]
+        self.profile_skill_tag_repo.replace_profile_tags(
+            profile, tags, user=user, process_name=process_name
+        )
+
     # ------------------------------------------------------------------
     # ユーザ初回ログイン時初期設定
     # ------------------------------------------------------------------
@@ -82,75 +109,78 @@ class UserService:
         ユーザーの初回設定を更新し、is_first_loginフラグをFalseに設定する。
         """
         try:
-            # 1. UserProfileの存在チェックと取得 (シグナルで作成されている前提だが安全策)
-            profile = self.profile_repo.get_alive_one_or_none(m_user=user.pk)
-            if not profile:
-                # ユーザーに関連付けられたプロフィールがない場合、作成
-                profile = self.profile_repo.create(
-                    m_user=user,
-                    created_by=user,
-                    updated_by=user,
-                    created_method=process_name,
-                    updated_method=process_name,
-                )
-
-            # 2. アイコンファイルの処理: DBに格納すべき値を取得
-            icon_value = self._handle_icon_upload(user, icon_file)
-
-            # 3. UserProfileの更新データ辞書を作成
-            update_data = {
-                "display_name": display_name,
-                "is_public": is_public,
-                "updated_by": user,
-                "updated_method": process_name,
-            }
-
-            # アイコンが設定された場合、または削除フラグがある場合
-            if icon_value is not None:
-                update_data["icon"] = icon_value
-            elif icon_clear:
-                update_data["icon"] = None
+            # プロフィール・設定・ユーザーの変更はユニットオブワークでまとめ、
+            # ブロックを抜けた時点で変更のあった行のみを1行1回のUPDATEで書き込む
+            with self.user_repo.unit_of_work():
+                # 1. UserProfileの存在チェックと取得 (シグナルで作成されている前提だが安全策)
+                profile = self.profile_repo.get_alive_one_or_none(m_user=user.pk)
+                if not profile:
+                    # ユーザーに関連付けられたプロフィールがない場合、作成
+                    profile = self.profile_repo.create(
+                        m_user=user,
+                        created_by=user,
+                        updated_by=user,
+                        created_method=process_name,
+                        updated_method=process_name,
+                    )
+
+                # 2. アイコンファイルの処理: DBに格納すべき値を取得
+                icon_value = self._handle_icon_upload(user, icon_file)
+
+                # 3. UserProfileの更新データ辞書を作成
+                update_data = {
+                    "display_name": display_name,
+                    "is_public": is_public,
+                    "updated_by": user,
+                    "updated_method": process_name,
+                }
 
-            # 4. UserProfileの更新実行
-            self.profile_repo.update(profile, **update_data)
+                # アイコンが設定された場合、または削除フラグがある場合
+                if icon_value is not None:
+                    update_data["icon"] = icon_value
+                elif icon_clear:
+                    update_data["icon"] = None
 
-            # 5. UserSettingsの作成または更新
-            setting = self.settings_repo.get_alive_by_pk(user.pk)
-            if setting is None:
-                # 設定が存在しない場合は作成
-                self.settings_repo.create(
-                    m_user=user,
-                    is_email_notify_enabled=is_email_notify_enabled,
-                    is_notify_like=is_email_notify_enabled,
-                    is_notify_comment=is_email_notify_enabled,
-                    is_notify_follow=is_email_notify_enabled,
-                    created_by=user,
-                    updated_by=user,
-                    created_method=process_name,
-                    updated_method=process_name,
-                )
-            else:
-                # 既に存在する場合は更新
-                self.settings_repo.update(
-                    setting,
-                    is_email_notify_enabled=is_email_notify_enabled,
-                    is_notify_like=is_email_notify_enabled,
-                    is_notify_comment=is_email_notify_enabled,
-                    is_notify_follow=is_email_notify_enabled,
-                    updated_by=user,
-                    updated_method=process_name,
-                )
+                # 4. UserProfileの更新実行
+                self.profile_repo.update(profile, **update_data)
 
-            # 6. is_first_loginフラグの更新
-            if user.is_first_login:
-                updated_user = self.user_repo.update(
-                    user,
-                    is_first_login=False,
-                    updated_by=user,
-                    updated_method=process_name,
-                )
-            else:
-                updated_user = user
+                # 5. UserSettingsの作成または更新
+                setting = self.settings_repo.get_alive_by_pk(user.pk)
+                if setting is None:
+                    # 設定が存在しない場合は作成
+                    self.settings_repo.create(
+                        m_user=user,
+                        is_email_notify_enabled=is_email_notify_enabled,
+                        is_notify_like=is_email_notify_enabled,
+                        is_notify_comment=is_email_notify_enabled,
+                        is_notify_follow=is_email_notify_enabled,
+                        created_by=user,
+                        updated_by=user,
+                        created_method=process_name,
+                        updated_method=process_name,
+                    )
+                else:
+                    # 既に存在する場合は更新
+                    self.settings_repo.update(
+                        setting,
+                        is_email_notify_enabled=is_email_notify_enabled,
+                        is_notify_like=is_email_notify_enabled,
+                        is_notify_comment=is_email_notify_enabled,
+                        is_notify_follow=is_email_notify_enabled,
+                        updated_by=user,
+                        updated_method=process_name,
+                    )
+
+                # 6. is_first_loginフラグの更新
+                if user.is_first_login:
+                    updated_user = self.user_repo.update(
+                        user,
+                        is_first_login=False,
+                        updated_by=user,
+                        updated_method=process_name,
+                    )
+                else:
+                    updated_user = user
 
             return updated_user
 
@@ -244,6 +274,10 @@ class UserService:
             if update_data:
                 self.profile_repo.update(profile, **update_data)
 
+            # 5. 技術タグの紐付けを同期（skill_tags_rawが更新対象の場合のみ）
+            if skill_tags_raw is not None:
+                self._sync_skill_tags(profile, user=user, process_name=process_name)
+
             return user
 
         except ExternalServiceError:
@@ -289,6 +323,8 @@ class UserService:
         search_word: Optional[str] = None,
         location: Optional[str] = None,
         skill_tag: Optional[str] = None,
+        skill_tag_match_all: bool = True,
+        projection: str = PROFILE_PROJECTION_FULL,
     ) -> QuerySet[M_UserProfile]:
         """
         公開プロフィールを検索する
@@ -296,15 +332,58 @@ class UserService:
         Args:
             search_word: 表示名またはスキルタグで検索するキーワード
             location: 所在地で検索するキーワード
-            skill_tag: スキルタグで検索するキーワード
+            skill_tag: スキルタグ（カンマ区切りで複数指定可、タグ名の完全一致で検索）
+            skill_tag_match_all: True の場合は全てのタグを持つ (AND)、False の場合はいずれかのタグを持つ (OR)
+            projection: 取得する列 (PROFILE_PROJECTION_*。一覧表示では PROFILE_PROJECTION_LIST)
 
         Returns:
             検索条件に合致するプロフィールのQuerySet
         """
+        profile_ids = None
+
+        tag_names = split_tags(skill_tag)
+        if tag_names:
+            # タグマスタの正規化タグ名インデックスでタグIDを解決
+            tag_ids = self.skill_tag_repo.get_ids_by_names(tag_names)
+            if not tag_ids or (skill_tag_match_all and len(tag_ids) < len(tag_names)):
+                # 未登録のタグを含むAND検索、または該当タグなしの場合は結果なし
+                return self.profile_repo.get_alive_records().none()
+
+            profile_ids = self.profile_skill_tag_repo.find_profile_ids_by_tag_ids(
+                tag_ids, match_all=skill_tag_match_all
+            )
+
         return self.profile_repo.find_public_profiles(
             search_word=search_word,
             location=location,
-            skill_tag=skill_tag,
+            profile_ids=profile_ids,
+            projection=projection,
+        )
+
+    def paginate_public_profiles(
+        self,
+        queryset: QuerySet[M_UserProfile],
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        count_mode: str = COUNT_MODE_NONE,
+    ) -> KeysetPage:
+        """
+        公開プロフィールの検索結果をキーセット方式でページ分割する
+
+        Args:
+            queryset: search_public_profiles の戻り値
+            cursor: 前回返却したカーソル (None の場合は先頭ページ)
+            page_size: 1ページの件数
+            count_mode: 件数の取得方法 (core.repositories.COUNT_MODE_*)
+
+        Returns:
+            KeysetPage
+        """
+        return self.profile_repo.paginate_public_profiles(
+            queryset,
+            cursor=cursor,
+            page_size=page_size,
+            count_mode=count_mode,
         )
 
     def get_public_profile(
@@ -333,7 +412,7 @@ class UserService:
             )
 
         # 公開プロフィール、または自分自身のプロフィールの場合のみ閲覧可能
-        if not profile.is_public and profile.m_user != requesting_user:
+        if not profile.is_public and profile.m_user_id != requesting_user.pk:
             raise ProfileAccessDeniedException(
                 details={"profile_id": profile_id, "user_id": str(requesting_user.pk)}
             )
@@ -350,10 +429,8 @@ class UserService:
         Returns:
             スキルタグのリスト
         """
-        if not profile.skill_tags_raw:
-            return []
-
-        return [tag.strip() for tag in profile.skill_tags_raw.split(",") if tag.strip()]
+        # 技術タグの同期処理と同じ規則（空要素除外・正規化後の重複除外）で分割する
+        return split_tags(profile.skill_tags_raw)
 
     # ------------------------------------------------------------------
     # ユーザー設定
@@ -0,0 +1,31 @@
+from django.contrib.auth import SESSION_KEY
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+
+from account.models.t_user_session import T_UserSession
+
+
+class SessionStore(DBStore):
+    """
+    T_UserSession にセッションを保存するセッションエンジン。
+
+    settings.SESSION_ENGINE = "account.session_backends.db" で有効化する。
+    セッション保存のたびにセッションデータ内のログインユーザーIDを m_user 列へ反映するため、
+    ログイン/ログアウトに加えて cycle_key() によるキーの再発行時も自動的に追従する。
+    """
+
+    @classmethod
+    def get_model_class(cls):
+        return T_UserSession
+
+    def create_model_instance(self, data):
+        obj = super().create_model_instance(data)
+        obj.m_user_id = self.get_user_id(data)
+        return obj
+
+    @staticmethod
+    def get_user_id(data) -> int | None:
+        """セッションデータからログインユーザーIDを取得する (未ログインの場合はNone)"""
+        try:
+            return int(data.get(SESSION_KEY))
+        except (ValueError, TypeError):
+            return None
@@ -1,9 +1,15 @@
 from datetime import datetime, timedelta
 
-from django.db.models.signals import post_save, pre_save
+from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from account.models import M_User, M_UserProfile
+from account.search_backends import PROFILE_SEARCH_FIELDS, get_profile_search_backend
+from core.auth_scheme.last_login_buffer import get_last_login_buffer
+from core.auth_scheme.user_auth_backend import invalidate_user_cache
+from core.utils.identity_map import get_current_identity_map
 
 
 @receiver(post_save, sender=M_User)
@@ -25,3 +31,76 @@ def create_user_profile(sender, instance, created, **kwargs):
             created_method="Signal:create_user_profile",
             updated_method="Signal:create_user_profile",
         )
+
+
+@receiver(post_save, sender=M_UserProfile)
+def sync_profile_search_index(sender, instance, created, update_fields, using, **kwargs):
+    """
+    M_UserProfileが保存された後（post_save）、検索インデックスに内容を反映する。
+    update_fieldsが指定され、検索対象の項目が含まれない場合は何もしない。
+    """
+    if update_fields is not None and not PROFILE_SEARCH_FIELDS & set(update_fields):
+        return
+
+    get_profile_search_backend().index_profile(instance, using=using)
+
+
+@receiver(post_delete, sender=M_UserProfile)
+def remove_profile_search_index(sender, instance, using, **kwargs):
+    """
+    M_UserProfileが物理削除された後（post_delete）、検索インデックスから除去する。
+    """
+    get_profile_search_backend().remove_profile(instance.pk, using=using)
+
+
+@receiver([post_save, post_delete], sender=M_User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    M_Userが保存・削除された後、認証バックエンドがキャッシュしたユーザーを破棄する。
+    """
+    invalidate_user_cache(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=M_UserProfile)
+def invalidate_cached_user_profile(sender, instance, **kwargs):
+    """
+    M_UserProfileが保存・削除された後、ユーザーと共にキャッシュしたプロフィールを破棄する。
+    """
+    invalidate_user_cache(instance.m_user_id)
+
+
+@receiver(post_save, sender=M_UserProfile)
+def refresh_identity_map_profile(sender, instance, **kwargs):
+    """
+    M_UserProfileが保存された後、リクエスト内のアイデンティティマップに保存後の状態を反映する。
+    (論理削除された場合は「存在しない」として登録する)
+    """
+    identity_map = get_current_identity_map()
+    if identity_map is not None:
+        identity_map.add(
+            M_UserProfile, instance.pk, instance if instance.deleted_at is None else None
+        )
+
+
+@receiver(post_delete, sender=M_UserProfile)
+def remove_identity_map_profile(sender, instance, **kwargs):
+    """
+    M_UserProfileが物理削除された後、リクエスト内のアイデンティティマップに「存在しない」として登録する。
+    """
+    identity_map = get_current_identity_map()
+    if identity_map is not None:
+        identity_map.add(M_UserProfile, instance.pk, None)
+
+
+# django.contrib.auth が接続する update_last_login は、ログインのたびに M_User を save() して
+# 変更履歴を登録するため、接続を解除して record_last_login でまとめて更新する
+user_logged_in.disconnect(dispatch_uid="update_last_login")
+
+
+@receiver(user_logged_in, dispatch_uid="record_last_login")
+def record_last_login(sender, user, **kwargs):
+    """
+    ログインした後、最終ログイン日時をバッファに追加する (DBへの反映は LastLoginBuffer が一定間隔で行う)。
+    """
+    user.last_login = timezone.now()
+    get_last_login_buffer().record(user.pk, user.last_login)
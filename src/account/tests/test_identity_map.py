@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from account.models import M_User, M_UserProfile
+from account.repositories.m_user_profile_repository import M_UserProfileRepository
+from core.auth_scheme.user_auth_backend import UserAuthBackend
+from core.utils.identity_map import (
+    IdentityMap,
+    activate_identity_map,
+    deactivate_identity_map,
+)
+
+
+class M_UserProfileRepositoryIdentityMapTest(TestCase):
+    """
+    M_UserProfileRepository がリクエスト内のアイデンティティマップを共有することを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="identity-map@example.com", password="Identity-Pass-123", is_active=True
+        )
+
+    def setUp(self):
+        self.repo = M_UserProfileRepository()
+        self.identity_map = IdentityMap()
+        token = activate_identity_map(self.identity_map)
+        self.addCleanup(deactivate_identity_map, token)
+
+    def test_profile_is_fetched_once(self):
+        with self.assertNumQueries(1):
+            profile = self.repo.get_alive_one_or_none(m_user=self.user.pk)
+            self.assertIs(self.repo.get_alive_by_pk(self.user.pk), profile)
+            self.assertIs(self.repo.get_alive_one_or_none(m_user=self.user), profile)
+
+    def test_profile_loaded_with_user_is_reused(self):
+        user = UserAuthBackend().get_user(self.user.pk)
+
+        with self.assertNumQueries(0):
+            self.assertIs(
+                self.repo.get_alive_one_or_none(m_user=user.pk), user.user_profile
+            )
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+    def test_profile_of_cached_user_is_fetched_from_db(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        backend = UserAuthBackend()
+        backend.get_user(self.user.pk)
+        # シグナルを発行しない更新で、キャッシュしたプロフィールが古くなった
+        M_UserProfile.objects.filter(pk=self.user.pk).update(display_name="updated-name")
+
+        # 次のリクエストではキャッシュから復元したユーザーを登録しない
+        self.identity_map.clear()
+        with self.assertNumQueries(0):
+            user = backend.get_user(self.user.pk)
+        self.assertNotEqual(user.user_profile.display_name, "updated-name")
+
+        with self.assertNumQueries(1):
+            profile = self.repo.get_alive_one_or_none(m_user=self.user.pk)
+        self.assertIsNot(profile, user.user_profile)
+        self.assertEqual(profile.display_name, "updated-name")
+
+    def test_soft_deleted_profile_is_not_returned(self):
+        profile = self.repo.get_alive_one_or_none(m_user=self.user.pk)
+        self.repo.soft_delete(profile, user=self.user, process_name="IdentityMapTest")
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.repo.get_alive_one_or_none(m_user=self.user.pk))
+
+    def test_other_conditions_are_not_memoized(self):
+        with self.assertNumQueries(2):
+            self.repo.get_alive_one_or_none(m_user=self.user.pk, is_public=False)
+            self.repo.get_alive_one_or_none(m_user=self.user.pk, is_public=False)
@@ -0,0 +1,96 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from account.models import M_User
+from core.auth_scheme import last_login_buffer
+from core.auth_scheme.last_login_buffer import LastLoginBuffer, get_last_login_buffer
+
+
+class LastLoginBufferTest(TestCase):
+    """
+    最終ログイン日時がユーザーごとにまとめられ、変更履歴を残さずに1回の UPDATE で反映されることを検証する。
+    """
+
+    PASSWORD = "LastLogin-Test-123"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            M_User.objects.create_user(
+                email=f"last-login-{i}@example.com",
+                password=cls.PASSWORD,
+                is_active=True,
+                is_first_login=False,
+            )
+            for i in range(2)
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def test_login_does_not_create_history(self):
+        user = self.users[0]
+        history_count = user.history.count()
+
+        response = self.client.post(
+            reverse("account:login"), {"username": user.email, "password": self.PASSWORD}
+        )
+
+        self.assertEqual(response.status_code, 302)
+        user.refresh_from_db()
+        self.assertIsNotNone(user.last_login)
+        self.assertEqual(user.history.count(), history_count)
+
+    def test_last_logins_are_coalesced_into_one_update(self):
+        buffer = LastLoginBuffer(batch_size=100, flush_interval=3600, asynchronous=True)
+        now = timezone.now()
+        for minutes in (3, 1, 2):
+            buffer.record(self.users[0].pk, now - timezone.timedelta(minutes=minutes))
+        buffer.record(self.users[1].pk, now)
+
+        self.assertEqual(len(buffer), 2)
+        with self.assertNumQueries(1):
+            self.assertEqual(buffer.flush(), 2)
+
+        last_logins = dict(M_User.objects.values_list("pk", "last_login"))
+        self.assertEqual(last_logins[self.users[0].pk], now - timezone.timedelta(minutes=1))
+        self.assertEqual(last_logins[self.users[1].pk], now)
+
+    def test_newer_last_login_is_not_overwritten(self):
+        now = timezone.now()
+        M_User.objects.filter(pk=self.users[0].pk).update(last_login=now)
+
+        buffer = LastLoginBuffer(batch_size=100, flush_interval=3600, asynchronous=True)
+        buffer.record(self.users[0].pk, now - timezone.timedelta(hours=1))
+        buffer.flush()
+
+        self.users[0].refresh_from_db()
+        self.assertEqual(self.users[0].last_login, now)
+
+    @override_settings(LAST_LOGIN_ASYNC=True, LAST_LOGIN_FLUSH_INTERVAL_SECONDS=3600)
+    def test_async_last_login_is_applied_by_periodic_job(self):
+        user = self.users[0]
+        # 設定値から作成し直したバッファを使用する (終了時の反映は登録しない)
+        with mock.patch.object(last_login_buffer, "_last_login_buffer", None), mock.patch.object(
+            LastLoginBuffer, "register_atexit"
+        ):
+            self.client.post(
+                reverse("account:login"), {"username": user.email, "password": self.PASSWORD}
+            )
+
+            # ログインのリクエストでは更新せず、バッファに溜める
+            user.refresh_from_db()
+            self.assertIsNone(user.last_login)
+            self.assertEqual(len(get_last_login_buffer()), 1)
+
+            job = next(job for job in settings.PERIODIC_JOBS if job["name"] == "last_login_flush")
+            self.assertEqual(import_string(job["func"])(), 1)
+
+        user.refresh_from_db()
+        self.assertIsNotNone(user.last_login)
@@ -0,0 +1,212 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from account.exceptions import LoginThrottledException
+from account.models import M_User, T_LoginHisory
+from account.models.m_user import AccountStatus
+from account.models.t_login_history import failureReasons
+from core.auth_scheme import login_history_buffer
+from core.auth_scheme.login_history_buffer import LoginHistoryBuffer, get_login_history_buffer
+from core.auth_scheme.user_auth_backend import UserAuthBackend
+from core.utils.sliding_window import SlidingWindowCounter
+
+
+@override_settings(
+    LOGIN_FAILURE_WINDOW_SECONDS=900,
+    LOGIN_FAILURE_LIMIT_PER_IDENTIFIER=3,
+    LOGIN_FAILURE_LIMIT_PER_IP=5,
+    LOGIN_LOCKOUT_SECONDS=900,
+)
+class LoginThrottleTest(TestCase):
+    """
+    ログイン失敗回数の上限に達した試行が、パスワードの照合前に拒否されることを検証する。
+    """
+
+    PASSWORD = "Throttle-Test-123"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="throttle@example.com", password=cls.PASSWORD, is_active=True
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.backend = UserAuthBackend()
+        self.factory = RequestFactory()
+
+    def authenticate(self, email, password, ip="192.0.2.1"):
+        request = self.factory.post("/account/login/", REMOTE_ADDR=ip)
+        return self.backend.authenticate(request, username=email, password=password)
+
+    def test_identifier_is_locked_after_repeated_failures(self):
+        for _ in range(3):
+            self.assertIsNone(self.authenticate(self.user.email, "wrong-password"))
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.status_code, AccountStatus.TEMPORARY_LOCKED)
+        self.assertGreater(self.user.locked_until_at, timezone.now())
+
+        # 上限に達した後は、正しいパスワードでもハッシュを計算せずに拒否する
+        with mock.patch.object(M_User, "check_password") as check_password:
+            with self.assertRaises(LoginThrottledException):
+                self.authenticate(self.user.email, self.PASSWORD)
+        check_password.assert_not_called()
+
+    def test_db_lock_is_enforced_without_cache_counters(self):
+        self.user.status_code = AccountStatus.TEMPORARY_LOCKED
+        self.user.locked_until_at = timezone.now() + timezone.timedelta(minutes=5)
+        self.user.save()
+
+        with mock.patch.object(M_User, "check_password") as check_password:
+            with self.assertRaises(LoginThrottledException):
+                self.authenticate(self.user.email, self.PASSWORD)
+        check_password.assert_not_called()
+
+    def test_expired_lock_is_released_on_success(self):
+        self.user.status_code = AccountStatus.TEMPORARY_LOCKED
+        self.user.locked_until_at = timezone.now() - timezone.timedelta(minutes=1)
+        self.user.save()
+
+        self.assertEqual(self.authenticate(self.user.email, self.PASSWORD), self.user)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.status_code, AccountStatus.ACTIVE)
+        self.assertIsNone(self.user.locked_until_at)
+
+    def test_ip_is_throttled_across_identifiers(self):
+        for i in range(5):
+            self.authenticate(f"unknown-{i}@example.com", "password", ip="198.51.100.7")
+
+        with self.assertRaises(LoginThrottledException):
+            self.authenticate(self.user.email, self.PASSWORD, ip="198.51.100.7")
+        # 他のIPアドレスからはログインできる
+        self.assertEqual(self.authenticate(self.user.email, self.PASSWORD), self.user)
+
+    def test_login_history_is_recorded(self):
+        self.authenticate(self.user.email, "wrong-password")
+        self.authenticate(self.user.email, self.PASSWORD)
+
+        histories = list(
+            T_LoginHisory.objects.order_by("pk").values_list(
+                "m_user_id", "is_successful", "failure_reason", "ip_address"
+            )
+        )
+        self.assertEqual(
+            histories,
+            [
+                (self.user.pk, False, failureReasons.PASSWORD_MISMATCH, "192.0.2.1"),
+                (self.user.pk, True, None, "192.0.2.1"),
+            ],
+        )
+
+
+class LoginHistoryBufferTest(TestCase):
+    """
+    ログイン履歴がバッファに溜められ、1回の INSERT でまとめて登録されることを検証する。
+    """
+
+    def test_histories_are_flushed_in_one_query(self):
+        buffer = LoginHistoryBuffer(batch_size=10, flush_interval=3600, asynchronous=True)
+        for i in range(3):
+            buffer.record(login_identifier=f"user-{i}@example.com", is_successful=False)
+
+        self.assertEqual(len(buffer), 3)
+        self.assertFalse(T_LoginHisory.objects.exists())
+
+        with self.assertNumQueries(1):
+            self.assertEqual(buffer.flush(), 3)
+        self.assertEqual(T_LoginHisory.objects.count(), 3)
+        self.assertEqual(len(buffer), 0)
+
+    def test_oldest_histories_are_dropped_over_max_buffer(self):
+        buffer = LoginHistoryBuffer(
+            batch_size=10, flush_interval=3600, max_buffer=2, asynchronous=True
+        )
+        for i in range(3):
+            buffer.record(login_identifier=f"user-{i}@example.com", is_successful=False)
+
+        buffer.flush()
+        self.assertEqual(
+            sorted(T_LoginHisory.objects.values_list("login_identifier", flat=True)),
+            ["user-1@example.com", "user-2@example.com"],
+        )
+
+    def test_failed_histories_are_restored_within_max_buffer(self):
+        buffer = LoginHistoryBuffer(
+            batch_size=10, flush_interval=3600, max_buffer=3, asynchronous=True
+        )
+        for i in range(2):
+            buffer.record(login_identifier=f"user-{i}@example.com", is_successful=False)
+
+        with mock.patch.object(
+            T_LoginHisory.objects, "bulk_create", side_effect=DatabaseError("database is locked")
+        ):
+            with self.assertRaises(DatabaseError):
+                buffer.flush()
+
+        # 戻した履歴を含めて上限を超えた場合は、古い履歴から破棄する
+        for i in range(2, 4):
+            buffer.record(login_identifier=f"user-{i}@example.com", is_successful=False)
+        self.assertEqual(buffer.flush(), 3)
+        self.assertEqual(
+            sorted(T_LoginHisory.objects.values_list("login_identifier", flat=True)),
+            ["user-1@example.com", "user-2@example.com", "user-3@example.com"],
+        )
+
+    @override_settings(LOGIN_HISTORY_ASYNC=True, LOGIN_HISTORY_FLUSH_INTERVAL_SECONDS=3600)
+    def test_async_histories_are_registered_by_periodic_job(self):
+        cache.clear()
+        user = M_User.objects.create_user(
+            email="async-history@example.com", password="Async-History-123", is_active=True
+        )
+        request = RequestFactory().post("/account/login/", REMOTE_ADDR="192.0.2.1")
+
+        # 設定値から作成し直したバッファを使用する (終了時の登録は行わない)
+        with mock.patch.object(
+            login_history_buffer, "_login_history_buffer", None
+        ), mock.patch.object(LoginHistoryBuffer, "register_atexit"):
+            UserAuthBackend().authenticate(
+                request, username=user.email, password="Async-History-123"
+            )
+
+            # 認証のリクエストでは登録せず、バッファに溜める
+            self.assertFalse(T_LoginHisory.objects.exists())
+            self.assertEqual(len(get_login_history_buffer()), 1)
+
+            job = next(
+                job for job in settings.PERIODIC_JOBS if job["name"] == "login_history_flush"
+            )
+            self.assertEqual(import_string(job["func"])(), 1)
+
+        self.assertEqual(
+            list(T_LoginHisory.objects.values_list("m_user_id", "is_successful")),
+            [(user.pk, True)],
+        )
+
+
+class SlidingWindowCounterTest(SimpleTestCase):
+    """
+    1つ前のウィンドウの回数が経過時間に応じて按分されることを検証する。
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_previous_window_is_weighted(self):
+        counter = SlidingWindowCounter("test", window_seconds=100)
+        for _ in range(4):
+            counter.hit("key", now=1050)
+
+        self.assertEqual(counter.count("key", now=1099), 4)
+        # 次のウィンドウの1/4が経過した時点では、前のウィンドウの回数の3/4を数える
+        self.assertEqual(counter.count("key", now=1125), 3)
+        self.assertEqual(counter.count("key", now=1200), 0)
+
+        counter.reset("key", now=1099)
+        self.assertEqual(counter.count("key", now=1099), 0)
@@ -0,0 +1,50 @@
+from django.test import TestCase
+
+from account.models import M_User, M_UserProfile
+from account.repositories.m_user_profile_repository import PROFILE_PROJECTION_LIST
+from account.services.user_service import UserService
+
+
+class ProfileListProjectionTest(TestCase):
+    """
+    公開プロフィール検索の一覧表示用の取得 (PROFILE_PROJECTION_LIST) が
+    表示に必要な列のみを1回のクエリで取得することを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(3):
+            user = M_User.objects.create_user(
+                email=f"projection-{i}@example.com", password="Projection-Test-123"
+            )
+            M_UserProfile.objects.filter(m_user=user).update(
+                is_public=True,
+                display_name=f"projection-{i}",
+                bio="bio",
+                career_history="long career history",
+                skill_tags_raw="python",
+            )
+
+    def test_list_projection_loads_only_listing_columns(self):
+        service = UserService()
+        queryset = service.search_public_profiles(projection=PROFILE_PROJECTION_LIST)
+
+        with self.assertNumQueries(1):
+            page = service.paginate_public_profiles(queryset, page_size=10)
+            for profile in page:
+                # 一覧テンプレートで参照する列は追加のクエリなしで参照できる
+                (profile.pk, profile.display_name, profile.icon, profile.bio)
+                (profile.skill_tags_raw, profile.created_at)
+
+        self.assertEqual(len(page), 3)
+        deferred = page.object_list[0].get_deferred_fields()
+        self.assertTrue({"career_history", "github_link", "updated_by_id"} <= deferred)
+        self.assertNotIn("display_name", deferred)
+
+    def test_full_projection_loads_all_columns_and_user(self):
+        queryset = UserService().search_public_profiles()
+        profile = queryset.first()
+
+        self.assertEqual(profile.get_deferred_fields(), set())
+        with self.assertNumQueries(0):
+            profile.m_user.email
@@ -0,0 +1,132 @@
+import unittest
+
+from django.db import connection
+from django.test import TestCase
+
+from account.models import M_User, M_UserProfile
+from account.repositories.m_user_profile_repository import M_UserProfileRepository
+from account.search_backends.default_backend import DefaultProfileSearchBackend
+from account.search_backends.postgresql_trgm_backend import PostgreSQLTrigramProfileSearchBackend
+from account.search_backends.sqlite_fts5_backend import SQLiteFTS5ProfileSearchBackend
+
+
+class ProfileSearchBackendTestMixin:
+    """検索バックエンド共通のテストデータと検索ヘルパー"""
+
+    backend_class = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="search-backend@example.com", password="Search-Backend-123"
+        )
+        cls.profile = M_UserProfile.objects.get(m_user=cls.user)
+        cls.profile.is_public = True
+        cls.profile.display_name = "山田エンジニア"
+        cls.profile.skill_tags_raw = "python,django"
+        cls.profile.location = "東京都"
+        cls.profile.save()
+
+    def setUp(self):
+        self.backend = self.backend_class()
+
+    def search(self, **conditions) -> list:
+        queryset = M_UserProfile.objects.filter(is_public=True, deleted_at__isnull=True)
+        return list(self.backend.search(queryset, **conditions).values_list("pk", flat=True))
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "SQLiteのFTS5を使用するテスト")
+class SQLiteFTS5ProfileSearchBackendTest(ProfileSearchBackendTestMixin, TestCase):
+    """
+    SQLiteFTS5ProfileSearchBackend が保存したプロフィールを索引に登録・除去し、検索できることを検証する。
+    """
+
+    backend_class = SQLiteFTS5ProfileSearchBackend
+
+    def test_saved_profile_is_searchable(self):
+        self.assertEqual(self.search(search_word="エンジニア"), [self.profile.pk])
+        self.assertEqual(self.search(search_word="djan"), [self.profile.pk])
+        self.assertEqual(self.search(location="東京都"), [self.profile.pk])
+        self.assertEqual(self.search(search_word="rails"), [])
+
+    def test_short_word_falls_back_to_partial_match(self):
+        # trigramでは検索できない2文字の語句は部分一致で検索する
+        self.assertEqual(self.search(search_word="山田"), [self.profile.pk])
+        self.assertEqual(self.search(location="大阪"), [])
+
+    def test_updated_profile_is_reindexed(self):
+        self.profile.display_name = "佐藤デザイナー"
+        self.profile.save(update_fields=["display_name"])
+
+        self.assertEqual(self.search(search_word="デザイナー"), [self.profile.pk])
+        self.assertEqual(self.search(search_word="エンジニア"), [])
+
+    def test_bulk_updated_profile_is_reindexed(self):
+        self.profile.display_name = "佐藤デザイナー"
+        M_UserProfileRepository().bulk_update(
+            [self.profile], ["display_name"], user=self.user, process_name="SearchBackendTest"
+        )
+
+        self.assertEqual(self.search(search_word="デザイナー"), [self.profile.pk])
+        self.assertEqual(self.search(search_word="エンジニア"), [])
+
+    def test_bulk_created_profile_is_indexed(self):
+        user = M_User.objects.create_user(
+            email="search-backend-bulk@example.com", password="Search-Backend-123"
+        )
+        M_UserProfile.objects.filter(m_user=user).delete()
+
+        (profile,) = M_UserProfileRepository().bulk_create(
+            [M_UserProfile(m_user=user, display_name="鈴木アナリスト", is_public=True)],
+            user=self.user,
+            process_name="SearchBackendTest",
+        )
+
+        self.assertEqual(self.search(search_word="アナリスト"), [profile.pk])
+
+    def test_removed_profile_is_not_searchable(self):
+        self.backend.remove_profile(self.profile.pk)
+
+        self.assertEqual(self.search(search_word="エンジニア"), [])
+
+        # 再構築すると全プロフィールが再登録される
+        self.assertEqual(self.backend.rebuild_index(), M_UserProfile.objects.count())
+        self.assertEqual(self.search(search_word="エンジニア"), [self.profile.pk])
+
+
+class DefaultProfileSearchBackendTest(ProfileSearchBackendTestMixin, TestCase):
+    """
+    DefaultProfileSearchBackend が部分一致で検索することを検証する。
+    """
+
+    backend_class = DefaultProfileSearchBackend
+
+    def test_search_by_partial_match(self):
+        self.assertEqual(self.search(search_word="エンジニア"), [self.profile.pk])
+        self.assertEqual(self.search(search_word="DJANGO"), [self.profile.pk])
+        self.assertEqual(self.search(location="東京"), [self.profile.pk])
+        self.assertEqual(self.search(search_word="rails"), [])
+
+    def test_index_operations_are_noop(self):
+        self.backend.index_profile(self.profile)
+        self.backend.remove_profile(self.profile.pk)
+
+        self.assertEqual(self.backend.rebuild_index(), 0)
+        self.assertEqual(self.search(search_word="エンジニア"), [self.profile.pk])
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "PostgreSQLのpg_trgmを使用するテスト")
+class PostgreSQLTrigramProfileSearchBackendTest(ProfileSearchBackendTestMixin, TestCase):
+    """
+    PostgreSQLTrigramProfileSearchBackend が部分一致で検索し、類似度でランキングすることを検証する。
+    """
+
+    backend_class = PostgreSQLTrigramProfileSearchBackend
+
+    def test_search_ranks_by_similarity(self):
+        self.assertEqual(self.search(search_word="エンジニア"), [self.profile.pk])
+        self.assertEqual(self.search(search_word="rails"), [])
+
+        queryset = M_UserProfile.objects.filter(is_public=True)
+        ranked = self.backend.search(queryset, search_word="python")
+        self.assertIn(self.backend.rank_annotation, ranked.query.annotations)
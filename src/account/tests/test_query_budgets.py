@@ -0,0 +1,200 @@
+import hashlib
+
+from django.urls import reverse
+from django.utils import timezone
+
+from account import urls as account_urls
+from account.models import M_UserProfile
+from account.models.t_user_token import T_UserToken, TokenTypes
+from core.tests.query_budget import QueryBudgetTestCase
+
+
+class AccountQueryBudgetTest(QueryBudgetTestCase):
+    """
+    account/urls.py の全URLがクエリバジェット内で処理されることを検証する。
+    """
+
+    urls_module = account_urls
+    tested_url_names = (
+        "activate_user",
+        "login",
+        "logout",
+        "register",
+        "register_pending",
+        "password_reset_request",
+        "password_reset_pending",
+        "password_reset_confirm",
+        "initial_setup",
+        "profile_edit",
+        "profile",
+        "settings",
+        "user_search",
+        "public_profile",
+    )
+
+    # 検索結果・一覧に表示するユーザー数 (N件に比例するクエリがあればバジェットを超える)
+    SEED_USER_COUNT = 25
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls.create_active_user("budget-owner@example.com")
+        cls.others = [
+            cls.create_active_user(f"budget-user{i}@example.com")
+            for i in range(cls.SEED_USER_COUNT)
+        ]
+        M_UserProfile.objects.filter(m_user__in=cls.others).update(
+            is_public=True, location="Tokyo", skill_tags_raw="python, django"
+        )
+
+    @classmethod
+    def create_token(cls, user, token_type: str) -> str:
+        """トークンを作成し、URLに含める生の値を返す"""
+        raw_token = hashlib.sha256(f"{user.pk}:{token_type}".encode()).hexdigest()
+        T_UserToken.objects.create(
+            m_user=user,
+            token_hash=hashlib.sha256(raw_token.encode()).hexdigest(),
+            token_type=token_type,
+            expired_at=timezone.now() + timezone.timedelta(hours=1),
+            created_by=user,
+            updated_by=user,
+            created_method="AccountQueryBudgetTest",
+            updated_method="AccountQueryBudgetTest",
+        )
+        return raw_token
+
+    # ------------------------------------------------------------------
+    # 未ログインで利用する画面
+    # ------------------------------------------------------------------
+    def test_activate_user(self):
+        user = self.create_active_user("budget-inactive@example.com", is_active=False)
+        raw_token = self.create_token(user, TokenTypes.ACTIVATION)
+        response = self.request_within_budget(
+            "GET", reverse("account:activate_user", args=[raw_token])
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_login(self):
+        self.request_within_budget("GET", reverse("account:login"))
+        response = self.request_within_budget(
+            "POST",
+            reverse("account:login"),
+            {"username": self.user.email, "password": self.PASSWORD},
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_logout(self):
+        self.client.force_login(self.user)
+        self.request_within_budget("GET", reverse("account:logout"))
+        self.client.force_login(self.user)
+        self.request_within_budget("POST", reverse("account:logout"))
+
+    def test_register(self):
+        self.request_within_budget("GET", reverse("account:register"))
+        response = self.request_within_budget(
+            "POST",
+            reverse("account:register"),
+            {
+                "email": "budget-new@example.com",
+                "display_name": "budget-new",
+                "password": self.PASSWORD,
+                "password_confirm": self.PASSWORD,
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_register_pending(self):
+        self.request_within_budget("GET", reverse("account:register_pending"))
+
+    def test_password_reset_request(self):
+        self.request_within_budget("GET", reverse("account:password_reset_request"))
+        response = self.request_within_budget(
+            "POST", reverse("account:password_reset_request"), {"email": self.user.email}
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_password_reset_pending(self):
+        self.request_within_budget("GET", reverse("account:password_reset_pending"))
+
+    def test_password_reset_confirm(self):
+        raw_token = self.create_token(self.user, TokenTypes.PASSWORD_RESET)
+        path = reverse("account:password_reset_confirm", args=[raw_token])
+        self.request_within_budget("GET", path)
+        response = self.request_within_budget(
+            "POST",
+            path,
+            {"new_password1": "Budget-New-Pass-456", "new_password2": "Budget-New-Pass-456"},
+        )
+        self.assertRedirects(
+            response, reverse("account:login"), fetch_redirect_response=False
+        )
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("Budget-New-Pass-456"))
+
+    # ------------------------------------------------------------------
+    # ログイン後に利用する画面
+    # ------------------------------------------------------------------
+    def test_initial_setup(self):
+        user = self.create_active_user("budget-first@example.com", is_first_login=True)
+        self.client.force_login(user)
+        self.request_within_budget("GET", reverse("account:initial_setup"))
+        response = self.request_within_budget(
+            "POST",
+            reverse("account:initial_setup"),
+            {"display_name": "budget-first", "is_public": "on"},
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_profile_edit(self):
+        self.client.force_login(self.user)
+        self.request_within_budget("GET", reverse("account:profile_edit"))
+        response = self.request_within_budget(
+            "POST",
+            reverse("account:profile_edit"),
+            {
+                "display_name": "budget-owner",
+                "theme": "light",
+                "skill_tags_raw": "python, django, sql",
+                "is_public": "on",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_profile(self):
+        self.client.force_login(self.user)
+        self.request_within_budget("GET", reverse("account:profile", args=["me"]))
+        response = self.request_within_budget(
+            "GET", reverse("account:profile", args=[self.others[0].pk])
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_settings(self):
+        self.client.force_login(self.user)
+        self.request_within_budget("GET", reverse("account:settings"))
+        response = self.request_within_budget(
+            "POST", reverse("account:settings"), {"is_email_notify_enabled": "on"}
+        )
+        self.assertEqual(response.status_code, 302)
+
+    def test_user_search(self):
+        self.client.force_login(self.user)
+        response = self.request_within_budget("GET", reverse("account:user_search"))
+        self.assertEqual(response.status_code, 200)
+        self.request_within_budget(
+            "GET",
+            reverse("account:user_search"),
+            {"search_word": "budget", "location": "Tokyo", "skill_tag": "python"},
+        )
+
+        # 2ページ目 (カーソル指定) もバジェット内で取得できること
+        next_cursor = response.context["page_obj"].next_cursor
+        self.assertIsNotNone(next_cursor)
+        self.request_within_budget(
+            "GET", reverse("account:user_search"), {"cursor": next_cursor}
+        )
+
+    def test_public_profile(self):
+        self.client.force_login(self.user)
+        response = self.request_within_budget(
+            "GET", reverse("account:public_profile", args=[self.others[0].pk])
+        )
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,110 @@
+from django.test import SimpleTestCase, TestCase
+
+from account.models import M_User, M_UserProfile
+from account.repositories.m_skill_tag_repository import M_SkillTagRepository
+from account.repositories.m_user_profile_skill_tag_repository import (
+    M_UserProfileSkillTagRepository,
+)
+from core.utils.common import normalize_tag, split_tags
+
+process_name = "SkillTagSearchTest"
+
+
+class TagNormalizationTest(SimpleTestCase):
+    """
+    タグ名の正規化 (NFKC + casefold) と、カンマ区切りのタグ文字列の分割を検証する。
+    """
+
+    def test_normalize_tag(self):
+        self.assertEqual(normalize_tag("Ｐｙｔｈｏｎ "), "python")
+        self.assertEqual(normalize_tag(" DJANGO"), "django")
+        # 半角カナは全角に、ドイツ語のßは casefold で ss に揃える
+        self.assertEqual(normalize_tag("ﾃｽﾄ"), "テスト")
+        self.assertEqual(normalize_tag("Straße"), "strasse")
+
+    def test_split_tags_removes_empty_and_duplicate_tags(self):
+        self.assertEqual(
+            split_tags("Python, ｐｙｔｈｏｎ ,,Django, DJANGO ,"),
+            ["Python", "Django"],
+        )
+        self.assertEqual(split_tags(""), [])
+        self.assertEqual(split_tags(None), [])
+
+    def test_split_tags_truncates_long_tags(self):
+        self.assertEqual(split_tags("abcdef,xyz", max_length=3), ["abc", "xyz"])
+
+
+class SkillTagSearchTest(TestCase):
+    """
+    find_profile_ids_by_tag_ids のAND/OR検索と、タグ名からのタグIDの取得を検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tag_repo = M_SkillTagRepository()
+        cls.link_repo = M_UserProfileSkillTagRepository()
+        cls.operator = M_User.objects.create_user(
+            email="skill-tag-operator@example.com", password="Skill-Tag-123"
+        )
+        cls.tags = cls.tag_repo.get_or_create_by_names(
+            ["Python", "Django", "Go"], user=cls.operator, process_name=process_name
+        )
+
+        cls.profiles = {}
+        for name, tag_keys in (
+            ("python-django", ["python", "django"]),
+            ("python", ["python"]),
+            ("go", ["go"]),
+        ):
+            user = M_User.objects.create_user(
+                email=f"skill-tag-{name}@example.com", password="Skill-Tag-123"
+            )
+            profile = M_UserProfile.objects.get(m_user=user)
+            cls.link_repo.replace_profile_tags(
+                profile,
+                [cls.tags[key] for key in tag_keys],
+                user=cls.operator,
+                process_name=process_name,
+            )
+            cls.profiles[name] = profile.pk
+
+    def find(self, tag_keys, match_all=True) -> set:
+        tag_ids = [self.tags[key].pk for key in tag_keys]
+        return set(
+            M_UserProfile.objects.filter(
+                pk__in=self.link_repo.find_profile_ids_by_tag_ids(tag_ids, match_all=match_all)
+            ).values_list("pk", flat=True)
+        )
+
+    def test_and_matches_profiles_with_all_tags(self):
+        self.assertEqual(self.find(["python", "django"]), {self.profiles["python-django"]})
+        self.assertEqual(self.find(["python", "go"]), set())
+
+    def test_or_matches_profiles_with_any_tag(self):
+        self.assertEqual(
+            self.find(["python", "go"], match_all=False),
+            {self.profiles["python-django"], self.profiles["python"], self.profiles["go"]},
+        )
+        self.assertEqual(
+            self.find(["django"], match_all=False), {self.profiles["python-django"]}
+        )
+
+    def test_duplicate_tags_are_counted_once(self):
+        # 同じタグを重複して指定しても、AND検索の必要件数は増えない
+        self.assertEqual(
+            self.find(["python", "python"]),
+            {self.profiles["python-django"], self.profiles["python"]},
+        )
+        self.assertEqual(
+            self.find(["python", "django", "django"]), {self.profiles["python-django"]}
+        )
+
+    def test_full_width_tag_names_resolve_to_same_tags(self):
+        tag_ids = self.tag_repo.get_ids_by_names(["ＰＹＴＨＯＮ", "ｄｊａｎｇｏ "])
+        self.assertEqual(set(tag_ids), {self.tags["python"].pk, self.tags["django"].pk})
+
+        # 全角で指定しても既存のタグを再利用し、新しいタグは作成しない
+        tags = self.tag_repo.get_or_create_by_names(
+            ["Ｇｏ"], user=self.operator, process_name=process_name
+        )
+        self.assertEqual(tags["go"].pk, self.tags["go"].pk)
@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from account.models import M_User
+from account.models.m_user import AccountStatus
+from core.auth_scheme.user_auth_backend import UserAuthBackend
+
+
+@override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+class UserAuthBackendGetUserTest(TestCase):
+    """
+    UserAuthBackend.get_user のキャッシュを検証する (共有キャッシュでキャッシュを有効にした場合)。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="cached-user@example.com", password="Cached-Pass-123", is_active=True
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.backend = UserAuthBackend()
+
+    def test_cached_user_and_profile_need_no_queries(self):
+        self.backend.get_user(self.user.pk)
+
+        with self.assertNumQueries(0):
+            user = self.backend.get_user(self.user.pk)
+            self.assertEqual(user.user_profile.m_user_id, self.user.pk)
+
+    def test_saving_user_invalidates_cache(self):
+        self.backend.get_user(self.user.pk)
+        user = M_User.objects.get(pk=self.user.pk)
+        user.is_first_login = False
+        user.save()
+
+        with self.assertNumQueries(1):
+            self.assertFalse(self.backend.get_user(self.user.pk).is_first_login)
+
+    def test_saving_profile_invalidates_cache(self):
+        self.backend.get_user(self.user.pk)
+        profile = self.user.user_profile
+        profile.display_name = "updated-name"
+        profile.save()
+
+        with self.assertNumQueries(1):
+            user = self.backend.get_user(self.user.pk)
+            self.assertEqual(user.user_profile.display_name, "updated-name")
+
+    def test_missing_user_is_not_cached(self):
+        self.assertIsNone(self.backend.get_user(0))
+
+
+class UserAuthBackendRejectUserTest(TestCase):
+    """
+    既定の設定 (プロセスごとのキャッシュ) では get_user が毎回DBから取得し、
+    無効化・凍結されたユーザーを直ちに拒否することを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="rejected-user@example.com", password="Rejected-Pass-123", is_active=True
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.backend = UserAuthBackend()
+
+    def test_user_cache_is_disabled_for_process_local_cache(self):
+        self.assertEqual(settings.AUTH_USER_CACHE_TIMEOUT, 0)
+
+    def test_user_deactivated_in_db_is_rejected(self):
+        self.assertIsNotNone(self.backend.get_user(self.user.pk))
+
+        # シグナルを発行しない更新 (他のワーカー・管理コマンドでの変更) でも直ちに反映される
+        M_User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        self.assertIsNone(self.backend.get_user(self.user.pk))
+
+    def test_frozen_and_withdrawn_users_are_rejected(self):
+        for status_code in (AccountStatus.FROZEN, AccountStatus.WITHDRAWN):
+            with self.subTest(status_code=status_code):
+                M_User.objects.filter(pk=self.user.pk).update(status_code=status_code)
+                self.assertIsNone(self.backend.get_user(self.user.pk))
+
+    def test_temporarily_locked_user_keeps_session(self):
+        # 一時ロックは第三者のログイン試行でも掛かるため、ログイン中のセッションは無効にしない
+        M_User.objects.filter(pk=self.user.pk).update(status_code=AccountStatus.TEMPORARY_LOCKED)
+
+        self.assertEqual(self.backend.get_user(self.user.pk), self.user)
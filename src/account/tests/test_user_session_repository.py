@@ -0,0 +1,45 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from account.models import M_User, T_UserSession
+from account.repositories.t_user_session_repository import T_UserSessionRepository
+
+
+class T_UserSessionRepositoryTest(TestCase):
+    """
+    T_UserSessionRepository がユーザー単位・有効期限でセッションを絞り込むことを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            M_User.objects.create_user(email=f"session-{i}@example.com", password="Session-123")
+            for i in range(2)
+        ]
+        expire_date = timezone.now() + timezone.timedelta(hours=1)
+        for i, user in enumerate(cls.users + [None]):
+            T_UserSession.objects.create(
+                session_key=f"session-{i}", session_data="", expire_date=expire_date, m_user=user
+            )
+
+    def setUp(self):
+        self.repo = T_UserSessionRepository()
+
+    def test_delete_by_user_removes_only_that_users_sessions(self):
+        self.assertEqual(self.repo.delete_by_user(self.users[0]), 1)
+
+        self.assertEqual(
+            sorted(T_UserSession.objects.values_list("session_key", flat=True)),
+            ["session-1", "session-2"],
+        )
+
+    def test_get_expired_records(self):
+        now = timezone.now()
+        T_UserSession.objects.filter(session_key="session-1").update(
+            expire_date=now - timezone.timedelta(minutes=1)
+        )
+
+        self.assertEqual(
+            list(self.repo.get_expired_records(now).values_list("session_key", flat=True)),
+            ["session-1"],
+        )
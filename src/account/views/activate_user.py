@@ -18,6 +18,7 @@ class ActivateUserView(View):
     """
     メールに記載されたトークンを使ってユーザーアカウントを有効化する。
     """
+    query_budget = {"GET": 20}
 
     @logging_sql_queries(process_name=process_name)
     def get(self, request, token_value):
@@ -18,6 +18,7 @@ class InitialSetupView(LoginRequiredMixin, FormView):
     form_class = InitialSetupForm
     success_url = reverse_lazy("dashboard:dashboard")
     user_service = UserService()
+    query_budget = {"GET": 5, "POST": 18}
 
     # 1. アクセス制御 (変更なし)
     def dispatch(self, request, *args, **kwargs):
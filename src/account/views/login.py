@@ -24,6 +24,7 @@ class LoginView(FormView):
     template_name = "account/login.html"
     success_url = reverse_lazy("dashboard:dashboard")
     INITIAL_SETUP_URL = reverse_lazy("account:initial_setup")
+    query_budget = {"GET": 2, "POST": 15}
 
     # FormViewが持つ成功時のURL取得メソッドを利用
     def get_success_url(self):
@@ -43,7 +44,9 @@ class LoginView(FormView):
 
         try:
             # 1. AuthServiceのカスタムログインロジックを実行
-            user = auth_service.login(email=email, password=password, process_name=process_name)
+            user = auth_service.login(
+                email=email, password=password, process_name=process_name, request=self.request
+            )
             is_first_login = user.is_first_login
 
             # 2. 認証成功: Django標準のlogin関数でセッションを確立
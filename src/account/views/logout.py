@@ -18,6 +18,7 @@ class LogoutView(View):
     # ログアウト後のリダイレクト先 (通常はログインページ)
     # reverse_lazy を使うことで、URLがまだ読み込まれていなくても安全に参照できます
     redirect_url = reverse_lazy("account:login")
+    query_budget = {"GET": 6, "POST": 6}
 
     @logging_sql_queries(process_name=process_name)
     def get(self, request):
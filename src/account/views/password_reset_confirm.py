@@ -19,6 +19,7 @@ class PasswordResetConfirmView(FormView):
     form_class = PasswordResetConfirmForm
     # 成功後はログイン画面へリダイレクト
     success_url = reverse_lazy("account:login")
+    query_budget = {"GET": 2, "POST": 12}
 
     def dispatch(self, request, *args, **kwargs):
         # URLからトークンを取得し、このビューインスタンスに保存
@@ -40,7 +41,7 @@ class PasswordResetConfirmView(FormView):
         try:
             # サービス層でトークン検証とパスワード更新を実行
             user = auth_service.reset_password(
-                raw_token_value=self.token_value,
+                raw_token=self.token_value,
                 new_password=new_password,
                 process_name=process_name,
             )
@@ -7,3 +7,4 @@ process_name = "PasswordResetPendingView"
 class PasswordResetPendingView(TemplateView):
     # このビューは、メールが送信されたことだけを通知するシンプルな画面
     template_name = "account/password_reset_pending.html"
+    query_budget = {"GET": 2}
@@ -19,6 +19,7 @@ class PasswordResetRequestView(FormView):
     template_name = "account/password_reset_request.html"
     form_class = PasswordResetRequestForm
     success_url = reverse_lazy("account:password_reset_pending")
+    query_budget = {"GET": 2, "POST": 10}
 
     @logging_sql_queries(process_name=process_name)
     def form_valid(self, form):
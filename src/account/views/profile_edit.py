@@ -22,6 +22,7 @@ class ProfileEditView(LoginRequiredMixin, FormView):
     template_name = "account/profile_edit.html"
     form_class = ProfileEditForm
     success_url = reverse_lazy("account:profile", kwargs={"pk": "me"})
+    query_budget = {"GET": 6, "POST": 18}
 
     # SQLログデコレータを適用
     @logging_sql_queries(process_name=process_name)
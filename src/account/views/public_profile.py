@@ -21,6 +21,7 @@ class PublicProfileView(LoginRequiredMixin, DetailView):
     model = M_UserProfile
     template_name = "account/public_profile.html"
     context_object_name = "profile"
+    query_budget = {"GET": 7}
 
     @logging_sql_queries(process_name=process_name)
     def get_object(self, queryset=None):
@@ -74,6 +75,7 @@ class PublicProfileView(LoginRequiredMixin, DetailView):
         context["skill_tags"] = service.parse_skill_tags(profile)
         
         # 自分のプロフィールかどうかを判定
-        context["is_own_profile"] = profile.m_user == self.request.user
+        # (ユーザーIDで比較し、プロフィールからユーザーを取得するクエリを発行しない)
+        context["is_own_profile"] = profile.m_user_id == self.request.user.pk
 
         return context
@@ -16,6 +16,7 @@ class RegisterView(FormView):
     form_class = SignupForm
     template_name = "account/register.html"
     success_url = reverse_lazy("account:register_pending")
+    query_budget = {"GET": 2, "POST": 20}
 
     # SQLログデコレータを適用
     @logging_sql_queries(process_name=process_name)
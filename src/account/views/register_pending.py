@@ -8,4 +8,5 @@ class RegisterPendingView(TemplateView):
     """
 
     template_name = "account/register_pending.html"
+    query_budget = {"GET": 2}
     # テンプレート内で、登録完了メッセージや再送リンクなどを表示します。
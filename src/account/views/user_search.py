@@ -3,8 +3,10 @@ from django.views.generic import ListView
 
 from account.forms.user_search import UserSearchForm
 from account.models.m_user_profile import M_UserProfile
+from account.repositories.m_user_profile_repository import PROFILE_PROJECTION_LIST
 from account.services.user_service import UserService
 from core.decorators.logging_sql_queries import logging_sql_queries
+from core.repositories import COUNT_MODE_APPROXIMATE
 
 process_name = "UserSearchView"
 
@@ -18,8 +20,20 @@ class UserSearchView(LoginRequiredMixin, ListView):
     template_name = "account/user_search.html"
     context_object_name = "profiles"
     paginate_by = 20  # ページネーション
+    # ページネーション方式 ("keyset": カーソル方式 / "offset": ページ番号方式)
+    # keyset方式はOFFSETを使わないため、深いページでも取得コストが一定になる
+    pagination_mode = "keyset"
+    # keyset方式での件数の取得方法 (先頭ページでのみ取得し、以降はカーソルで引き継ぐ)
+    count_mode = COUNT_MODE_APPROXIMATE
+    # 検索結果の取得列 (テンプレートで表示する列のみを取得する)
+    projection = PROFILE_PROJECTION_LIST
+    query_budget = {"GET": 7}
 
     @logging_sql_queries(process_name=process_name)
+    def get(self, request, *args, **kwargs):
+        # 検索条件の解決からページ取得までを1回の計測対象とする (get_querysetは遅延評価のため)
+        return super().get(request, *args, **kwargs)
+
     def get_queryset(self):
         service = UserService()
         
@@ -30,19 +44,37 @@ class UserSearchView(LoginRequiredMixin, ListView):
             search_word = form.cleaned_data.get("search_word")
             location = form.cleaned_data.get("location")
             skill_tag = form.cleaned_data.get("skill_tag")
+            skill_tag_mode = form.cleaned_data.get("skill_tag_mode")
         else:
             # バリデーションエラーの場合は空の検索条件
             search_word = None
             location = None
             skill_tag = None
+            skill_tag_mode = "all"
 
         # サービス層を使用して検索
         return service.search_public_profiles(
             search_word=search_word,
             location=location,
             skill_tag=skill_tag,
+            skill_tag_match_all=skill_tag_mode != "any",
+            projection=self.projection,
         )
 
+    def paginate_queryset(self, queryset, page_size):
+        if self.pagination_mode != "keyset":
+            return super().paginate_queryset(queryset, page_size)
+
+        # keyset方式: ?cursor= の位置から page_size 件を取得 (COUNT(*)/OFFSETを発行しない)
+        page = UserService().paginate_public_profiles(
+            queryset,
+            cursor=self.request.GET.get("cursor"),
+            page_size=page_size,
+            count_mode=self.count_mode,
+        )
+        is_paginated = page.has_next or page.has_previous
+        return (None, page, page.object_list, is_paginated)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
@@ -55,9 +87,12 @@ class UserSearchView(LoginRequiredMixin, ListView):
             context["search_word"] = form.cleaned_data.get("search_word", "")
             context["location"] = form.cleaned_data.get("location", "")
             context["skill_tag"] = form.cleaned_data.get("skill_tag", "")
+            context["skill_tag_mode"] = form.cleaned_data.get("skill_tag_mode", "all")
         else:
             context["search_word"] = ""
             context["location"] = ""
             context["skill_tag"] = ""
-            
+            context["skill_tag_mode"] = "all"
+
+        context["pagination_mode"] = self.pagination_mode
         return context
@@ -21,6 +21,7 @@ class UserSettingsView(LoginRequiredMixin, FormView):
     template_name = "account/settings.html"
     form_class = UserSettingsForm
     success_url = reverse_lazy("account:settings")
+    query_budget = {"GET": 6, "POST": 10}
 
     @logging_sql_queries(process_name=process_name)
     def get_initial(self):
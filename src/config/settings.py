@@ -3,6 +3,7 @@ Django settings for src project.
 """
 
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -36,6 +37,8 @@ env.read_env(os.path.join(BASE_DIR, ".env"))
 SECRET_KEY: str = env("SECRET_KEY")
 DEBUG: bool = env.bool("DEBUG", default=False)
 APP_NAME = "Loclil"
+# テスト実行中か (manage.py test)
+TESTING: bool = len(sys.argv) > 1 and sys.argv[1] == "test"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # ==============================================================================
@@ -49,6 +52,8 @@ X_FRAME_OPTIONS = "DENY"  # クリックジャッキング対策
 # セッション/クッキー設定
 SESSION_COOKIE_SECURE: bool = env.bool("SESSION_COOKIE_SECURE", default=False)
 SESSION_COOKIE_AGE: int = 3660
+# ユーザーIDの列を持つセッションテーブル (ユーザー単位の強制ログアウトをインデックスで行うため)
+SESSION_ENGINE = "account.session_backends.db"
 CSRF_COOKIE_SECURE: bool = env.bool("CSRF_COOKIE_SECURE", default=False)
 
 # 認証フローとトークン設定
@@ -90,6 +95,10 @@ MIDDLEWARE = [
     "core.middlewares.same_site_middleware.SameSiteMiddleware",
     # Django標準のミドルウェア
     "django.middleware.security.SecurityMiddleware",
+    # 読み込み先 (プライマリ/リードレプリカ) の振り分け (セッションの保存も書き込みとして扱うためSessionMiddlewareより前に配置)
+    "core.middlewares.replica_routing_middleware.ReplicaRoutingMiddleware",
+    # クエリバジェット検証ミドルウェア (セッションの保存も計測するためSessionMiddlewareより前に配置)
+    "core.middlewares.query_budget_middleware.QueryBudgetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -97,10 +106,14 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     # --- カスタムミドルウェア ---
+    # リクエスト単位のアイデンティティマップ (ログインユーザーを登録するため認証の後に配置)
+    "core.middlewares.identity_map_middleware.IdentityMapMiddleware",
     # 初期設定ミドルウェア(環境変数の必須チェック等)
     "core.middlewares.initial_setup_required_middleware.InitialSetupRequiredMiddleware",
     # アクセスログ設定ミドルウェア
     "core.middlewares.logging_middleware.LoggingMiddleware",
+    # N+1クエリ検出ミドルウェア
+    "core.middlewares.n_plus_one_detection_middleware.NPlusOneDetectionMiddleware",
     # --- その他 ---
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -124,11 +137,152 @@ DATABASES = {
         "CONN_MAX_AGE": env.int("CONN_MAX_AGE"),
     },
 }
+# SQLiteのチューニング (DB_ENGINE=core.db_backends.sqlite3 の場合に、接続ごとに適用するPRAGMA)
+if DATABASES["default"]["ENGINE"] == "core.db_backends.sqlite3":
+    DATABASES["default"]["OPTIONS"] = {
+        "pragmas": {
+            "busy_timeout": env.int("SQLITE_BUSY_TIMEOUT_MS", default=5000),
+            "journal_mode": env("SQLITE_JOURNAL_MODE", default="WAL"),
+            "synchronous": env("SQLITE_SYNCHRONOUS", default="NORMAL"),
+            "cache_size": env.int("SQLITE_CACHE_SIZE", default=-64000),  # 負の値はKiB単位 (64MB)
+            "mmap_size": env.int("SQLITE_MMAP_SIZE", default=268435456),  # 256MB
+            "temp_store": env("SQLITE_TEMP_STORE", default="MEMORY"),
+        },
+        # 接続を引数に呼び出す関数 (ユーザー定義関数の登録など)
+        "init_hooks": env.list("SQLITE_INIT_HOOKS", default=[]),
+        # IMMEDIATE: トランザクションの開始時に書き込みロックを取得し、途中での "database is locked" を防ぐ
+        "transaction_mode": env("SQLITE_TRANSACTION_MODE", default="") or None,
+    }
+# リードレプリカ (プライマリの複製のDB名をカンマ区切りで指定。設定した場合、リポジトリの参照系メソッドはレプリカから読み込む)
+for index, replica_name in enumerate(env.list("DB_REPLICA_NAMES", default=[]), start=1):
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "NAME": BASE_DIR / replica_name,
+        # テストではプライマリと同じDBを使用する
+        "TEST": {"MIRROR": "default"},
+    }
+REPLICA_DATABASES: list = [alias for alias in DATABASES if alias.startswith("replica_")]
+DATABASE_ROUTERS = ["core.db_router.PrimaryReplicaRouter"]
+# 書き込みを行ったクライアントの読み込みをプライマリに固定する秒数 (レプリカへの反映の遅延より長くする)
+READ_YOUR_WRITES_SECONDS: int = env.int("READ_YOUR_WRITES_SECONDS", default=10)
+# キャッシュ設定 (複数プロセス/ホストで動作させる場合は redis:// などの共有キャッシュを指定)
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+# プロフィール検索バックエンド (未設定の場合はDBエンジンに応じて自動選択)
+# 例: account.search_backends.default_backend.DefaultProfileSearchBackend
+PROFILE_SEARCH_BACKEND: str = env("PROFILE_SEARCH_BACKEND", default="")
+# 期限切れデータの削除 (common_expired_data_sweeper コマンド)
+SWEEPER_BATCH_SIZE: int = env.int("SWEEPER_BATCH_SIZE", default=500)  # 1回のDELETEで削除する件数
+# バッチ間の待機秒数 (通常のリクエストとロック・I/Oを競合させないよう間隔を空ける)
+SWEEPER_BATCH_INTERVAL_SECONDS: float = env.float("SWEEPER_BATCH_INTERVAL_SECONDS", default=0.2)
+# 有効期限切れ後にトークンを残す日数
+EXPIRED_TOKEN_RETENTION_DAYS: int = env.int("EXPIRED_TOKEN_RETENTION_DAYS", default=7)
+# 変更履歴 (HistoricalRecords) / ログイン履歴の保存日数 (0の場合は削除しない)
+HISTORY_RETENTION_DAYS: int = env.int("HISTORY_RETENTION_DAYS", default=365)
+LOGIN_HISTORY_RETENTION_DAYS: int = env.int("LOGIN_HISTORY_RETENTION_DAYS", default=365)
+# 送信済みのメール (メール送信キュー) の保存日数 (0の場合は削除しない)
+EMAIL_OUTBOX_RETENTION_DAYS: int = env.int("EMAIL_OUTBOX_RETENTION_DAYS", default=30)
+# 履歴のアーカイブ (common_history_archiver コマンド)
+# 変更履歴・ログイン履歴をDBから月ごとの圧縮ファイルへ移すまでの日数
+# (上記の保存日数より短くする。保存日数を過ぎた履歴はアーカイブせずに削除される)
+HISTORY_ARCHIVE_AFTER_DAYS: int = env.int("HISTORY_ARCHIVE_AFTER_DAYS", default=90)
+HISTORY_ARCHIVE_DIR: str = env("HISTORY_ARCHIVE_DIR", default=str(BASE_DIR / "archive"))
+# アーカイブファイルの保存日数 (0の場合は削除しない)
+HISTORY_ARCHIVE_RETENTION_DAYS: int = env.int("HISTORY_ARCHIVE_RETENTION_DAYS", default=1825)
+# ジョブランナー (core.utils.job_runner)
+# 実行中・実行待ちのジョブ数の上限 (超えた場合は登録を拒否する)
+JOB_RUNNER_MAX_PENDING: int = env.int("JOB_RUNNER_MAX_PENDING", default=100)
+JOB_RUNNER_TICK_SECONDS: float = 5.0  # 定期ジョブの実行時刻を確認する間隔
+# 定期ジョブのリーダーの有効期限 (リーダーのワーカーが停止した場合、この秒数の経過後に他のワーカーが引き継ぐ)
+JOB_LEADER_LEASE_SECONDS: int = env.int("JOB_LEADER_LEASE_SECONDS", default=30)
+# 定期ジョブ (gunicornの各ワーカーで開始し、リーダーに選出された1ワーカーのみが実行する)
+PERIODIC_JOBS_ENABLED: bool = env.bool("PERIODIC_JOBS_ENABLED", default=False)
+PERIODIC_JOBS = [
+    {
+        "name": "expired_data_sweeper",
+        "func": "core.services.sweeper_service.run_sweeper",
+        "interval": env.int("SWEEPER_JOB_INTERVAL_SECONDS", default=3600),
+    },
+    {
+        "name": "history_archiver",
+        "func": "core.services.archive_service.run_archiver",
+        "interval": env.int("HISTORY_ARCHIVE_JOB_INTERVAL_SECONDS", default=86400),
+    },
+    {
+        # ログイン履歴はワーカーごとに溜めているため、全てのワーカーで実行する
+        "name": "login_history_flush",
+        "func": "core.auth_scheme.login_history_buffer.flush_login_history",
+        "interval": env.float("LOGIN_HISTORY_FLUSH_INTERVAL_SECONDS", default=5.0),
+        "leader_only": False,
+    },
+    {
+        "name": "last_login_flush",
+        "func": "core.auth_scheme.last_login_buffer.flush_last_login",
+        "interval": env.float("LAST_LOGIN_FLUSH_INTERVAL_SECONDS", default=30.0),
+        "leader_only": False,
+    },
+    {
+        "name": "history_flush",
+        "func": "core.utils.history_buffer.flush_history",
+        "interval": env.float("HISTORY_FLUSH_INTERVAL_SECONDS", default=5.0),
+        "leader_only": False,
+    },
+]
+# 変更履歴 (core.models.SelectiveHistoricalRecords)
+# コミット後に非同期でまとめて登録するか (テスト時は保存と同時に登録する)
+# 溜めた履歴は定期ジョブ (history_flush) でも登録するため、定期ジョブが無効な場合は常に保存と同時に登録する
+HISTORY_ASYNC: bool = (
+    False if TESTING or not PERIODIC_JOBS_ENABLED else env.bool("HISTORY_ASYNC", default=False)
+)
+HISTORY_BATCH_SIZE: int = env.int("HISTORY_BATCH_SIZE", default=500)  # 1回に登録する件数
+HISTORY_FLUSH_INTERVAL_SECONDS: float = env.float("HISTORY_FLUSH_INTERVAL_SECONDS", default=5.0)
 # ユーザー認証モデルの設定
 AUTH_USER_MODEL = "account.M_User"
 AUTHENTICATION_BACKENDS = [
     "core.auth_scheme.user_auth_backend.UserAuthBackend",  # カスタム認証バックエンド
 ]
+# 認証済みユーザー (ユーザー + プロフィール) をキャッシュする秒数 (0の場合はキャッシュしない)
+# プロセスごとのキャッシュ (locmem) では、他のワーカーで行った無効化・ロックによる破棄が届かないため、
+# 共有キャッシュ (CACHE_URL=redis:// など) を指定した場合のみ有効にする
+AUTH_USER_CACHE_TIMEOUT: int = (
+    0
+    if CACHES["default"]["BACKEND"]
+    in (
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    )
+    else env.int("AUTH_USER_CACHE_TIMEOUT", default=0)
+)
+# ログイン試行の制限 (core.auth_scheme.login_throttle)
+# 失敗回数を数える期間 (直近の秒数) と、期間内の失敗回数の上限 (メールアドレスごと/IPアドレスごと)
+LOGIN_FAILURE_WINDOW_SECONDS: int = env.int("LOGIN_FAILURE_WINDOW_SECONDS", default=900)
+LOGIN_FAILURE_LIMIT_PER_IDENTIFIER: int = env.int("LOGIN_FAILURE_LIMIT_PER_IDENTIFIER", default=5)
+LOGIN_FAILURE_LIMIT_PER_IP: int = env.int("LOGIN_FAILURE_LIMIT_PER_IP", default=50)
+# メールアドレスごとの上限に達したユーザーを一時ロック (m_user.locked_until_at) する秒数
+LOGIN_LOCKOUT_SECONDS: int = env.int("LOGIN_LOCKOUT_SECONDS", default=900)
+# ログイン履歴の登録 (core.auth_scheme.login_history_buffer)
+# 非同期で登録するか (テスト時はテストのトランザクション内で確認できるよう即時に登録する)
+# 溜めた履歴は定期ジョブ (login_history_flush) でも登録するため、定期ジョブが無効な場合は
+# ログインが途絶えた間・プロセスの強制終了時に失われないよう、常に即時に登録する
+LOGIN_HISTORY_ASYNC: bool = (
+    False
+    if TESTING or not PERIODIC_JOBS_ENABLED
+    else env.bool("LOGIN_HISTORY_ASYNC", default=True)
+)
+LOGIN_HISTORY_BATCH_SIZE: int = env.int("LOGIN_HISTORY_BATCH_SIZE", default=100)  # 1回に登録する件数
+LOGIN_HISTORY_FLUSH_INTERVAL_SECONDS: float = env.float("LOGIN_HISTORY_FLUSH_INTERVAL_SECONDS", default=5.0)
+# 登録できずに溜めておく件数の上限 (超えた場合は古い履歴から破棄する)
+LOGIN_HISTORY_MAX_BUFFER: int = env.int("LOGIN_HISTORY_MAX_BUFFER", default=10000)
+# 最終ログイン日時の更新 (core.auth_scheme.last_login_buffer)
+# 非同期でまとめて更新するか (テスト時は即時に更新する)
+# 溜めた日時は定期ジョブ (last_login_flush) でも反映するため、定期ジョブが無効な場合は
+# ログインが途絶えた間・プロセスの強制終了時に失われないよう、常に即時に更新する
+LAST_LOGIN_ASYNC: bool = (
+    False if TESTING or not PERIODIC_JOBS_ENABLED else env.bool("LAST_LOGIN_ASYNC", default=True)
+)
+LAST_LOGIN_BATCH_SIZE: int = env.int("LAST_LOGIN_BATCH_SIZE", default=500)  # 1回のUPDATEで更新する件数
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS: float = env.float("LAST_LOGIN_FLUSH_INTERVAL_SECONDS", default=30.0)
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -213,12 +367,49 @@ EMAIL_BACKEND = env(
     "EMAIL_BACKEND", default="django.core.mail.backends.console.EmailBackend"
 )
 EMAIL_FROM = env("EMAIL_FROM", default="noreply@example.com")
+# メール送信キュー (common_email_outbox_worker コマンドで送信)
+EMAIL_OUTBOX_BATCH_SIZE: int = env.int("EMAIL_OUTBOX_BATCH_SIZE", default=100)  # 1回の送信件数
+EMAIL_OUTBOX_MAX_ATTEMPTS: int = env.int("EMAIL_OUTBOX_MAX_ATTEMPTS", default=5)  # 再送上限
+EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = env.int("EMAIL_OUTBOX_RETRY_BASE_SECONDS", default=60)
+EMAIL_OUTBOX_RETRY_MAX_SECONDS: int = env.int("EMAIL_OUTBOX_RETRY_MAX_SECONDS", default=3600)
+EMAIL_OUTBOX_LEASE_SECONDS: int = 300  # ワーカー異常終了時に再取得されるまでの時間
 
 # ==============================================================================
 # 8. LOGGING
 # ==============================================================================
 # デバッグログ出力設定フラグ
 IS_DEBUG_LOG_OUTPUT: bool = env.bool("IS_DEBUG_LOG_OUTPUT", default=False)
+# 非同期ログ出力設定 (キュー経由で別スレッドから書き込み、リクエスト処理中にファイルI/Oを行わない)
+LOG_QUEUE_ENABLED: bool = env.bool("LOG_QUEUE_ENABLED", default=True)
+LOG_QUEUE_MAXSIZE: int = env.int("LOG_QUEUE_MAXSIZE", default=10000)  # キューの上限件数
+# キューが満杯の場合の動作 (drop_new: 新しいログを破棄 / drop_oldest: 古いログを破棄 / block: 一定時間待機)
+LOG_QUEUE_DROP_POLICY: str = env("LOG_QUEUE_DROP_POLICY", default="drop_new")
+
+# SQLプロファイラ設定 (core.decorators.logging_sql_queries)
+# 計測する呼び出しの割合 (0.0〜1.0)。本番では低い値にして一部のリクエストのみ計測する
+SQL_PROFILER_SAMPLE_RATE: float = env.float(
+    "SQL_PROFILER_SAMPLE_RATE", default=1.0 if DEBUG else 0.01
+)
+# 出力するフィンガープリントの件数 (DB時間の長い順)
+SQL_PROFILER_TOP_FINGERPRINTS: int = env.int("SQL_PROFILER_TOP_FINGERPRINTS", default=5)
+# 実行したSQLとパラメータをそのまま出力するか (パラメータに個人情報を含むため開発時のみ)
+SQL_PROFILER_LOG_QUERIES: bool = env.bool("SQL_PROFILER_LOG_QUERIES", default=DEBUG)
+# N+1クエリ検出設定 (core.middlewares.n_plus_one_detection_middleware)
+# 検出時の動作 (off: 検出しない / warn: WARNINGログ出力 / raise: 例外を送出)。テスト実行時は常にraise
+N_PLUS_ONE_MODE: str = (
+    "raise" if TESTING else env("N_PLUS_ONE_MODE", default="warn")
+)
+# 同じクエリが同じ呼び出し元からこの回数を超えて実行された場合に検出する
+N_PLUS_ONE_THRESHOLD: int = env.int("N_PLUS_ONE_THRESHOLD", default=5)
+# 計測するリクエストの割合 (0.0〜1.0)。テスト実行時は全リクエストを計測する
+N_PLUS_ONE_SAMPLE_RATE: float = (
+    1.0 if TESTING else env.float("N_PLUS_ONE_SAMPLE_RATE", default=SQL_PROFILER_SAMPLE_RATE)
+)
+# クエリバジェット設定 (core.middlewares.query_budget_middleware)
+# 超過時の動作 (off: 計測しない / warn: WARNINGログ出力 / raise: 例外を送出)。テスト実行時は常にraise
+QUERY_BUDGET_MODE: str = (
+    "raise" if TESTING else env("QUERY_BUDGET_MODE", default="warn")
+)
 
 # ファイル名を読み込み時に固定
 DEBUG_SQL_LOG_FILENAME = (
@@ -17,3 +17,15 @@ class CoreConfig(AppConfig):
         )
 
         validate_required_settings()
+
+        # ログ出力をキュー経由の非同期出力に切り替える
+        from django.conf import settings
+
+        if settings.LOG_QUEUE_ENABLED:
+            from core.utils.queue_logging import setup_queue_logging
+
+            setup_queue_logging(
+                logger_names=list(settings.LOGGING.get("loggers", {})),
+                maxsize=settings.LOG_QUEUE_MAXSIZE,
+                drop_policy=settings.LOG_QUEUE_DROP_POLICY,
+            )
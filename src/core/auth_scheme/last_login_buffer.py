@@ -0,0 +1,96 @@
+import datetime
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Case, DateTimeField, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+from core.utils.write_behind_buffer import WriteBehindBuffer
+
+# 役割: 最終ログイン日時 (m_user.last_login) をユーザーごとにまとめ、一定間隔で1回の UPDATE で反映する。
+# 利用例: user_logged_in シグナル (account.signals.record_last_login) から record() を呼び出す。
+#         モデルの save() を経由しないため、変更履歴 (HistoricalRecords)・更新日時・シグナルは発生しない。
+
+
+class LastLoginBuffer(WriteBehindBuffer):
+    """
+    ユーザーごとの最終ログイン日時を溜めておき、一括で更新するクラス。
+    同じユーザーが間隔内に何度ログインしても、反映するのは最新の日時1件のみとする。
+    """
+
+    job_name = "LastLoginBuffer"
+
+    def __init__(self, batch_size: int = 500, flush_interval: float = 30.0, asynchronous: bool = True):
+        super().__init__(batch_size, flush_interval, asynchronous)
+        self._last_logins: Dict[int, datetime.datetime] = {}
+
+    def record(self, user_id: int, logged_in_at: datetime.datetime) -> None:
+        """ユーザーの最終ログイン日時を追加する"""
+        self.add((user_id, logged_in_at))
+
+    def _append(self, item: Tuple[int, datetime.datetime]) -> None:
+        user_id, logged_in_at = item
+        current = self._last_logins.get(user_id)
+        if current is None or logged_in_at > current:
+            self._last_logins[user_id] = logged_in_at
+
+    def _take(self) -> List[Tuple[int, datetime.datetime]]:
+        last_logins, self._last_logins = self._last_logins, {}
+        return list(last_logins.items())
+
+    def _restore(self, items: List[Tuple[int, datetime.datetime]]) -> None:
+        # 反映に失敗している間に追加された、より新しい日時は残す
+        for item in items:
+            self._append(item)
+
+    def _size(self) -> int:
+        return len(self._last_logins)
+
+    def _write(self, items: List[Tuple[int, datetime.datetime]]) -> None:
+        from core.auth_scheme.user_auth_backend import invalidate_user_caches
+
+        UserModel = get_user_model()
+        for start in range(0, len(items), self.batch_size):
+            chunk = items[start : start + self.batch_size]
+            # 他のワーカーが先に新しい日時を反映していた場合に古い日時で上書きしないよう、大きい方を残す
+            UserModel._base_manager.filter(pk__in=[user_id for user_id, _ in chunk]).update(
+                last_login=Case(
+                    *[
+                        When(
+                            pk=user_id,
+                            then=Greatest(
+                                Coalesce("last_login", Value(logged_in_at)), Value(logged_in_at)
+                            ),
+                        )
+                        for user_id, logged_in_at in chunk
+                    ],
+                    output_field=DateTimeField(),
+                )
+            )
+            invalidate_user_caches([user_id for user_id, _ in chunk])
+
+
+# プロセス内で共有するバッファ (get_last_login_buffer() で初回に作成する)
+_last_login_buffer: Optional[LastLoginBuffer] = None
+_last_login_buffer_lock = threading.Lock()
+
+
+def get_last_login_buffer() -> LastLoginBuffer:
+    """設定値に基づいて作成した、プロセス内で共有する最終ログイン日時のバッファを返す"""
+    global _last_login_buffer
+    with _last_login_buffer_lock:
+        if _last_login_buffer is None:
+            _last_login_buffer = LastLoginBuffer(
+                batch_size=settings.LAST_LOGIN_BATCH_SIZE,
+                flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS,
+                asynchronous=settings.LAST_LOGIN_ASYNC,
+            )
+            _last_login_buffer.register_atexit()
+        return _last_login_buffer
+
+
+def flush_last_login() -> int:
+    """定期ジョブ (settings.PERIODIC_JOBS) から呼び出す、最終ログイン日時の更新処理"""
+    return get_last_login_buffer().flush()
@@ -0,0 +1,117 @@
+import threading
+from typing import List, Optional
+
+from django.conf import settings
+
+from core.consts import LOG_METHOD
+from core.utils.log_helpers import log_output_by_msg_id
+from core.utils.write_behind_buffer import WriteBehindBuffer
+
+# 役割: ログイン履歴 (t_login_history) をプロセス内のバッファに溜め、一定件数・一定間隔ごとにまとめて登録する。
+# 利用例: UserAuthBackend.authenticate() が record() で履歴を追加し、登録はジョブランナーのスレッドで行う
+#         (ログインのリクエストでは INSERT を待たない)。settings.LOGIN_HISTORY_ASYNC が False の場合は即時に登録する。
+
+process_name = "LoginHistoryBuffer"
+
+
+class LoginHistoryBuffer(WriteBehindBuffer):
+    """
+    ログイン履歴を溜めておき、一括で登録するクラス。
+
+    登録できない状態 (ジョブの実行待ちが上限など) が続いた場合は、max_buffer 件を超えた古い履歴から破棄する。
+    """
+
+    job_name = process_name
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        max_buffer: int = 10000,
+        asynchronous: bool = True,
+    ):
+        super().__init__(batch_size, flush_interval, asynchronous)
+        self.max_buffer = max_buffer
+        self._buffer: List = []
+
+    def record(
+        self,
+        login_identifier: str,
+        is_successful: bool,
+        m_user=None,
+        failure_reason: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """ログイン履歴を1件追加する"""
+        from account.models import T_LoginHisory
+
+        self.add(
+            T_LoginHisory(
+                m_user=m_user,
+                login_identifier=(login_identifier or "")[:255],
+                is_successful=is_successful,
+                failure_reason=failure_reason,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                created_method=process_name,
+                updated_method=process_name,
+            )
+        )
+
+    def _append(self, item) -> None:
+        self._buffer.append(item)
+        self._discard_overflow()
+
+    def _take(self) -> List:
+        histories, self._buffer = self._buffer, []
+        return histories
+
+    def _restore(self, items: List) -> None:
+        self._buffer[:0] = items
+        self._discard_overflow()
+
+    def _discard_overflow(self) -> None:
+        """max_buffer 件を超えた古い履歴を破棄する"""
+        overflow = len(self._buffer) - self.max_buffer
+        if overflow > 0:
+            del self._buffer[:overflow]
+            log_output_by_msg_id(
+                log_id="MSGW105",
+                params=[overflow],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+
+    def _size(self) -> int:
+        return len(self._buffer)
+
+    def _write(self, items: List) -> None:
+        from account.models import T_LoginHisory
+
+        # 履歴自体が監査ログのため、変更履歴 (HistoricalRecords) やシグナルは不要
+        T_LoginHisory.objects.bulk_create(items, batch_size=self.batch_size)
+
+
+# プロセス内で共有するバッファ (get_login_history_buffer() で初回に作成する)
+_login_history_buffer: Optional[LoginHistoryBuffer] = None
+_login_history_buffer_lock = threading.Lock()
+
+
+def get_login_history_buffer() -> LoginHistoryBuffer:
+    """設定値に基づいて作成した、プロセス内で共有するログイン履歴のバッファを返す"""
+    global _login_history_buffer
+    with _login_history_buffer_lock:
+        if _login_history_buffer is None:
+            _login_history_buffer = LoginHistoryBuffer(
+                batch_size=settings.LOGIN_HISTORY_BATCH_SIZE,
+                flush_interval=settings.LOGIN_HISTORY_FLUSH_INTERVAL_SECONDS,
+                max_buffer=settings.LOGIN_HISTORY_MAX_BUFFER,
+                asynchronous=settings.LOGIN_HISTORY_ASYNC,
+            )
+            _login_history_buffer.register_atexit()
+        return _login_history_buffer
+
+
+def flush_login_history() -> int:
+    """定期ジョブ (settings.PERIODIC_JOBS) から呼び出す、ログイン履歴の登録処理"""
+    return get_login_history_buffer().flush()
@@ -0,0 +1,54 @@
+from typing import Optional
+
+from django.conf import settings
+
+from core.utils.sliding_window import SlidingWindowCounter
+
+# 役割: ログイン失敗回数をメールアドレス (識別子)・IPアドレスごとにスライディングウィンドウで数え、
+#       上限を超えた試行をパスワードの照合 (ハッシュ計算) の前に拒否する。
+# 利用例: UserAuthBackend.authenticate() が is_throttled() で判定し、失敗時に register_failure() を呼び出す。
+
+
+class LoginThrottle:
+    """
+    ログイン失敗回数の上限を判定するクラス。
+
+    - 識別子ごと: 同じアカウントへのパスワードの総当たりを防ぐ (LOGIN_FAILURE_LIMIT_PER_IDENTIFIER)
+    - IPアドレスごと: 1つのIPアドレスからの多数のアカウントへの試行 (リスト型攻撃) を防ぐ (LOGIN_FAILURE_LIMIT_PER_IP)
+    いずれも直近 LOGIN_FAILURE_WINDOW_SECONDS 秒間の失敗回数で判定する。
+    """
+
+    def __init__(
+        self,
+        window_seconds: Optional[int] = None,
+        identifier_limit: Optional[int] = None,
+        ip_limit: Optional[int] = None,
+    ):
+        window_seconds = window_seconds or settings.LOGIN_FAILURE_WINDOW_SECONDS
+        self.identifier_limit = identifier_limit or settings.LOGIN_FAILURE_LIMIT_PER_IDENTIFIER
+        self.ip_limit = ip_limit or settings.LOGIN_FAILURE_LIMIT_PER_IP
+        self.identifier_counter = SlidingWindowCounter("login_failure_identifier", window_seconds)
+        self.ip_counter = SlidingWindowCounter("login_failure_ip", window_seconds)
+
+    @staticmethod
+    def _normalize(identifier: str) -> str:
+        # 大文字・小文字を変えただけの試行を別の識別子として数えない
+        return identifier.strip().lower()
+
+    def is_throttled(self, identifier: str, ip_address: Optional[str] = None) -> bool:
+        """識別子・IPアドレスのいずれかの失敗回数が上限に達している場合は True を返す"""
+        if self.identifier_counter.count(self._normalize(identifier)) >= self.identifier_limit:
+            return True
+        if ip_address and self.ip_counter.count(ip_address) >= self.ip_limit:
+            return True
+        return False
+
+    def register_failure(self, identifier: str, ip_address: Optional[str] = None) -> float:
+        """失敗回数を加算し、識別子の直近の失敗回数を返す"""
+        if ip_address:
+            self.ip_counter.hit(ip_address)
+        return self.identifier_counter.hit(self._normalize(identifier))
+
+    def reset(self, identifier: str) -> None:
+        """ログイン成功時に識別子の失敗回数を0に戻す (IPアドレスの失敗回数は他のアカウント分を含むため戻さない)"""
+        self.identifier_counter.reset(self._normalize(identifier))
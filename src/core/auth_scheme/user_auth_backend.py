@@ -1,10 +1,23 @@
+from datetime import timedelta
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import BaseBackend
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 
 # --- 共通モジュール ---
+from account.exceptions import LoginThrottledException
+from account.models.m_user import AccountStatus
+from account.models.t_login_history import failureReasons
+from core.auth_scheme.login_history_buffer import get_login_history_buffer
+from core.auth_scheme.login_throttle import LoginThrottle
 from core.consts import LOG_METHOD
 from core.decorators import logging_sql_queries
+from core.middlewares.logging_middleware import get_client_ip
+from core.utils.identity_map import get_current_identity_map
 from core.utils.log_helpers import log_output_by_msg_id
 
 UserModel = get_user_model()
@@ -14,6 +27,35 @@ UserModel = get_user_model()
 メールアドレスを使用して認証を行う (username/user_idは廃止)
 """
 
+# 認証済みユーザーのキャッシュキー
+USER_CACHE_KEY = "auth_user:{0}"
+
+# ログイン中でもセッションを無効にするステータス (一時ロックは第三者の試行でも掛かるため含めない)
+REJECTED_STATUS_CODES = (AccountStatus.FROZEN, AccountStatus.WITHDRAWN)
+
+
+def get_user_cache_key(user_id) -> str:
+    return USER_CACHE_KEY.format(user_id)
+
+
+def invalidate_user_cache(user_id) -> None:
+    """
+    キャッシュしたユーザーを破棄する (M_User / M_UserProfile の保存・削除時にシグナルから呼び出す)。
+    トランザクション中の場合は、コミット前に他のリクエストが古い値を再キャッシュしないよう
+    コミット後にも再度破棄する。
+    """
+    invalidate_user_caches([user_id])
+
+
+def invalidate_user_caches(user_ids) -> None:
+    """キャッシュした複数のユーザーをまとめて破棄する (リポジトリの一括操作から呼び出す)"""
+    cache_keys = [get_user_cache_key(user_id) for user_id in user_ids]
+    if not cache_keys:
+        return
+    cache.delete_many(cache_keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
 
 class UserAuthBackend(BaseBackend):
 
@@ -23,6 +65,13 @@ class UserAuthBackend(BaseBackend):
 
     # 識別子は常に 'username' として渡されるため、そのまま受け取る
     def authenticate(self, request, username=None, password=None, **kwargs):
+        """
+        メールアドレスとパスワードで認証する。
+
+        失敗回数が上限に達した識別子・IPアドレス、一時ロック中のユーザーは、パスワードの照合
+        (ハッシュ計算) を行わずに LoginThrottledException を送出する。
+        成功・失敗はログイン履歴 (t_login_history) に非同期で登録する。
+        """
         # 1. ログイン試行に使用された識別子 (メールアドレス) を取得
         # identifierは adminサイトから渡される 'username' を使用
         identifier = username
@@ -33,8 +82,32 @@ class UserAuthBackend(BaseBackend):
             # 識別子がない場合は認証をスキップ
             return None
 
+        ip_address = get_client_ip(request) if request is not None else None
+        user_agent = request.META.get("HTTP_USER_AGENT") if request is not None else None
+        throttle = LoginThrottle()
+
+        def record_history(is_successful, m_user=None, failure_reason=None):
+            get_login_history_buffer().record(
+                login_identifier=identifier,
+                is_successful=is_successful,
+                m_user=m_user,
+                failure_reason=failure_reason,
+                ip_address=ip_address,
+                user_agent=user_agent,
+            )
+
+        # 2. 失敗回数が上限に達している場合は、DBの検索・パスワードの照合を行わずに拒否する
+        if throttle.is_throttled(identifier, ip_address):
+            log_output_by_msg_id(
+                log_id="MSGW106",
+                params=[identifier, ip_address],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+            record_history(False, failure_reason=failureReasons.LOCKED)
+            raise LoginThrottledException()
+
         try:
-            # 2. メールアドレスでのみユーザーを検索 (username フィールドのロジックは削除)
+            # 3. メールアドレスでのみユーザーを検索 (username フィールドのロジックは削除)
             # email フィールドでのみフィルタリング
             user_model_instance = UserModel.objects.get(
                 email=identifier,
@@ -49,6 +122,9 @@ class UserAuthBackend(BaseBackend):
                 params=[identifier, "（パスワードはログに残さない）"],
                 logger_name=LOG_METHOD.APPLICATION.value,
             )
+            # 存在しないメールアドレスを使った試行もIPアドレスごとの失敗回数に含める
+            throttle.register_failure(identifier, ip_address)
+            record_history(False, failure_reason=failureReasons.PASSWORD_MISMATCH)
             return None
         except UserModel.MultipleObjectsReturned:
             # 複数のユーザーがヒットした場合 (Meta制約が正しければ起こらない)
@@ -60,24 +136,91 @@ class UserAuthBackend(BaseBackend):
             )
             return None
 
-        else:
-            # 3. パスワードチェックと認証成功
-            # パスワードチェックのみに絞り、認証権限チェックを簡略化
-            if user_model_instance.check_password(password):
-                # 認証成功
-                return user_model_instance
-            else:
-                # パスワードが一致しない場合
-                log_output_by_msg_id(
-                    log_id="MSGE101",
-                    params=[identifier, "（パスワードはログに残さない）"],
-                    logger_name=LOG_METHOD.APPLICATION.value,
-                )
-                return None
+        now = timezone.now()
+        # 4. 一時ロック中のユーザーはパスワードを照合しない
+        if self._is_locked(user_model_instance, now):
+            record_history(False, user_model_instance, failureReasons.LOCKED)
+            raise LoginThrottledException()
+
+        # 5. パスワードチェックと認証成功
+        # パスワードチェックのみに絞り、認証権限チェックを簡略化
+        if user_model_instance.check_password(password):
+            # 認証成功
+            throttle.reset(identifier)
+            if user_model_instance.status_code == AccountStatus.TEMPORARY_LOCKED:
+                # ロック期間が終了したユーザーのロックを解除する
+                self._set_lock(user_model_instance, AccountStatus.ACTIVE, None)
+            record_history(True, user_model_instance)
+            return user_model_instance
+
+        # パスワードが一致しない場合
+        log_output_by_msg_id(
+            log_id="MSGE101",
+            params=[identifier, "（パスワードはログに残さない）"],
+            logger_name=LOG_METHOD.APPLICATION.value,
+        )
+        failures = throttle.register_failure(identifier, ip_address)
+        if failures >= throttle.identifier_limit:
+            # キャッシュの失敗回数は期限切れ・キャッシュの再起動で消えるため、DBにもロックを記録する
+            self._set_lock(
+                user_model_instance,
+                AccountStatus.TEMPORARY_LOCKED,
+                now + timedelta(seconds=settings.LOGIN_LOCKOUT_SECONDS),
+            )
+        record_history(False, user_model_instance, failureReasons.PASSWORD_MISMATCH)
+        return None
+
+    @staticmethod
+    def _is_locked(user, now) -> bool:
+        return (
+            user.status_code == AccountStatus.TEMPORARY_LOCKED
+            and user.locked_until_at is not None
+            and user.locked_until_at > now
+        )
+
+    @staticmethod
+    def _set_lock(user, status_code, locked_until_at) -> None:
+        """ステータスとロック解除日時を更新する (変更履歴・キャッシュの破棄はシグナルで行う)"""
+        user.status_code = status_code
+        user.locked_until_at = locked_until_at
+        user.updated_method = "UserAuthBackend"
+        user.save(update_fields=["status_code", "locked_until_at", "updated_method", "updated_at"])
 
     # 必須: 認証成功後にユーザーインスタンスを取得するためのメソッド
     def get_user(self, user_id):
+        """
+        セッションのユーザーIDからユーザーを取得する (認証済みの全リクエストで呼び出される)。
+        無効化 (is_active=False)・凍結・退会済みのユーザーは None を返し、ログアウトさせる。
+        プロフィールも同時に取得した状態で settings.AUTH_USER_CACHE_TIMEOUT 秒キャッシュし、
+        キャッシュが有効な間はユーザー・プロフィールの取得でクエリを発行しない
+        (共有キャッシュを使用する場合のみ。既定では毎回DBから取得する)。
+        DBから取得したユーザーはリクエスト内のアイデンティティマップに登録し、
+        リポジトリが取得済みのプロフィールを再利用できるようにする。
+        """
+        timeout = settings.AUTH_USER_CACHE_TIMEOUT
+        if timeout <= 0:
+            return self._get_user_from_db(user_id)
+
+        cache_key = get_user_cache_key(user_id)
+        user = cache.get(cache_key)
+        if user is None:
+            user = self._get_user_from_db(user_id)
+            if user is not None:
+                cache.set(cache_key, user, timeout)
+        return user
+
+    def _get_user_from_db(self, user_id):
         try:
-            return UserModel.objects.get(pk=user_id)
+            # global_settings (コンテキストプロセッサ) が参照するプロフィールも1クエリで取得する
+            user = (
+                UserModel.objects.select_related("user_profile")
+                .exclude(status_code__in=REJECTED_STATUS_CODES)
+                .get(pk=user_id, is_active=True)
+            )
         except UserModel.DoesNotExist:
             return None
+
+        identity_map = get_current_identity_map()
+        if identity_map is not None:
+            identity_map.add(UserModel, user.pk, user)
+        return user
@@ -1,5 +1,7 @@
 from django.conf import settings
 
+from account.repositories.m_user_profile_repository import M_UserProfileRepository
+
 
 # --------------------------------------------------
 # Context Processor 関数本体(テンプレートに共通的に渡すパラメータ)
@@ -14,10 +16,11 @@ def global_settings(request):
     token_expiry = getattr(settings, "TOKEN_EXPIRY_SECONDS", {})
     
     # プロフィール情報を安全に取得
+    # (リポジトリ経由で取得し、同じリクエスト内でビューが取得したプロフィールを再取得しない)
     user_profile = None
     if is_authenticated:
         try:
-            user_profile = user.user_profile
+            user_profile = M_UserProfileRepository().get_alive_one_or_none(m_user=user.pk)
         except Exception:
             # プロフィールが存在しない場合はNone
             user_profile = None
@@ -0,0 +1,80 @@
+import sqlite3
+from typing import Callable, Dict, List, Union
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+from django.utils.module_loading import import_string
+
+from core.utils.log_helpers import log_output_by_msg_id
+
+# 役割: 本番環境でSQLiteを使用するためのDBバックエンド (settings.DATABASES の ENGINE に "core.db_backends.sqlite3" を指定する)。
+#       接続を開くたびに OPTIONS["pragmas"] のPRAGMAを適用し、OPTIONS["init_hooks"] の関数を呼び出す。
+# 利用例: DATABASES["default"]["OPTIONS"] = {
+#             "pragmas": {"busy_timeout": 5000, "journal_mode": "WAL", "synchronous": "NORMAL"},
+#             "init_hooks": ["myapp.db.register_functions"],
+#         }
+
+PragmaValue = Union[int, str]
+
+# 適用するPRAGMA (この順に適用する。ロック待ちの秒数を先に設定し、WALへの切り替えでもロックの解放を待つ)
+SUPPORTED_PRAGMAS = (
+    "busy_timeout",  # ロックの解放を待つミリ秒数 (待たずに "database is locked" になることを防ぐ)
+    "journal_mode",  # WAL: 読み込みと書き込みが互いをブロックしない (DBファイル単位で永続化される)
+    "synchronous",  # NORMAL: WALではチェックポイント時のみ fsync する (電源断で直近のコミットのみ失われ得る)
+    "cache_size",  # ページキャッシュ (負の値はKiB単位)
+    "mmap_size",  # メモリマップで読み込むバイト数 (0の場合は使用しない)
+    "temp_store",  # 一時テーブル・ソートの保存先 (MEMORY/FILE/DEFAULT)
+)
+
+
+def apply_pragmas(conn: sqlite3.Connection, pragmas: Dict[str, PragmaValue]) -> None:
+    """
+    SQLiteの接続にPRAGMAを適用する (値が None のPRAGMAはSQLiteの既定値のままとする)。
+    ベンチマーク (common_sqlite_benchmark) からも同じ設定で呼び出す。
+    """
+    unknown = set(pragmas) - set(SUPPORTED_PRAGMAS)
+    if unknown:
+        raise ImproperlyConfigured(f"サポートしていないPRAGMAです: {', '.join(sorted(unknown))}")
+
+    for name in SUPPORTED_PRAGMAS:
+        value = pragmas.get(name)
+        if value is None or value == "":
+            continue
+        # PRAGMAはパラメータを使用できないため、数値・英字のみを許可する
+        if not isinstance(value, int) and not str(value).lstrip("-").isalnum():
+            raise ImproperlyConfigured(f"PRAGMA {name} の値が不正です: {value!r}")
+
+        result = conn.execute(f"PRAGMA {name} = {value}").fetchone()
+        if name == "journal_mode" and result and str(result[0]).lower() != str(value).lower():
+            # ネットワークファイルシステムなど、WALを使用できない場合は元のモードのまま動作する
+            log_output_by_msg_id(log_id="MSGW107", params=[value, result[0]])
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    接続ごとにPRAGMAと初期化フックを適用するSQLiteのDBバックエンド。
+
+    - OPTIONS["pragmas"]: 適用するPRAGMA (SUPPORTED_PRAGMAS)。インメモリDB (テスト) では journal_mode を適用しない
+    - OPTIONS["init_hooks"]: 接続 (sqlite3.Connection) を引数に呼び出す関数のドット区切りのパス
+    それ以外の OPTIONS (transaction_mode, init_command, timeout など) はDjango標準のSQLiteバックエンドと同じ。
+    """
+
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        # sqlite3.connect() の引数ではないため取り除く
+        self.pragmas: Dict[str, PragmaValue] = dict(kwargs.pop("pragmas", None) or {})
+        self.init_hooks: List[Callable[[sqlite3.Connection], None]] = [
+            import_string(path) if isinstance(path, str) else path
+            for path in kwargs.pop("init_hooks", None) or []
+        ]
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        pragmas = self.pragmas
+        if self.is_in_memory_db():
+            pragmas = {name: value for name, value in pragmas.items() if name != "journal_mode"}
+        apply_pragmas(conn, pragmas)
+        for hook in self.init_hooks:
+            hook(conn)
+        return conn
@@ -0,0 +1,88 @@
+import random
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# 役割: 書き込みはプライマリ (default)、リポジトリの参照系メソッドの読み込みはリードレプリカに振り分ける。
+# 利用例: ReplicaRoutingMiddleware がリクエストごとに ReadRoutingState を作成し、
+#         BaseRepository が get_read_database() で読み込み先を決める。
+#         リクエスト外 (管理コマンド・ジョブランナー) では状態がないため、常にプライマリから読み込む。
+
+
+@dataclass
+class ReadRoutingState:
+    """1リクエスト分の読み込み先の状態"""
+
+    # プライマリから読み込むか (直前に自分が書き込んだユーザー、POSTなどの更新リクエスト)
+    pinned_to_primary: bool = False
+    # このリクエストで書き込みを行ったか (レスポンスで一定時間プライマリに固定するCookieを設定する)
+    wrote: bool = False
+
+
+_current_read_routing_state: ContextVar[Optional[ReadRoutingState]] = ContextVar(
+    "current_read_routing_state", default=None
+)
+
+
+def activate_read_routing(state: ReadRoutingState) -> Token:
+    return _current_read_routing_state.set(state)
+
+
+def deactivate_read_routing(token: Token) -> None:
+    _current_read_routing_state.reset(token)
+
+
+def get_current_read_routing_state() -> Optional[ReadRoutingState]:
+    return _current_read_routing_state.get()
+
+
+def get_read_database() -> str:
+    """
+    参照系の読み込み先のDBエイリアスを返す。
+
+    以下の場合はプライマリを返す (自分の書き込みを読めない・レプリカの遅延で古い値を読むことを防ぐ)。
+    - レプリカが未設定、またはリクエスト外
+    - リクエストがプライマリに固定されている (更新リクエスト、直前に書き込みを行ったユーザー)
+    - プライマリでトランザクションを実行中
+    """
+    replicas = settings.REPLICA_DATABASES
+    state = _current_read_routing_state.get()
+    if not replicas or state is None or state.pinned_to_primary or state.wrote:
+        return DEFAULT_DB_ALIAS
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return DEFAULT_DB_ALIAS
+    return random.choice(replicas)
+
+
+class PrimaryReplicaRouter:
+    """
+    プライマリ・リードレプリカ構成のDBルーター (settings.DATABASE_ROUTERS)。
+
+    - 書き込みは常にプライマリ。書き込んだリクエストは、以降の読み込みもプライマリに固定する
+    - 読み込み先は指定しない (None)。レプリカへの振り分けは BaseRepository が QuerySet.using() で明示的に行い、
+      それ以外の読み込みはDjangoの既定どおり、関連元のインスタンスのDBまたはプライマリから読み込む
+    - マイグレーションはプライマリのみ (レプリカはプライマリの複製)
+    """
+
+    def db_for_read(self, model, **hints):
+        return None
+
+    def db_for_write(self, model, **hints):
+        state = _current_read_routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.REPLICA_DATABASES}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.REPLICA_DATABASES:
+            return False
+        return None
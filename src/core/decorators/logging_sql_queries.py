@@ -1,21 +1,27 @@
 # utils/decorators.py (修正案)
 
+import random
 from functools import wraps
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable
 
 from django.conf import settings
-from django.db import connection
 
 # --- 共通モジュールの新しいパス ---
 from core.consts import LOG_METHOD
 from core.utils.log_helpers import log_output_by_msg_id
+from core.utils.sql_profiler import QueryProfiler
 
 
 # デコレータを二重にし、引数 (process_name) を受け取れるようにする
 def logging_sql_queries(process_name: str) -> Callable:
     """
-    デコレートされた関数が実行された際に発行されたSQLクエリをキャプチャし、
-    ACCESSロガーまたはAPPLICATIONロガーに出力するデコレータ。
+    デコレートされた関数が実行された際に発行されたSQLクエリを集計し、
+    APPLICATIONロガーに出力するデコレータ。
+
+    本番環境でも動作するサンプリング方式のプロファイラとして動作する。
+    settings.SQL_PROFILER_SAMPLE_RATE の確率で選ばれた呼び出しのみ計測し、
+    クエリ数・DB時間・正規化SQL (フィンガープリント) ごとの実行回数を出力する。
+    選ばれなかった呼び出しは乱数の比較のみで元の関数を実行する。
 
     Args:
         process_name (str): ログのヘッダーに含める処理名。
@@ -24,24 +30,13 @@ def logging_sql_queries(process_name: str) -> Callable:
     # process_name を受け取った後に、実際のデコレータ関数を返す
     def actual_decorator(func: Callable) -> Callable:
 
-        class QueryLogger:
-            """
-            connection.execute_wrapper に渡され、実行されたクエリを収集するクラス
-            """
-
-            def __init__(self):
-                self.queries: List[Tuple[str, Any]] = []
-
-            def __call__(
-                self, execute: Callable, sql: str, params: Any, many: bool, context: Any
-            ) -> Any:
-                """クエリ実行時に呼び出されるフック"""
-                self.queries.append((sql, params))
-                return execute(sql, params, many, context)
-
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
 
+            # サンプリング対象外の場合は計測せずに実行 (パフォーマンスのため)
+            if random.random() >= settings.SQL_PROFILER_SAMPLE_RATE:
+                return func(*args, **kwargs)
+
             # self (Viewインスタンス) を取得
             # *argsの最初の要素がクラスインスタンス(self)であることを想定
             if args and hasattr(args[0], "__class__"):
@@ -50,34 +45,37 @@ def logging_sql_queries(process_name: str) -> Callable:
             else:
                 class_name = "Function"
 
-            logger_instance = QueryLogger()
-
-            # settings.DEBUG が False の場合はロギングをスキップ (パフォーマンスのため)
-            if not settings.DEBUG:
-                return func(*args, **kwargs)
+            profiler = QueryProfiler(keep_queries=settings.SQL_PROFILER_LOG_QUERIES)
 
-            # 1. クエリロガーを接続に設定し、デコレートされた関数を実行
-            with connection.execute_wrapper(logger_instance):
+            # 1. プロファイラを全DB接続に設定し、デコレートされた関数を実行
+            with profiler.install():
                 result = func(*args, **kwargs)
 
             # 2. ロギング処理
-
-            header_message = (
-                f"=== SQL START: {class_name}.{func.__name__} ({process_name}) ==="
-            )
-            footer_message = (
-                f"=== SQL END: Total Queries ({len(logger_instance.queries)}) ==="
-            )
-
-            # --- ヘッダーログ出力 ---
+            # --- 集計結果のログ出力 ---
             log_output_by_msg_id(
-                log_id="MSGI001",
-                params=[header_message],
+                log_id="MSGI004",
+                params=[
+                    process_name,
+                    f"{class_name}.{func.__name__}",
+                    profiler.total_count,
+                    f"{profiler.total_duration * 1000:.2f}",
+                ],
                 logger_name=LOG_METHOD.APPLICATION.value,
             )
+            for stats in profiler.top_stats(settings.SQL_PROFILER_TOP_FINGERPRINTS):
+                log_output_by_msg_id(
+                    log_id="MSGI005",
+                    params=[
+                        stats.count,
+                        f"{stats.duration * 1000:.2f}",
+                        stats.fingerprint,
+                    ],
+                    logger_name=LOG_METHOD.APPLICATION.value,
+                )
 
-            # --- クエリとパラメータのログ出力 ---
-            for sql, params in logger_instance.queries:
+            # --- クエリとパラメータのログ出力 (パラメータに個人情報を含むため開発時のみ) ---
+            for sql, params in profiler.queries:
                 full_sql_message = f"{sql} / Params: {str(params)}"
 
                 log_output_by_msg_id(
@@ -86,13 +84,6 @@ def logging_sql_queries(process_name: str) -> Callable:
                     logger_name=LOG_METHOD.APPLICATION.value,
                 )
 
-            # --- フッターログ出力 ---
-            log_output_by_msg_id(
-                log_id="MSGI001",
-                params=[footer_message],
-                logger_name=LOG_METHOD.APPLICATION.value,
-            )
-
             return result
 
         return wrapper
@@ -87,3 +87,24 @@ class ExternalServiceError(ApplicationError):
 
     default_message = "外部サービスとの連携中に問題が発生しました。"
     message_id = "ERR_EXTERNAL_001"
+
+
+class NPlusOneQueryError(ApplicationError):
+    """1リクエスト内で同じクエリが繰り返し実行された (N+1クエリ)。テスト環境でのみ送出される"""
+
+    default_message = "同じクエリが同じ呼び出し元から繰り返し実行されています（N+1クエリ）。"
+    message_id = "ERR_DEV_001"
+
+
+class QueryBudgetExceededError(ApplicationError):
+    """1リクエストで実行されたクエリ数がビューのクエリバジェットを超えた。テスト環境でのみ送出される"""
+
+    default_message = "ビューに設定されたクエリバジェットを超えてクエリが実行されました。"
+    message_id = "ERR_DEV_002"
+
+
+class JobQueueFullError(ApplicationError):
+    """ジョブランナーの実行中・実行待ちのジョブ数が上限に達したため、ジョブを登録できない"""
+
+    default_message = "実行待ちのジョブが上限に達しているため、ジョブを登録できません。"
+    message_id = "ERR_JOB_001"
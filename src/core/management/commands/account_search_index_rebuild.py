@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from account.search_backends import get_profile_search_backend
+
+
+class Command(BaseCommand):
+    """
+    プロフィール検索インデックスを全件再構築するコマンド。
+    インデックスと m_user_profile の内容がずれた場合 (直接SQLでの更新後など) に使用する。
+
+    【実行方法】
+    python manage.py account_search_index_rebuild
+    """
+
+    help = "プロフィール検索インデックスを全件再構築します。"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="対象のデータベースエイリアス (デフォルト: default)",
+        )
+
+    def handle(self, *args, **options):
+        backend = get_profile_search_backend()
+        using = options["database"]
+
+        self.stdout.write(f"検索バックエンド: {backend.__class__.__name__}")
+
+        with transaction.atomic(using=using):
+            count = backend.rebuild_index(using=using)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"検索インデックスを再構築しました。登録件数: {count}")
+        )
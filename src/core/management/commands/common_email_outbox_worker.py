@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.consts import LOG_METHOD
+from core.services.notification_service import NotificationService
+from core.utils.log_helpers import log_output_by_msg_id
+
+process_name = "EmailOutboxWorker"
+
+
+class Command(BaseCommand):
+    """
+    メール送信キュー (t_email_outbox) に登録されたメールを送信するコマンド。
+    1バッチごとに1つのSMTP接続を使い回して送信し、失敗したメールは指数バックオフで再送する。
+
+    【実行方法】
+    python manage.py common_email_outbox_worker           # 送信対象がなくなるまで処理して終了 (cron向け)
+    python manage.py common_email_outbox_worker --loop    # 常駐して一定間隔でキューを確認する
+    """
+
+    help = "メール送信キューに登録されたメールを送信します。"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="1バッチで送信する件数 (デフォルト: settings.EMAIL_OUTBOX_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="常駐してキューを監視し続ける",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="--loop 指定時、キューが空の場合の待機秒数 (デフォルト: 5秒)",
+        )
+
+    def handle(self, *args, **options):
+        service = NotificationService()
+
+        while True:
+            total_sent, total_failed = 0, 0
+            while True:
+                sent, failed = service.deliver_outbox(
+                    batch_size=options["batch_size"], process_name=process_name
+                )
+                total_sent += sent
+                total_failed += failed
+                # 取得件数が0 (キューが空、または全て再送待ち) になるまで続けて処理する
+                if sent + failed == 0:
+                    break
+
+            if total_sent or total_failed:
+                log_output_by_msg_id(
+                    log_id="MSGI101",
+                    params=[total_sent, total_failed],
+                    logger_name=LOG_METHOD.APPLICATION.value,
+                )
+                self.stdout.write(
+                    f"送信成功: {total_sent}件 送信失敗: {total_failed}件"
+                )
+
+            if not options["loop"]:
+                break
+
+            # 常駐時はDB接続の期限切れ・切断に備えて接続を整理してから待機する
+            close_old_connections()
+            time.sleep(options["interval"])
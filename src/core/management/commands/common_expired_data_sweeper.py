@@ -0,0 +1,77 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.services.sweeper_service import SweeperService
+
+process_name = "ExpiredDataSweeper"
+
+
+class Command(BaseCommand):
+    """
+    期限切れのトークン (t_user_token)・セッション (t_user_session) と、
+    保存期間を過ぎた変更履歴・ログイン履歴・送信済みのメール (t_email_outbox) を少量ずつ削除するコマンド。
+    保存期間は settings.EXPIRED_TOKEN_RETENTION_DAYS / HISTORY_RETENTION_DAYS /
+    LOGIN_HISTORY_RETENTION_DAYS / EMAIL_OUTBOX_RETENTION_DAYS で設定する。
+
+    【実行方法】
+    python manage.py common_expired_data_sweeper              # 1回削除して終了 (cron向け)
+    python manage.py common_expired_data_sweeper --dry-run    # 削除対象の件数のみを表示する
+    python manage.py common_expired_data_sweeper --loop       # 常駐して一定間隔で削除する
+    """
+
+    help = "期限切れのトークン・セッションと、保存期間を過ぎた履歴を削除します。"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="1回のDELETEで削除する件数 (デフォルト: settings.SWEEPER_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--throttle",
+            type=float,
+            default=None,
+            help="バッチ間の待機秒数 (デフォルト: settings.SWEEPER_BATCH_INTERVAL_SECONDS)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="削除せず、削除対象の件数のみを表示する",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="常駐して一定間隔で削除し続ける",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=3600.0,
+            help="--loop 指定時、削除後の待機秒数 (デフォルト: 3600秒)",
+        )
+
+    def handle(self, *args, **options):
+        service = SweeperService()
+
+        if options["dry_run"]:
+            for target in service.get_targets():
+                self.stdout.write(f"{target.name}: 削除対象 {service.count(target)}件")
+            return
+
+        while True:
+            results = service.sweep_all(
+                batch_size=options["batch_size"], interval=options["throttle"]
+            )
+            for name, deleted in results.items():
+                if deleted:
+                    self.stdout.write(f"{name}: {deleted}件を削除しました。")
+
+            if not options["loop"]:
+                break
+
+            # 常駐時はDB接続の期限切れ・切断に備えて接続を整理してから待機する
+            close_old_connections()
+            time.sleep(options["interval"])
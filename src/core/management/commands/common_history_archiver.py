@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from core.services.archive_service import HistoryArchiveService
+
+process_name = "HistoryArchiver"
+
+
+class Command(BaseCommand):
+    """
+    変更履歴 (simple_history) とログイン履歴 (t_login_history) のうち、
+    settings.HISTORY_ARCHIVE_AFTER_DAYS 日より前のレコードを月ごとの圧縮ファイルに書き出し、DBから削除するコマンド。
+    あわせて、保存期間 (settings.HISTORY_ARCHIVE_RETENTION_DAYS) を過ぎたアーカイブファイルを削除する。
+
+    【実行方法】
+    python manage.py common_history_archiver              # アーカイブして終了 (cron向け)
+    python manage.py common_history_archiver --dry-run    # アーカイブ対象の件数のみを表示する
+    """
+
+    help = "古い変更履歴・ログイン履歴を圧縮ファイルに移し、DBから削除します。"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="1回に書き出し・削除する件数 (デフォルト: settings.SWEEPER_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--throttle",
+            type=float,
+            default=None,
+            help="バッチ間の待機秒数 (デフォルト: settings.SWEEPER_BATCH_INTERVAL_SECONDS)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="書き出し・削除せず、アーカイブ対象の件数のみを表示する",
+        )
+
+    def handle(self, *args, **options):
+        service = HistoryArchiveService()
+
+        if options["dry_run"]:
+            for target in service.get_targets():
+                self.stdout.write(f"{target.name}: アーカイブ対象 {service.count(target)}件")
+            return
+
+        results = service.archive_all(
+            batch_size=options["batch_size"], interval=options["throttle"]
+        )
+        for name, archived in results.items():
+            if archived:
+                self.stdout.write(f"{name}: {archived}件をアーカイブしました。")
+
+        for path in service.prune_archives():
+            self.stdout.write(f"{path}: 保存期間を過ぎたため削除しました。")
@@ -0,0 +1,169 @@
+import multiprocessing
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.db_backends.sqlite3.base import apply_pragmas
+
+process_name = "SqliteBenchmark"
+
+# settings で core.db_backends.sqlite3 を使用していない場合に比較するPRAGMA (.env.sample の既定値と同じ)
+DEFAULT_TUNED_PRAGMAS = {
+    "busy_timeout": 5000,
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+    "temp_store": "MEMORY",
+}
+
+
+def _connect(path: str, pragmas: dict) -> sqlite3.Connection:
+    # Djangoの接続と同じく自動コミットで開く (sqlite3.connect の既定のロック待ちは5秒)
+    conn = sqlite3.connect(path, isolation_level=None)
+    apply_pragmas(conn, pragmas)
+    return conn
+
+
+def _run_worker(role, path, pragmas, rows, duration, barrier, results):
+    """1プロセス分の読み込み/書き込みを duration 秒間繰り返し、成功件数とロックエラーの件数を返す"""
+    conn = _connect(path, pragmas)
+    ops = errors = 0
+    # 全プロセスの起動 (Djangoのimport) を待ってから同時に計測を始める
+    barrier.wait()
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        try:
+            if role == "write":
+                # 1リクエスト分の更新 (ATOMIC_REQUESTS と同じく1トランザクションで登録と更新を行う)
+                conn.execute("BEGIN")
+                conn.execute(
+                    "INSERT INTO bench_item (name, value) VALUES (?, ?)",
+                    (f"item-{random.random()}", random.randint(0, 1000)),
+                )
+                conn.execute(
+                    "UPDATE bench_item SET value = value + 1 WHERE id = ?",
+                    (random.randint(1, rows),),
+                )
+                conn.execute("COMMIT")
+            else:
+                # 1リクエスト分の参照 (主キーでの取得と範囲の集計)
+                item_id = random.randint(1, rows)
+                conn.execute("SELECT * FROM bench_item WHERE id = ?", (item_id,)).fetchone()
+                conn.execute(
+                    "SELECT COUNT(*), SUM(value) FROM bench_item WHERE id BETWEEN ? AND ?",
+                    (item_id, item_id + 100),
+                ).fetchone()
+            ops += 1
+        except sqlite3.OperationalError:
+            # "database is locked" など (ロック待ちの上限を超えた)
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+    conn.close()
+    results.put((role, ops, errors))
+
+
+class Command(BaseCommand):
+    """
+    SQLiteの既定の設定と、PRAGMA (WAL・synchronous=NORMAL・mmap_size・cache_size・busy_timeout) を
+    適用した設定で、複数プロセス (gunicornのワーカーを想定) から同時に読み書きしたスループットを比較するコマンド。
+    一時ディレクトリにベンチマーク用のDBを作成するため、アプリケーションのDBには影響しない。
+
+    比較するPRAGMA: settings.DATABASES["default"]["OPTIONS"]["pragmas"] (未設定の場合は DEFAULT_TUNED_PRAGMAS)
+
+    【実行方法】
+    python manage.py common_sqlite_benchmark                                   # 読み込み4・書き込み2プロセスで5秒ずつ計測
+    python manage.py common_sqlite_benchmark --readers 8 --writers 4 --duration 10
+    """
+
+    help = "SQLiteの既定の設定とチューニング後の設定で、同時読み書きのスループットを比較します。"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=4, help="読み込みを行うプロセス数")
+        parser.add_argument("--writers", type=int, default=2, help="書き込みを行うプロセス数")
+        parser.add_argument("--duration", type=float, default=5.0, help="計測する秒数 (設定ごと)")
+        parser.add_argument("--rows", type=int, default=10000, help="事前に登録する件数")
+
+    def handle(self, *args, **options):
+        tuned_pragmas = (
+            settings.DATABASES["default"].get("OPTIONS", {}).get("pragmas") or DEFAULT_TUNED_PRAGMAS
+        )
+        scenarios = [("default", {}), ("tuned", tuned_pragmas)]
+
+        results = {}
+        with tempfile.TemporaryDirectory() as work_dir:
+            for name, pragmas in scenarios:
+                # journal_mode はDBファイルに保存されるため、設定ごとに別のファイルを使用する
+                path = str(Path(work_dir) / f"{name}.sqlite3")
+                self.prepare(path, pragmas, options["rows"])
+                results[name] = self.measure(path, pragmas, options)
+                self.stdout.write(
+                    "{0}: 読み込み {1:.0f}件/秒 書き込み {2:.0f}件/秒 ロックエラー {3}件 (PRAGMA: {4})".format(
+                        name, *results[name], pragmas or "SQLiteの既定値"
+                    )
+                )
+
+        default_reads, default_writes, _ = results["default"]
+        tuned_reads, tuned_writes, _ = results["tuned"]
+        self.stdout.write(
+            "tuned/default: 読み込み {0:.2f}倍 書き込み {1:.2f}倍".format(
+                tuned_reads / default_reads if default_reads else 0,
+                tuned_writes / default_writes if default_writes else 0,
+            )
+        )
+
+    def prepare(self, path: str, pragmas: dict, rows: int) -> None:
+        """ベンチマーク用のテーブルを作成し、事前データを登録する"""
+        conn = _connect(path, pragmas)
+        conn.execute(
+            "CREATE TABLE bench_item (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, value INTEGER)"
+        )
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO bench_item (name, value) VALUES (?, ?)",
+            ((f"item-{index}", index % 1000) for index in range(rows)),
+        )
+        conn.execute("COMMIT")
+        conn.close()
+
+    def measure(self, path: str, pragmas: dict, options: dict) -> tuple:
+        """読み込み・書き込みのプロセスを同時に実行し、(読み込み件数/秒, 書き込み件数/秒, ロックエラー件数) を返す"""
+        # 実行中のプロセスのDB接続・スレッドを引き継がないよう、spawn で起動する
+        context = multiprocessing.get_context("spawn")
+        roles = ["read"] * options["readers"] + ["write"] * options["writers"]
+        barrier = context.Barrier(len(roles))
+        result_queue = context.Queue()
+
+        processes = []
+        for role in roles:
+            process = context.Process(
+                target=_run_worker,
+                args=(
+                    role,
+                    path,
+                    pragmas,
+                    options["rows"],
+                    options["duration"],
+                    barrier,
+                    result_queue,
+                ),
+            )
+            process.start()
+            processes.append(process)
+
+        totals = {"read": 0, "write": 0}
+        errors = 0
+        for _ in processes:
+            role, ops, role_errors = result_queue.get()
+            totals[role] += ops
+            errors += role_errors
+        for process in processes:
+            process.join()
+        duration = options["duration"]
+        return totals["read"] / duration, totals["write"] / duration, errors
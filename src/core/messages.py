@@ -6,8 +6,28 @@ MESSAGES = {
     "MSGI001": "{0}",
     "MSGI002": "サービスが起動されました。",
     "MSGI003": "処理開始します。 処理名: {0} リクエスト内容: {1}",
+    "MSGI004": "SQLプロファイル 処理名: {0} 対象: {1} クエリ数: {2} DB時間: {3}ms",
+    "MSGI005": "SQLプロファイル 実行回数: {0} DB時間: {1}ms SQL: {2}",
+    # メール送信キュー関連のメッセージ
+    "MSGI101": "メール送信キューを処理しました。送信成功: {0}件 送信失敗: {1}件",
+    # 期限切れデータの削除関連のメッセージ
+    "MSGI102": "期限切れデータを削除しました。対象: {0} 削除件数: {1}件",
+    "MSGI103": "履歴をアーカイブしました。対象: {0} 件数: {1}件 出力先: {2}",
+    "MSGI104": "保存期間を過ぎたアーカイブファイルを削除しました。削除件数: {0}件 出力先: {1}",
     # ----- WARNING関連ログメッセージ -----
     "MSGW001": "{0}",
+    # メール送信キュー関連のメッセージ
+    "MSGW101": "メール送信に失敗したため再送を予約しました。キューID: {0} 試行回数: {1} 次回送信日時: {2} 詳細: {3}",
+    # SQL監視関連のメッセージ
+    "MSGW102": "N+1クエリを検出しました。パス: {0} 実行回数: {1} 呼び出し元: {2} SQL: {3} 呼び出し履歴: {4}",
+    "MSGW103": "クエリバジェットを超過しました。パス: {0} ビュー: {1} メソッド: {2} クエリ数: {3} バジェット: {4}",
+    # ジョブランナー関連のメッセージ
+    "MSGW104": "実行待ちのジョブが上限に達したため、定期ジョブの実行を見送りました。ジョブ名: {0} 上限: {1}件",
+    # ログイン関連のメッセージ
+    "MSGW105": "ログイン履歴を登録できないため、古い履歴を破棄しました。破棄件数: {0}件",
+    "MSGW106": "ログインの失敗回数が上限に達したため、ログインを拒否しました。識別子: {0} IPアドレス: {1}",
+    # DB関連のメッセージ
+    "MSGW107": "SQLiteのジャーナルモードを変更できませんでした。指定値: {0} 現在の値: {1}",
     # ... 他のメッセージ定義
     # ----- ERROR関連ログメッセージ -----
     "MSGE001": "{0}",
@@ -37,6 +57,11 @@ MESSAGES = {
     # 初期設定処理専用のエラーメッセージ
     "MSGE801": "初期設定処理中にデータベース整合性エラーが発生しました。ユーザーID: {0} エラーID: {1} 詳細: {2}",
     "MSGE802": "初期設定処理中に外部サービスエラーが発生しました。ユーザーID: {0} エラーID: {1}",
+    # メール送信キュー専用のエラーメッセージ
+    "MSGE901": "メール送信が再送上限に達したため送信を中止しました。キューID: {0} 試行回数: {1} 詳細: {2}",
+    "MSGE902": "メールサーバーへの接続に失敗しました。詳細: {0}",
+    # ジョブランナー専用のエラーメッセージ
+    "MSGE1001": "ジョブの実行中にエラーが発生しました。ジョブ名: {0} 詳細: {1}%s",
 }
 
 
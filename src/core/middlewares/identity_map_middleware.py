@@ -0,0 +1,37 @@
+from typing import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+# --- 共通モジュール ---
+from core.utils.identity_map import (
+    IdentityMap,
+    activate_identity_map,
+    deactivate_identity_map,
+)
+
+"""
+リクエストごとにアイデンティティマップ (取得済みインスタンスの保持領域) を作成するミドルウェア
+"""
+
+
+class IdentityMapMiddleware:
+    """
+    リクエストの処理中 (テンプレートの描画を含む) だけ有効なアイデンティティマップを作成し、
+    request.identity_map とリポジトリから参照できるようにする。
+
+    ログインユーザーは、このリクエストでDBから取得した場合のみ UserAuthBackend.get_user が登録する
+    (キャッシュから復元したユーザーは古い値の可能性があるため登録しない)。
+    AuthenticationMiddleware より後に配置する。
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        identity_map = IdentityMap()
+        request.identity_map = identity_map
+        token = activate_identity_map(identity_map)
+        try:
+            return self.get_response(request)
+        finally:
+            deactivate_identity_map(token)
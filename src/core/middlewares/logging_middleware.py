@@ -49,11 +49,17 @@ class LoggingMiddleware:
         status_code = response.status_code
         t1 = time.time()
 
+        # クエリ数 (QueryBudgetMiddlewareが計測した件数/ビューのクエリバジェット)
+        query_counter = getattr(request, "query_counter", None)
+        query_count = query_counter.count if query_counter is not None else "-"
+        query_budget = set_str_or_none_format(getattr(request, "query_budget", None))
+
         # メッセージ内容の設定
         message = (
             f"{client_ip} {client_host} {http_host} -> {server_name} {server_port} "
             f"{request_method} {path} {status_code} {content_type} "
-            f"size: {content_length} time: {t1 - t0:.4f}"  # 処理時間を小数点以下4桁でフォーマット
+            f"size: {content_length} time: {t1 - t0:.4f} "  # 処理時間を小数点以下4桁でフォーマット
+            f"queries: {query_count}/{query_budget}"
         )
 
         # ステータスコードの判定（200番台はINFO、それ以外はWARNING）
@@ -0,0 +1,79 @@
+import random
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+# --- 共通モジュール ---
+from core.consts import LOG_METHOD
+from core.exceptions import NPlusOneQueryError
+from core.utils.log_helpers import log_output_by_msg_id
+from core.utils.sql_profiler import NPlusOneDetector
+
+"""
+1リクエスト内のN+1クエリを検出するミドルウェア
+"""
+
+# 検出時の動作
+N_PLUS_ONE_MODE_OFF = "off"  # 検出しない
+N_PLUS_ONE_MODE_WARN = "warn"  # WARNINGログを出力する (本番環境)
+N_PLUS_ONE_MODE_RAISE = "raise"  # 例外を送出する (テスト環境)
+
+
+class NPlusOneDetectionMiddleware:
+    """
+    リクエスト処理中 (テンプレートの描画を含む) に実行されたSELECTを、
+    正規化SQL (フィンガープリント) と呼び出し元の組み合わせで集計し、
+    settings.N_PLUS_ONE_THRESHOLD 回を超えたものをN+1クエリとして報告する。
+
+    呼び出し元の取得にはスタックの走査が必要なため、settings.N_PLUS_ONE_SAMPLE_RATE の
+    確率で選ばれたリクエストのみ計測する。
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        mode = settings.N_PLUS_ONE_MODE
+        if mode == N_PLUS_ONE_MODE_OFF or (
+            random.random() >= settings.N_PLUS_ONE_SAMPLE_RATE
+        ):
+            return self.get_response(request)
+
+        detector = NPlusOneDetector(threshold=settings.N_PLUS_ONE_THRESHOLD)
+        with detector.install():
+            response = self.get_response(request)
+
+        detected = detector.find_n_plus_one()
+        if not detected:
+            return response
+
+        if mode == N_PLUS_ONE_MODE_RAISE:
+            raise NPlusOneQueryError(
+                details={
+                    "path": request.path,
+                    "queries": [
+                        {
+                            "count": stats.count,
+                            "call_site": stats.call_site,
+                            "sql": stats.fingerprint,
+                            "stack": stats.stack_summary,
+                        }
+                        for stats in detected
+                    ],
+                }
+            )
+
+        for stats in detected:
+            log_output_by_msg_id(
+                log_id="MSGW102",
+                params=[
+                    request.path,
+                    stats.count,
+                    stats.call_site,
+                    stats.fingerprint,
+                    " <- ".join(stats.stack_summary),
+                ],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+        return response
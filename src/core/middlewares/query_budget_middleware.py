@@ -0,0 +1,94 @@
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+# --- 共通モジュール ---
+from core.consts import LOG_METHOD
+from core.exceptions import QueryBudgetExceededError
+from core.utils.log_helpers import log_output_by_msg_id
+from core.utils.sql_profiler import QueryCounter
+
+"""
+ビューごとに宣言したクエリバジェット (1リクエストで実行してよいクエリ数の上限) を検証するミドルウェア
+"""
+
+# 超過時の動作
+QUERY_BUDGET_MODE_OFF = "off"  # 計測しない
+QUERY_BUDGET_MODE_WARN = "warn"  # WARNINGログを出力する (本番環境)
+QUERY_BUDGET_MODE_RAISE = "raise"  # 例外を送出する (テスト環境)
+
+
+def get_query_budget(view_func: Callable, method: str) -> Optional[int]:
+    """
+    ビューに宣言されたクエリバジェットを取得する。
+
+    クラスベースビューは query_budget クラス属性、関数ビューは関数の query_budget 属性を参照する。
+    値は全メソッド共通の件数 (int)、またはメソッドごとの件数 ({"GET": 5, "POST": 10}) とする。
+    宣言されていない場合はNoneを返す。
+    """
+    view = getattr(view_func, "view_class", view_func)
+    budget = getattr(view, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(method)
+    return budget
+
+
+class QueryBudgetMiddleware:
+    """
+    リクエスト処理中 (セッションの読み書き・テンプレートの描画を含む) に実行されたクエリ数を数え、
+    ビューのクエリバジェットを超えた場合に settings.QUERY_BUDGET_MODE に従って報告する。
+
+    件数はアクセスログ (LoggingMiddleware) にも出力するため、バジェットの有無に関わらず全リクエストで計測する。
+
+    バジェットはビューの query_budget 属性で宣言する (例: query_budget = {"GET": 5, "POST": 10})。
+    値は、各ビューのクエリ数を検証するテスト (*/tests/test_query_budgets.py) で計測した件数に、
+    セッションの更新などで増える分の余裕を加えた件数とする。N+1 などでクエリ数が件数に比例して
+    増えるようになった場合は、テスト環境 (QUERY_BUDGET_MODE=raise) で例外として検出される。
+    SessionMiddleware の保存処理も計測対象とするため、SessionMiddleware より前に配置する。
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        mode = settings.QUERY_BUDGET_MODE
+        if mode == QUERY_BUDGET_MODE_OFF:
+            return self.get_response(request)
+
+        counter = QueryCounter()
+        request.query_counter = counter
+        request.query_budget = None
+        with counter.install():
+            response = self.get_response(request)
+
+        budget = request.query_budget
+        if budget is None or counter.count <= budget:
+            return response
+
+        view_name = getattr(request, "query_budget_view_name", None)
+        if mode == QUERY_BUDGET_MODE_RAISE:
+            raise QueryBudgetExceededError(
+                details={
+                    "path": request.path,
+                    "view": view_name,
+                    "method": request.method,
+                    "count": counter.count,
+                    "budget": budget,
+                }
+            )
+
+        log_output_by_msg_id(
+            log_id="MSGW103",
+            params=[request.path, view_name, request.method, counter.count, budget],
+            logger_name=LOG_METHOD.APPLICATION.value,
+        )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # URL解決後にビューが確定するため、ここでバジェットを取得する
+        if hasattr(request, "query_counter"):
+            view = getattr(view_func, "view_class", view_func)
+            request.query_budget = get_query_budget(view_func, request.method)
+            request.query_budget_view_name = view.__name__
+        return None
@@ -0,0 +1,62 @@
+from typing import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+# --- 共通モジュール ---
+from core.db_router import (
+    ReadRoutingState,
+    activate_read_routing,
+    deactivate_read_routing,
+)
+
+"""
+リクエストごとに読み込み先 (プライマリ/リードレプリカ) の状態を作成するミドルウェア
+"""
+
+# 書き込みを行ったクライアントを一定時間プライマリに固定するCookie
+PRIMARY_STICKY_COOKIE_NAME = "primary_sticky"
+
+# 読み込みのみのメソッド (これ以外のメソッドのリクエストはプライマリから読み込む)
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    リポジトリの参照系メソッドをリードレプリカに振り分けるための状態を作成する (core.db_router)。
+
+    - 更新リクエスト (POSTなど) と、直前に書き込みを行ったクライアント (Cookieあり) はプライマリから読み込む
+    - 書き込みを行ったリクエストのレスポンスでは、settings.READ_YOUR_WRITES_SECONDS 秒間有効なCookieを設定し、
+      レプリカへの反映を待たずに自分の変更を読めるようにする (Read-your-writes)
+    セッションの保存 (書き込み) も対象とするため、SessionMiddleware より前に配置する。
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.REPLICA_DATABASES:
+            return self.get_response(request)
+
+        state = ReadRoutingState(
+            pinned_to_primary=(
+                request.method not in SAFE_METHODS
+                or PRIMARY_STICKY_COOKIE_NAME in request.COOKIES
+            )
+        )
+        token = activate_read_routing(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            deactivate_read_routing(token)
+
+        if state.wrote:
+            response.set_cookie(
+                PRIMARY_STICKY_COOKIE_NAME,
+                "1",
+                max_age=settings.READ_YOUR_WRITES_SECONDS,
+                httponly=True,
+                secure=request.is_secure(),
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='T_EmailOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(db_column='subject', db_comment='件名', max_length=255, verbose_name='件名')),
+                ('body', models.TextField(blank=True, db_column='body', db_comment='本文（プレーンテキスト）', default='', verbose_name='本文（プレーンテキスト）')),
+                ('html_body', models.TextField(blank=True, db_column='html_body', db_comment='本文（HTML）', null=True, verbose_name='本文（HTML）')),
+                ('from_email', models.CharField(db_column='from_email', db_comment='送信元メールアドレス', max_length=254, verbose_name='送信元メールアドレス')),
+                ('recipient_list', models.JSONField(db_column='recipient_list', db_comment='宛先メールアドレスリスト', verbose_name='宛先メールアドレスリスト')),
+                ('status', models.CharField(choices=[('PE', '送信待ち'), ('SE', '送信中'), ('OK', '送信済み'), ('NG', '送信失敗（再送上限到達）')], db_column='status', db_comment='送信状態', default='PE', max_length=2, verbose_name='送信状態')),
+                ('attempt_count', models.IntegerField(db_column='attempt_count', db_comment='送信試行回数', default=0, verbose_name='送信試行回数')),
+                ('next_attempt_at', models.DateTimeField(db_column='next_attempt_at', db_comment='次回送信日時（送信中の場合はワーカーの処理期限）', verbose_name='次回送信日時')),
+                ('sent_at', models.DateTimeField(blank=True, db_column='sent_at', db_comment='送信完了日時', null=True, verbose_name='送信完了日時')),
+                ('last_error', models.TextField(blank=True, db_column='last_error', db_comment='最終エラー内容', null=True, verbose_name='最終エラー内容')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_column='created_at', db_comment='作成日時', null=True, verbose_name='作成日時')),
+                ('created_method', models.CharField(blank=True, db_column='created_method', db_comment='作成処理', max_length=128, null=True, verbose_name='作成処理')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_column='updated_at', db_comment='更新日時', null=True, verbose_name='更新日時')),
+                ('updated_method', models.CharField(blank=True, db_column='updated_method', db_comment='更新処理', max_length=128, null=True, verbose_name='更新処理')),
+                ('deleted_at', models.DateTimeField(blank=True, db_column='deleted_at', db_comment='削除日時', db_default=None, default=None, null=True, verbose_name='削除日時')),
+                ('created_by', models.ForeignKey(blank=True, db_column='created_by', db_comment='作成を行ったユーザー', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='作成者')),
+                ('updated_by', models.ForeignKey(blank=True, db_column='updated_by', db_comment='更新を行ったユーザー', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='更新者')),
+            ],
+            options={
+                'verbose_name': 'メール送信キュートラン',
+                'verbose_name_plural': 'メール送信キュートラン',
+                'db_table': 't_email_outbox',
+                'db_table_comment': 'メール送信キュートラン',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='idx_email_outbox_status_next')],
+            },
+        ),
+    ]
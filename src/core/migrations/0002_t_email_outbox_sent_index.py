@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='t_emailoutbox',
+            index=models.Index(fields=['status', 'sent_at'], name='idx_email_outbox_status_sent'),
+        ),
+    ]
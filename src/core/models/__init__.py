@@ -0,0 +1,4 @@
+# 各アプリのモデルから参照できるように設定/循環インポート対策
+from .base_model import ALIVE_CONDITION, AUDIT_FIELD_NAMES, BaseModel, alive_index
+from .history import SelectiveHistoricalRecords
+from .t_email_outbox import EmailOutboxStatus, T_EmailOutbox
@@ -0,0 +1,180 @@
+import copy
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+# 変更があっても、それだけでは書き込みを行わない監査列
+AUDIT_FIELD_NAMES = frozenset({"updated_by", "updated_at", "updated_method"})
+
+# 論理削除されていない (生存している) レコードの条件 (BaseRepository._get_alive_queryset と同じ条件)
+ALIVE_CONDITION = Q(deleted_at__isnull=True)
+
+
+def alive_index(*fields: str, name: str) -> models.Index:
+    """
+    論理削除されていないレコードのみを対象とする (WHERE deleted_at IS NULL の) 部分インデックスを返す。
+    BaseModel を継承したモデルの Meta.indexes で、生存しているレコードの検索条件の列を指定して使用する。
+
+    削除済みのレコードをインデックスに含めないため、論理削除が増えてもインデックスは肥大化しない。
+    ※部分インデックスに対応していないDB (MySQLなど) では、Djangoはインデックスを作成しない。
+
+    使用例:
+        indexes = [alive_index("is_public", "created_at", name="idx_user_profile_public")]
+    """
+    return models.Index(fields=list(fields), name=name, condition=ALIVE_CONDITION)
+
+
+def _copy_value(value: Any) -> Any:
+    # JSONFieldなどの可変な値は、後からの変更を検出できるように複製して保持する
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+class BaseModel(models.Model):
+    # created_by = models.CharField(db_column='created_by', verbose_name='作成者', db_comment='作成者', max_length=32, null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,  # M_Userモデルを参照
+        db_column="created_by",
+        verbose_name="作成者",
+        db_comment="作成を行ったユーザー",
+        related_name="%(app_label)s_%(class)s_created",  # 関連名の一意性を確保
+        on_delete=models.SET_NULL,  # ユーザーが消えてもデータは残す
+        null=True,
+        blank=True,
+    )
+    # auto_now_add はインスタンスの作成(DBにINSERT)する度に更新
+    # created_at = models.DateTimeField(db_column='created_at', verbose_name='作成日時', db_comment='作成日時', auto_now_add=True, null=True, blank=True)
+    created_at = models.DateTimeField(
+        db_column="created_at",
+        verbose_name="作成日時",
+        db_comment="作成日時",
+        null=True,
+        blank=True,
+        auto_now_add=True,
+    )
+    created_method = models.CharField(
+        db_column="created_method",
+        verbose_name="作成処理",
+        db_comment="作成処理",
+        max_length=128,
+        null=True,
+        blank=True,
+    )
+    # updated_by = models.CharField(db_column='updated_by', verbose_name='更新者', db_comment='更新者', max_length=32, null=True, blank=True)
+    updated_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        db_column="updated_by",
+        verbose_name="更新者",
+        db_comment="更新を行ったユーザー",
+        related_name="%(app_label)s_%(class)s_updated",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    # auto_now=Trueの場合はモデルインスタンスを保存する度に現在の時間で更新
+    # updated_at = models.DateTimeField(db_column='updated_at', verbose_name='更新日時', db_comment='更新日時', auto_now=True, null=True, blank=True)
+    updated_at = models.DateTimeField(
+        db_column="updated_at",
+        verbose_name="更新日時",
+        db_comment="更新日時",
+        null=True,
+        blank=True,
+        auto_now=True,
+    )
+    updated_method = models.CharField(
+        db_column="updated_method",
+        verbose_name="更新処理",
+        db_comment="更新処理",
+        max_length=128,
+        null=True,
+        blank=True,
+    )
+    deleted_at = models.DateTimeField(
+        db_column="deleted_at",
+        verbose_name="削除日時",
+        db_comment="削除日時",
+        null=True,
+        blank=True,
+        db_default=None,
+        default=None,
+    )
+
+    class Meta:
+        abstract = True
+
+    # ------------------------------------------------------------------
+    # 変更された列の追跡 (DBから読み込んだ時点・保存した時点の値との差分)
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._take_loaded_snapshot()
+        return instance
+
+    def _take_loaded_snapshot(self, field_names: Optional[List[str]] = None) -> None:
+        """DBと一致している列の値を保持する (field_names を省略した場合は読み込み済みの全列)"""
+        if field_names is None or not hasattr(self, "_loaded_values"):
+            self._loaded_values: Dict[str, Any] = {}
+            field_names = None
+        deferred = self.get_deferred_fields()
+        for field in self._meta.concrete_fields:
+            if field.attname in deferred:
+                # 遅延読み込み (only/defer) の列は参照するとクエリが発行されるため対象外とする
+                continue
+            if field_names is None or field.name in field_names or field.attname in field_names:
+                self._loaded_values[field.attname] = _copy_value(getattr(self, field.attname))
+
+    def get_dirty_fields(self) -> List[str]:
+        """DBから読み込んだ (または保存した) 時点から値が変わった列の名前を返す"""
+        loaded_values = getattr(self, "_loaded_values", None)
+        deferred = self.get_deferred_fields()
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.attname not in deferred
+            and (
+                loaded_values is None
+                or field.attname not in loaded_values
+                or loaded_values[field.attname] != getattr(self, field.attname)
+            )
+        ]
+
+    def has_changes(self) -> bool:
+        """監査列 (更新者・更新日時・更新処理) 以外に変更された列があるか"""
+        return bool(set(self.get_dirty_fields()) - AUDIT_FIELD_NAMES)
+
+    def save_dirty_fields(self, using: Optional[str] = None) -> bool:
+        """
+        変更された列のみを UPDATE ... SET で保存する。
+        監査列以外に変更がない場合は保存せず False を返す (未登録のインスタンスは通常どおりINSERTする)。
+        """
+        if self._state.adding:
+            self.save(using=using)
+            return True
+        if not self.has_changes():
+            return False
+
+        # save(update_fields=...) では auto_now の列 (更新日時) も指定しないと更新されない
+        auto_now_fields = {
+            field.name
+            for field in self._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+        }
+        self.save(
+            using=using,
+            update_fields=sorted(set(self.get_dirty_fields()) | auto_now_fields),
+        )
+        return True
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # 保存した列はDBと一致したため、変更の追跡を保存後の値から再開する
+        self._take_loaded_snapshot(kwargs.get("update_fields"))
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self._take_loaded_snapshot(fields)
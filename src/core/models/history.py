@@ -0,0 +1,102 @@
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from simple_history.models import HistoricalRecords
+from simple_history.signals import pre_create_historical_record
+
+from core.models.base_model import AUDIT_FIELD_NAMES
+
+
+class SelectiveHistoricalRecords(HistoricalRecords):
+    """
+    変更された列に応じて履歴の登録を判断する HistoricalRecords。
+
+    - tracked_fields: 指定した場合、これらの列が変更された更新のみ履歴を登録する
+    - ignored_fields: これらの列 (と監査列) のみが変更された更新では履歴を登録しない
+      (last_login のように頻繁に変わる列の更新で、全列分の履歴が増えないようにする)
+    - 新規作成・削除は常に登録する。変更された列は BaseModel.get_dirty_fields() で判定する
+    - settings.HISTORY_ASYNC が True の場合は、トランザクションのコミット後に HistoryBuffer に追加し、
+      ジョブランナーのスレッドで一括登録する (post_create_historical_record シグナルは送信しない)
+
+    ※履歴テーブルの列は変わらない (列自体を履歴から除外する場合は excluded_fields を使用する)。
+
+    使用例:
+        history = SelectiveHistoricalRecords(ignored_fields=["last_login"])
+    """
+
+    def __init__(
+        self,
+        *args,
+        tracked_fields: Optional[Iterable[str]] = None,
+        ignored_fields: Iterable[str] = (),
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.tracked_fields = frozenset(tracked_fields) if tracked_fields is not None else None
+        self.ignored_fields = frozenset(ignored_fields) | AUDIT_FIELD_NAMES
+
+    def post_save(self, instance, created, using=None, **kwargs):
+        if not created and not self.has_tracked_changes(instance, kwargs.get("update_fields")):
+            return
+        super().post_save(instance, created, using=using, **kwargs)
+
+    def has_tracked_changes(self, instance, update_fields=None) -> bool:
+        """履歴を登録する対象の列が変更されたか (変更を追跡できないモデルは常に True)"""
+        if not hasattr(instance, "get_dirty_fields"):
+            return True
+
+        changed = set(instance.get_dirty_fields())
+        if update_fields is not None:
+            # update_fields に含まれない列はDBに保存されないため、変更に含めない
+            changed &= {
+                field.name
+                for field in instance._meta.concrete_fields
+                if field.name in update_fields or field.attname in update_fields
+            }
+        if self.tracked_fields is not None:
+            return bool(changed & self.tracked_fields)
+        return bool(changed - self.ignored_fields)
+
+    def create_historical_record(self, instance, history_type, using=None):
+        if not settings.HISTORY_ASYNC or self.m2m_fields:
+            return super().create_historical_record(instance, history_type, using=using)
+
+        using = using if self.use_base_model_db else None
+        history_date = getattr(instance, "_history_date", timezone.now())
+        history_user = self.get_history_user(instance)
+        history_change_reason = self.get_change_reason_for_object(
+            instance, history_type, using
+        )
+        manager = getattr(instance, self.manager_name)
+
+        # 保存時点の値を登録するため、ここで値を複写しておく
+        attrs = {
+            field.attname: getattr(instance, field.attname)
+            for field in self.fields_included(instance)
+        }
+        history_instance = manager.model(
+            history_date=history_date,
+            history_type=history_type,
+            history_user=history_user,
+            history_change_reason=history_change_reason,
+            **attrs,
+        )
+        pre_create_historical_record.send(
+            sender=manager.model,
+            instance=instance,
+            history_date=history_date,
+            history_user=history_user,
+            history_change_reason=history_change_reason,
+            history_instance=history_instance,
+            using=using,
+        )
+
+        from core.utils.history_buffer import get_history_buffer
+
+        # ロールバックされた変更の履歴を登録しないよう、コミット後にバッファに追加する
+        transaction.on_commit(
+            lambda: get_history_buffer().record(history_instance, using), using=using
+        )
+
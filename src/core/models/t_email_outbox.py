@@ -0,0 +1,184 @@
+from django.conf import settings
+from django.db import models
+
+from core.models.base_model import BaseModel
+
+
+class EmailOutboxStatus(models.TextChoices):
+    PENDING = "PE", "送信待ち"
+    SENDING = "SE", "送信中"
+    SENT = "OK", "送信済み"
+    FAILED = "NG", "送信失敗（再送上限到達）"
+
+
+# メール送信キュートラン
+class T_EmailOutbox(BaseModel):
+    """
+    送信予定のメールを保持するアウトボックステーブル。
+
+    業務処理と同じトランザクションで登録し、コミットされたメールのみを
+    ワーカーコマンド (common_email_outbox_worker) がまとめて送信する。
+    リクエスト処理中にSMTP通信を行わないため、メールサーバーの遅延が画面応答に影響しない。
+    """
+
+    # Fields
+    # ID (BIGINT PRIMARY KEY) はDjangoが自動で付与
+    # 件名
+    subject = models.CharField(
+        db_column="subject",
+        verbose_name="件名",
+        db_comment="件名",
+        max_length=255,
+    )
+    # 本文（プレーンテキスト）
+    body = models.TextField(
+        db_column="body",
+        verbose_name="本文（プレーンテキスト）",
+        db_comment="本文（プレーンテキスト）",
+        blank=True,
+        default="",
+    )
+    # 本文（HTML）
+    html_body = models.TextField(
+        db_column="html_body",
+        verbose_name="本文（HTML）",
+        db_comment="本文（HTML）",
+        null=True,
+        blank=True,
+    )
+    # 送信元メールアドレス
+    from_email = models.CharField(
+        db_column="from_email",
+        verbose_name="送信元メールアドレス",
+        db_comment="送信元メールアドレス",
+        max_length=254,
+    )
+    # 宛先メールアドレスリスト
+    recipient_list = models.JSONField(
+        db_column="recipient_list",
+        verbose_name="宛先メールアドレスリスト",
+        db_comment="宛先メールアドレスリスト",
+    )
+    # 送信状態
+    status = models.CharField(
+        db_column="status",
+        verbose_name="送信状態",
+        db_comment="送信状態",
+        max_length=2,
+        choices=EmailOutboxStatus.choices,
+        default=EmailOutboxStatus.PENDING,
+    )
+    # 送信試行回数
+    attempt_count = models.IntegerField(
+        db_column="attempt_count",
+        verbose_name="送信試行回数",
+        db_comment="送信試行回数",
+        default=0,
+    )
+    # 次回送信日時（送信中の場合はワーカーの処理期限）
+    next_attempt_at = models.DateTimeField(
+        db_column="next_attempt_at",
+        verbose_name="次回送信日時",
+        db_comment="次回送信日時（送信中の場合はワーカーの処理期限）",
+    )
+    # 送信完了日時
+    sent_at = models.DateTimeField(
+        db_column="sent_at",
+        verbose_name="送信完了日時",
+        db_comment="送信完了日時",
+        null=True,
+        blank=True,
+    )
+    # 最終エラー内容
+    last_error = models.TextField(
+        db_column="last_error",
+        verbose_name="最終エラー内容",
+        db_comment="最終エラー内容",
+        null=True,
+        blank=True,
+    )
+    # --- 各テーブル共通(AbstractBaseModelは列順が変わってしまうので使用しない) ---
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,  # M_Userモデルを参照
+        db_column="created_by",
+        verbose_name="作成者",
+        db_comment="作成を行ったユーザー",
+        related_name="%(app_label)s_%(class)s_created",  # 関連名の一意性を確保
+        on_delete=models.SET_NULL,  # ユーザーが消えてもデータは残す
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        db_column="created_at",
+        verbose_name="作成日時",
+        db_comment="作成日時",
+        null=True,
+        blank=True,
+        auto_now_add=True,
+    )
+    created_method = models.CharField(
+        db_column="created_method",
+        verbose_name="作成処理",
+        db_comment="作成処理",
+        max_length=128,
+        null=True,
+        blank=True,
+    )
+    updated_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        db_column="updated_by",
+        verbose_name="更新者",
+        db_comment="更新を行ったユーザー",
+        related_name="%(app_label)s_%(class)s_updated",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    updated_at = models.DateTimeField(
+        db_column="updated_at",
+        verbose_name="更新日時",
+        db_comment="更新日時",
+        null=True,
+        blank=True,
+        auto_now=True,
+    )
+    updated_method = models.CharField(
+        db_column="updated_method",
+        verbose_name="更新処理",
+        db_comment="更新処理",
+        max_length=128,
+        null=True,
+        blank=True,
+    )
+    deleted_at = models.DateTimeField(
+        db_column="deleted_at",
+        verbose_name="削除日時",
+        db_comment="削除日時",
+        null=True,
+        blank=True,
+        db_default=None,
+        default=None,
+    )
+    # --- 各テーブル共通 ---
+
+    # テーブル名
+    class Meta:
+        db_table = "t_email_outbox"
+        db_table_comment = "メール送信キュートラン"
+        verbose_name = "メール送信キュートラン"
+        verbose_name_plural = "メール送信キュートラン"
+        indexes = [
+            # ワーカーが送信対象 (状態 + 次回送信日時) を取得するためのインデックス
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="idx_email_outbox_status_next",
+            ),
+            # 保存期間を過ぎた送信済みのメール (状態 + 送信完了日時) を削除するためのインデックス
+            models.Index(
+                fields=["status", "sent_at"],
+                name="idx_email_outbox_status_sent",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.pk}/{self.subject}"
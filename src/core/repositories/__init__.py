@@ -0,0 +1,10 @@
+# 各アプリのリポジトリから参照できるように設定/循環インポート対策
+from .base_repository import (
+    COUNT_MODE_APPROXIMATE,
+    COUNT_MODE_EXACT,
+    COUNT_MODE_NONE,
+    BaseRepository,
+    KeysetPage,
+)
+from .t_email_outbox_repository import T_EmailOutboxRepository
+from .unit_of_work import UnitOfWork, get_current_unit_of_work, unit_of_work
@@ -0,0 +1,721 @@
+import datetime
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F, Model, Q, QuerySet
+from django.utils import timezone
+from simple_history.exceptions import NotHistoricalModelError
+from simple_history.utils import (
+    bulk_create_with_history,
+    bulk_update_with_history,
+    get_history_manager_for_model,
+)
+
+from core.db_router import get_read_database
+from core.models import AUDIT_FIELD_NAMES
+from core.utils.chunked_iterator import DEFAULT_CHUNK_SIZE, iterate_in_chunks, iterate_records
+
+from .unit_of_work import get_current_unit_of_work, unit_of_work
+
+# キーセットページネーションのカーソル署名に使用するソルト
+KEYSET_CURSOR_SALT = "core.repositories.keyset_cursor"
+
+# 件数の取得方法
+COUNT_MODE_NONE = "none"  # 件数を取得しない
+COUNT_MODE_EXACT = "exact"  # COUNT(*) で正確な件数を取得する
+COUNT_MODE_APPROXIMATE = "approximate"  # 上限付きで件数を取得する (上限を超えた場合は「上限+」扱い)
+
+# 一括操作で1回のSQLにまとめる件数
+DEFAULT_BULK_BATCH_SIZE = 1000
+
+
+@dataclass
+class KeysetPage:
+    """キーセットページネーションの1ページ分の結果"""
+
+    object_list: List[Model] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    # 件数 (COUNT_MODE_NONE の場合は None)
+    count: Optional[int] = None
+    # 件数が正確な値か (False の場合、count は上限値で実際はそれ以上)
+    is_count_exact: bool = True
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.prev_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class BaseRepository:
+    """全てのモデルで共通のCRUD/論理削除ロジックを提供する基底クラス"""
+
+    model: type[Model] = None
+
+    def __init__(self):
+        if self.model is None:
+            raise NotImplementedError(
+                "BaseRepositoryを継承する際は、model属性を設定してください。"
+            )
+
+    # ------------------------------------------------------------------
+    # 内部メソッド: QuerySetのベースを定義
+    # ------------------------------------------------------------------
+
+    def _get_alive_queryset(self) -> QuerySet:
+        """論理削除されていないレコードのみを取得するQuerySet (内部利用)"""
+        return self.model.objects.filter(deleted_at__isnull=True)
+
+    def _get_deleted_queryset(self) -> QuerySet:
+        """論理削除されたレコードのみを取得するQuerySet (内部利用)"""
+        return self.model.objects.filter(deleted_at__isnull=False)
+
+    def _get_all_queryset(self) -> QuerySet:
+        """論理削除済みを含む全てのレコードを取得するQuerySet (内部利用)"""
+        return self.model.objects.all()
+
+    def _get_alive_read_queryset(self) -> QuerySet:
+        """
+        参照系メソッド用の、論理削除されていないレコードのQuerySet (内部利用)。
+        リードレプリカが設定されている場合はレプリカから読み込む (読み込み先は core.db_router.get_read_database)。
+        ※返したQuerySetでは update() / delete() を行わない (レプリカに書き込もうとするため)
+        """
+        queryset = self._get_alive_queryset()
+        if get_current_unit_of_work() is not None:
+            # ユニットオブワークで更新するインスタンスは、最新の値をプライマリから読み込む
+            return queryset
+        alias = get_read_database()
+        if alias == DEFAULT_DB_ALIAS:
+            return queryset
+        return queryset.using(alias)
+
+    def _track(self, instance: Model | None) -> Model | None:
+        """ユニットオブワークが有効な場合、読み込んだインスタンスを登録する (内部利用)"""
+        uow = get_current_unit_of_work()
+        if uow is not None:
+            uow.register(instance)
+        return instance
+
+    # ------------------------------------------------------------------
+    # 外部公開メソッド: ユニットオブワーク
+    # ------------------------------------------------------------------
+
+    def unit_of_work(self, using: Optional[str] = None):
+        """
+        ユニットオブワークを開始する (with文で使用)。
+
+        ブロック内で取得したインスタンスの update() / soft_delete() / restore() は即時保存せず、
+        ブロックを抜けた時点で変更された列のみを1行1回のUPDATEで書き込む。
+        ブロック内で変更後の値を条件に検索する場合は、先に flush() を呼び出すこと。
+
+        使用例:
+            with self.user_repo.unit_of_work() as uow:
+                profile = self.profile_repo.get_alive_one_or_none(m_user=user.pk)
+                self.profile_repo.update(profile, display_name=display_name)
+                self.user_repo.update(user, is_first_login=False)
+        """
+        return unit_of_work(using=using)
+
+    # ------------------------------------------------------------------
+    # 外部公開メソッド: 主キー検索
+    # ------------------------------------------------------------------
+
+    def get_alive_by_pk(self, pk: int) -> Model | None:
+        """主キーで生存している（論理削除されていない）レコードを取得"""
+        try:
+            # 論理削除されていないことを確認
+            return self._track(self._get_alive_read_queryset().get(pk=pk))
+        except self.model.DoesNotExist:
+            return None
+
+    def get_deleted_by_pk(self, pk: int) -> Model | None:
+        """主キーで論理削除されたレコードのみを取得"""
+        try:
+            # 論理削除フラグが立っていることを確認
+            return self._track(self._get_deleted_queryset().get(pk=pk))
+        except self.model.DoesNotExist:
+            return None
+
+    def get_all_by_pk(self, pk: int) -> Model | None:  # ★ 新規追加
+        """主キーで、論理削除の状態を問わず存在するレコードを取得"""
+        try:
+            # フィルタリングなしのQuerySetで検索
+            return self._track(self._get_all_queryset().get(pk=pk))
+        except self.model.DoesNotExist:
+            return None
+
+    # ------------------------------------------------------------------
+    # 外部公開メソッド: 単一取得（条件検索）
+    # ------------------------------------------------------------------
+
+    def get_alive_one_or_none(self, **kwargs) -> Model | None:
+        """論理削除されていないレコードから、条件で1件取得"""
+        try:
+            # 論理削除されていないQuerySetをベースにgetを呼び出す
+            return self._track(self._get_alive_read_queryset().get(**kwargs))
+        except self.model.DoesNotExist:
+            return None
+
+    def get_deleted_one_or_none(self, **kwargs) -> Model | None:
+        """論理削除されたレコードから、条件で1件取得"""
+        try:
+            # 論理削除フラグが立っているQuerySetをベースにgetを呼び出す
+            return self._track(self._get_deleted_queryset().get(**kwargs))
+        except self.model.DoesNotExist:
+            return None
+
+    def get_all_one_or_none(self, **kwargs) -> Model | None:
+        """論理削除の状態を問わず存在するレコードから、条件で1件取得"""
+        try:
+            # フィルタリングなしのQuerySetをベースにgetを呼び出す
+            return self._track(self._get_all_queryset().get(**kwargs))
+        except self.model.DoesNotExist:
+            return None
+
+    # ------------------------------------------------------------------
+    # 外部公開メソッド: 全件検索
+    # ------------------------------------------------------------------
+
+    def get_alive_records(self) -> QuerySet:
+        """全てのアクティブ（論理削除されていない）なレコードを取得"""
+        return self._get_alive_read_queryset().all()
+
+    def get_deleted_records(self) -> QuerySet:
+        """論理削除された（deleted_at IS NOT NULL）レコードのみを全て取得する。"""
+        return self._get_deleted_queryset().all()
+
+    def get_all_records(self) -> QuerySet:
+        """全ての論理削除の状態を問わず存在するレコードを取得"""
+        return self._get_all_queryset().all()
+
+    # ------------------------------------------------------------------
+    # 外部公開メソッド: 全件走査 (主キー順に一定件数ずつ取得する)
+    # ------------------------------------------------------------------
+    # 大量のレコードを扱うバッチ処理で使用する。取得したインスタンスはユニットオブワークに登録しない。
+
+    def iter_chunks(
+        self,
+        queryset: Optional[QuerySet] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        only: Optional[Sequence[str]] = None,
+    ) -> Iterator[List[Model]]:
+        """
+        レコードを主キーの昇順に chunk_size 件ずつのリストで取得する
+        (queryset を省略した場合は論理削除されていないレコード)。
+
+        チャンクごとに bulk_update() などで書き込む処理に使用する。
+        only には処理で参照する列を指定し、不要な列 (長いテキストなど) を読み込まないようにする。
+        """
+        if queryset is None:
+            queryset = self._get_alive_queryset()
+        return iterate_in_chunks(queryset, chunk_size=chunk_size, only=only)
+
+    def iter_alive_records(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, only: Optional[Sequence[str]] = None
+    ) -> Iterator[Model]:
+        """論理削除されていないレコードを、主キー順に chunk_size 件ずつ取得しながら1件ずつ返す"""
+        return iterate_records(self._get_alive_queryset(), chunk_size=chunk_size, only=only)
+
+    def iter_all_records(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, only: Optional[Sequence[str]] = None
+    ) -> Iterator[Model]:
+        """論理削除の状態を問わず、主キー順に chunk_size 件ずつ取得しながら1件ずつ返す"""
+        return iterate_records(self._get_all_queryset(), chunk_size=chunk_size, only=only)
+
+    # ------------------------------------------------------------------
+    # 外部公開メソッド: データ操作
+    # ------------------------------------------------------------------
+
+    def create(self, **kwargs) -> Model:
+        """レコードの作成"""
+        # 単純なModel Managerのcreateをラップ (主キーが必要なためユニットオブワーク内でも即時INSERTする)
+        return self._track(self.model.objects.create(**kwargs))
+
+    def update(self, instance: Model, **kwargs) -> Model:
+        """レコードの更新"""
+        # 既存のインスタンスの属性を更新する
+        for key, value in kwargs.items():
+            setattr(instance, key, value)
+
+        uow = get_current_unit_of_work()
+        if uow is not None:
+            # ユニットオブワーク内では登録のみ行い、書き込みはコミット時にまとめて行う
+            uow.register(instance)
+            return instance
+
+        # 変更された列のみを保存する (監査列以外に変更がない場合は書き込み・履歴の登録を行わない)
+        instance.save_dirty_fields()
+        return instance
+
+    def soft_delete(self, instance: Model, user: Model, process_name: str):
+        """レコードの論理削除 (deleted_atを設定)"""
+        if hasattr(instance, "deleted_at"):
+            uow = get_current_unit_of_work()
+            if uow is not None:
+                uow.register(instance)
+            instance.deleted_at = timezone.now()
+            # 削除者・削除処理の列は持たないため、更新者・更新処理として記録する
+            instance.updated_by = user
+            instance.updated_method = process_name
+            if uow is None:
+                instance.save(
+                    update_fields=["deleted_at", "updated_by", "updated_at", "updated_method"]
+                )
+
+    def hard_delete(self, instance: Model):
+        """レコードの物理削除"""
+        uow = get_current_unit_of_work()
+        if uow is not None:
+            uow.discard(instance)
+        instance.delete()
+
+    def restore(self, instance: Model, user: Model, process_name: str):
+        """レコードの復元 (deleted_atをNULLに)"""
+        if hasattr(instance, "deleted_at"):
+            uow = get_current_unit_of_work()
+            if uow is not None:
+                uow.register(instance)
+            instance.deleted_at = None
+            # 削除者・削除処理の列は持たないため、更新者・更新処理として記録する
+            instance.updated_by = user
+            instance.updated_method = process_name
+            if uow is None:
+                instance.save(
+                    update_fields=["deleted_at", "updated_by", "updated_at", "updated_method"]
+                )
+
+    # ------------------------------------------------------------------
+    # 外部公開メソッド: 一括データ操作
+    # ------------------------------------------------------------------
+    # 1件ずつの save() ではなく batch_size 件ごとのSQLで書き込み、履歴 (simple_history) もまとめて登録する。
+    # save() を経由しないため、post_save などのシグナルは発行されない
+    # (キャッシュの破棄・検索インデックスの更新が必要なリポジトリは _after_bulk_write() をオーバーライドする)。
+
+    def bulk_create(
+        self,
+        instances: Iterable[Model],
+        user: Model,
+        process_name: str,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> List[Model]:
+        """レコードの一括作成 (作成者・更新者・作成処理・更新処理が未設定の場合は設定する)"""
+        instances = list(instances)
+        for instance in instances:
+            if instance.created_by_id is None:
+                instance.created_by = user
+            if instance.updated_by_id is None:
+                instance.updated_by = user
+            instance.created_method = instance.created_method or process_name
+            instance.updated_method = instance.updated_method or process_name
+
+        if self._get_history_manager() is not None:
+            created = bulk_create_with_history(
+                instances, self.model, batch_size=batch_size, default_user=user
+            )
+        else:
+            created = self.model.objects.bulk_create(instances, batch_size=batch_size)
+
+        for instance in created:
+            instance._take_loaded_snapshot()
+        self._after_bulk_write([instance.pk for instance in created], instances=created)
+        return created
+
+    def bulk_update(
+        self,
+        instances: Iterable[Model],
+        fields: Sequence[str],
+        user: Model,
+        process_name: str,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> int:
+        """
+        変更済みのインスタンスの fields 列を一括更新し、更新した件数を返す。
+        更新者・更新日時・更新処理の列は自動で設定・更新する。
+        """
+        instances = list(instances)
+        if not instances:
+            return 0
+
+        # bulk_update では auto_now の列 (更新日時) が更新されないため明示的に設定する
+        now = timezone.now()
+        for instance in instances:
+            instance.updated_by = user
+            instance.updated_at = now
+            instance.updated_method = process_name
+        update_fields = sorted(set(fields) | AUDIT_FIELD_NAMES)
+
+        if self._get_history_manager() is not None:
+            updated = bulk_update_with_history(
+                instances,
+                self.model,
+                update_fields,
+                batch_size=batch_size,
+                default_user=user,
+                default_date=now,
+            )
+        else:
+            updated = self.model.objects.bulk_update(
+                instances, update_fields, batch_size=batch_size
+            )
+
+        for instance in instances:
+            instance._take_loaded_snapshot(update_fields)
+        self._after_bulk_write(
+            [instance.pk for instance in instances], instances=instances, fields=update_fields
+        )
+        return updated
+
+    def bulk_soft_delete(
+        self,
+        targets: QuerySet | Iterable[Model],
+        user: Model,
+        process_name: str,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> int:
+        """
+        レコードの一括論理削除 (deleted_atを設定)。
+        QuerySet またはインスタンスのリストを受け取り、論理削除した件数を返す (削除済みのレコードは対象外)。
+        """
+        return self._bulk_set_deleted_at(
+            targets, timezone.now(), user, process_name, batch_size
+        )
+
+    def bulk_restore(
+        self,
+        targets: QuerySet | Iterable[Model],
+        user: Model,
+        process_name: str,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> int:
+        """
+        レコードの一括復元 (deleted_atをNULLに)。
+        QuerySet またはインスタンスのリストを受け取り、復元した件数を返す (削除されていないレコードは対象外)。
+        """
+        return self._bulk_set_deleted_at(targets, None, user, process_name, batch_size)
+
+    # ------------------------------------------------------------------
+    # 内部メソッド: 一括データ操作
+    # ------------------------------------------------------------------
+
+    def _get_history_manager(self):
+        """履歴を管理するモデルの場合は履歴のマネージャを返す (管理しない場合はNone)"""
+        try:
+            return get_history_manager_for_model(self.model)
+        except NotHistoricalModelError:
+            return None
+
+    def _after_bulk_write(
+        self,
+        pks: List[Any],
+        instances: Optional[List[Model]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        一括操作でレコードを書き込んだ後に呼び出される (シグナルの代わりにキャッシュを破棄する場合にオーバーライドする)。
+
+        Args:
+            pks: 書き込んだレコードの主キー
+            instances: 書き込んだインスタンス (bulk_create / bulk_update の場合のみ。論理削除・復元はNone)
+            fields: 更新した列 (bulk_update の場合のみ。作成した場合はNone)
+        """
+
+    def _bulk_set_deleted_at(
+        self,
+        targets: QuerySet | Iterable[Model],
+        deleted_at: Optional[datetime.datetime],
+        user: Model,
+        process_name: str,
+        batch_size: int,
+    ) -> int:
+        """
+        対象を主キーの範囲で batch_size 件ずつに分け、チャンクごとに1つのトランザクションで
+        UPDATE ... WHERE pk IN (...) と履歴の一括登録を行う。
+        """
+        now = timezone.now()
+        # 削除者・削除処理の列は持たないため、更新者・更新処理として記録する
+        values = {
+            "deleted_at": deleted_at,
+            "updated_by": user,
+            "updated_at": now,
+            "updated_method": process_name,
+        }
+        # 論理削除は生存しているレコード、復元は削除済みのレコードのみを対象とする
+        is_target_alive = deleted_at is not None
+        history_manager = self._get_history_manager()
+
+        if isinstance(targets, QuerySet):
+            instances = None
+            targets = targets.filter(deleted_at__isnull=is_target_alive)
+        else:
+            instances = targets = list(targets)
+
+        updated_pks = set()
+        for pks in self._iter_pk_chunks(targets, batch_size):
+            with transaction.atomic():
+                # 対象の行をロックして主キーを確定し、確定した行のみを更新・履歴に登録する
+                target_pks = list(
+                    self.model.objects.select_for_update()
+                    .filter(pk__in=pks, deleted_at__isnull=is_target_alive)
+                    .values_list("pk", flat=True)
+                )
+                if not target_pks:
+                    continue
+                target_queryset = self.model.objects.filter(pk__in=target_pks)
+                target_queryset.update(**values)
+                if history_manager is not None:
+                    history_manager.bulk_history_create(
+                        list(target_queryset),
+                        update=True,
+                        default_user=user,
+                        default_date=now,
+                    )
+            updated_pks.update(target_pks)
+            self._after_bulk_write(target_pks)
+
+        # 渡されたインスタンスにも更新後の値を反映する
+        for instance in instances or ():
+            if instance.pk in updated_pks:
+                for name, value in values.items():
+                    setattr(instance, name, value)
+                instance._take_loaded_snapshot(list(values))
+        return len(updated_pks)
+
+    def _iter_pk_chunks(
+        self, targets: QuerySet | List[Model], batch_size: int
+    ) -> Iterator[List[Any]]:
+        """対象の主キーを batch_size 件ずつ返す (QuerySet は主キーの昇順にシークして取得する)"""
+        if not isinstance(targets, QuerySet):
+            pks = [instance.pk for instance in targets]
+            for start in range(0, len(pks), batch_size):
+                yield pks[start : start + batch_size]
+            return
+
+        queryset = targets.order_by("pk").values_list("pk", flat=True)
+        last_pk = None
+        while True:
+            chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            pks = list(chunk_queryset[:batch_size])
+            if not pks:
+                return
+            yield pks
+            last_pk = pks[-1]
+
+    # ------------------------------------------------------------------
+    # 外部公開メソッド: キーセットページネーション
+    # ------------------------------------------------------------------
+
+    def paginate_by_keyset(
+        self,
+        queryset: QuerySet,
+        cursor: Optional[str] = None,
+        page_size: int = 20,
+        ordering: Sequence[str] = ("-created_at", "-pk"),
+        count_mode: str = COUNT_MODE_NONE,
+        approximate_count_limit: int = 1000,
+    ) -> KeysetPage:
+        """
+        キーセット (シーク) 方式でページを取得する。
+
+        OFFSET を使わず「前ページ末尾のキーより後」を条件に LIMIT するため、
+        ページの深さに関係なくインデックスを使った page_size 件分の読み取りで済む。
+
+        Args:
+            queryset: ページ分割対象のQuerySet (並び順は ordering で上書きされる)
+            cursor: 前回返却した next_cursor / prev_cursor (None の場合は先頭ページ)
+            page_size: 1ページの件数
+            ordering: 並び順のキー。末尾は一意なキー (主キー) にすること
+                (NULL を許可する列は NULL を最小値として扱い、降順では末尾・昇順では先頭に並べる)
+            count_mode: 件数の取得方法 (COUNT_MODE_*)
+            approximate_count_limit: COUNT_MODE_APPROXIMATE で数える上限件数
+
+        Returns:
+            KeysetPage
+        """
+        keys = [self._parse_ordering_key(key) for key in ordering]
+        nullable_keys = self._get_nullable_keys(queryset, keys)
+        payload = self._decode_keyset_cursor(cursor)
+        if payload is not None and len(payload["k"]) != len(keys):
+            # 並び順のキー構成が変わった場合 (検索条件の変更など) は先頭ページに戻す
+            payload = None
+
+        is_backward = False
+        if payload is not None:
+            is_backward = payload["d"] == "p"
+            queryset = queryset.filter(
+                self._build_keyset_filter(keys, payload["k"], is_backward, nullable_keys)
+            )
+
+        # 前ページ方向の場合は並び順を反転して取得し、最後に元の順へ戻す
+        order_by = []
+        for name, is_desc in keys:
+            is_desc = is_desc != is_backward
+            if name in nullable_keys:
+                # DBエンジンごとに異なる NULL の並び順を揃える
+                order_by.append(
+                    F(name).desc(nulls_last=True) if is_desc else F(name).asc(nulls_first=True)
+                )
+            else:
+                order_by.append(f"-{name}" if is_desc else name)
+        rows = list(queryset.order_by(*order_by)[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if is_backward:
+            rows.reverse()
+
+        # 件数は先頭ページでのみ取得し、以降はカーソルに埋め込んだ値を引き継ぐ
+        if payload is not None and "c" in payload:
+            count, is_count_exact = payload["c"], payload["e"]
+        else:
+            count, is_count_exact = self._count_for_keyset(
+                queryset, count_mode, approximate_count_limit
+            )
+
+        has_next = has_more if not is_backward else True
+        has_prev = has_more if is_backward else payload is not None
+
+        page = KeysetPage(object_list=rows, count=count, is_count_exact=is_count_exact)
+        if rows and has_next:
+            page.next_cursor = self._encode_keyset_cursor(
+                keys, rows[-1], "n", count, is_count_exact
+            )
+        if rows and has_prev:
+            page.prev_cursor = self._encode_keyset_cursor(
+                keys, rows[0], "p", count, is_count_exact
+            )
+        return page
+
+    def count_approximately(self, queryset: QuerySet, limit: int = 1000) -> Tuple[int, bool]:
+        """
+        上限付きで件数を取得する。
+
+        SELECT COUNT(*) FROM (SELECT ... LIMIT limit+1) となるため、
+        該当件数がどれだけ多くても読み取りは limit+1 件で打ち切られる。
+
+        Returns:
+            (件数, 正確な件数か)。上限を超えた場合は (limit, False)
+        """
+        count = queryset.order_by()[: limit + 1].count()
+        if count > limit:
+            return limit, False
+        return count, True
+
+    # ------------------------------------------------------------------
+    # 内部メソッド: キーセットページネーション
+    # ------------------------------------------------------------------
+
+    def _count_for_keyset(
+        self, queryset: QuerySet, count_mode: str, limit: int
+    ) -> Tuple[Optional[int], bool]:
+        if count_mode == COUNT_MODE_EXACT:
+            return queryset.count(), True
+        if count_mode == COUNT_MODE_APPROXIMATE:
+            return self.count_approximately(queryset, limit=limit)
+        return None, True
+
+    @staticmethod
+    def _parse_ordering_key(key: str) -> Tuple[str, bool]:
+        """'-created_at' -> ('created_at', True) のように (名前, 降順か) に分解する"""
+        if key.startswith("-"):
+            return key[1:], True
+        return key, False
+
+    @staticmethod
+    def _get_nullable_keys(queryset: QuerySet, keys: List[Tuple[str, bool]]) -> set:
+        """並び順のキーのうち、NULL を許可する列の名前を返す"""
+        nullable_keys = set()
+        for name, _ in keys:
+            try:
+                model_field = queryset.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                # 主キー (pk) やアノテーション
+                continue
+            if model_field.null:
+                nullable_keys.add(name)
+        return nullable_keys
+
+    @staticmethod
+    def _build_keyset_filter(
+        keys: List[Tuple[str, bool]],
+        values: List[Any],
+        is_backward: bool,
+        nullable_keys: Iterable[str] = (),
+    ) -> Q:
+        """
+        (k1, k2, ...) がカーソル位置より後 (前ページ方向なら前) となる条件を組み立てる。
+        例: k1 < v1 OR (k1 = v1 AND k2 < v2) OR ...
+
+        NULL は比較 (< >) で常に偽になるため、NULL を許可する列は NULL を最小値として
+        IS NULL / IS NOT NULL の条件を組み合わせ、NULL の行も2ページ目以降に辿れるようにする。
+        """
+        condition = Q()
+        for i, (name, is_desc) in enumerate(keys):
+            value = values[i]
+            is_less = is_desc != is_backward
+            if value is None:
+                # NULL より小さい値はなく、NULL より大きいのは NULL 以外の全ての値
+                if is_less:
+                    continue
+                comparison = Q(**{f"{name}__isnull": False})
+            else:
+                comparison = Q(**{f"{name}__{'lt' if is_less else 'gt'}": value})
+                if is_less and name in nullable_keys:
+                    comparison |= Q(**{f"{name}__isnull": True})
+
+            branch = Q()
+            for j, (prev_name, _) in enumerate(keys[:i]):
+                prev_value = values[j]
+                if prev_value is None:
+                    branch &= Q(**{f"{prev_name}__isnull": True})
+                else:
+                    branch &= Q(**{prev_name: prev_value})
+            condition |= branch & comparison
+        return condition
+
+    def _encode_keyset_cursor(
+        self,
+        keys: List[Tuple[str, bool]],
+        instance: Model,
+        direction: str,
+        count: Optional[int],
+        is_count_exact: bool,
+    ) -> str:
+        values = []
+        for name, _ in keys:
+            value = instance.pk if name == "pk" else getattr(instance, name)
+            if isinstance(value, Model):
+                value = value.pk
+            if isinstance(value, datetime.datetime):
+                value = value.isoformat()
+            values.append(value)
+
+        payload = {"k": values, "d": direction}
+        if count is not None:
+            payload["c"] = count
+            payload["e"] = is_count_exact
+        # 署名付きでエンコードし、クライアントからは不透明かつ改ざん不可能な値とする
+        return signing.dumps(payload, salt=KEYSET_CURSOR_SALT, compress=True)
+
+    @staticmethod
+    def _decode_keyset_cursor(cursor: Optional[str]) -> Optional[dict]:
+        """カーソルを復号する。不正なカーソルは先頭ページ扱い (None) とする"""
+        if not cursor:
+            return None
+        try:
+            payload = signing.loads(cursor, salt=KEYSET_CURSOR_SALT)
+        except signing.BadSignature:
+            return None
+        if not isinstance(payload, dict) or payload.get("d") not in ("n", "p"):
+            return None
+        return payload
@@ -0,0 +1,140 @@
+import datetime
+from typing import List, Optional
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import EmailOutboxStatus, T_EmailOutbox
+from core.repositories.base_repository import BaseRepository
+
+
+class T_EmailOutboxRepository(BaseRepository):
+    """
+    メール送信キュートラン(T_EmailOutbox)モデル専用のリポジトリクラス。
+    """
+
+    model: T_EmailOutbox = T_EmailOutbox
+
+    # BaseRepositoryから継承される主なメソッド:
+    # - get_alive_by_pk(pk)
+    # - get_alive_one_or_none(**kwargs)
+    # - create(**kwargs)
+    # - update(instance, **kwargs)
+    # - soft_delete(instance)
+
+    # ------------------------------------------------------------------
+    # モデルに対する固有のデータ取得・更新処理
+    # ------------------------------------------------------------------
+    def enqueue(
+        self,
+        subject: str,
+        body: str,
+        recipient_list: List[str],
+        from_email: str,
+        html_body: Optional[str] = None,
+        process_name: Optional[str] = None,
+    ) -> T_EmailOutbox:
+        """
+        送信待ちのメールを登録する（呼び出し元のトランザクションに参加する）。
+        """
+        return self.create(
+            subject=subject,
+            body=body,
+            html_body=html_body,
+            from_email=from_email,
+            recipient_list=recipient_list,
+            status=EmailOutboxStatus.PENDING,
+            next_attempt_at=timezone.now(),
+            created_method=process_name,
+            updated_method=process_name,
+        )
+
+    def claim_batch(
+        self, batch_size: int, lease_seconds: int, process_name: str
+    ) -> List[T_EmailOutbox]:
+        """
+        送信対象のメールを最大 batch_size 件取得し、送信中としてロックする。
+
+        送信待ちに加え、処理期限 (next_attempt_at) を過ぎた送信中のメール
+        (ワーカーが異常終了したもの) も再取得の対象とする。
+        """
+        now = timezone.now()
+        lease_until = now + datetime.timedelta(seconds=lease_seconds)
+        claimable = self._get_alive_queryset().filter(
+            status__in=[EmailOutboxStatus.PENDING, EmailOutboxStatus.SENDING],
+            next_attempt_at__lte=now,
+        )
+
+        with transaction.atomic():
+            # PostgreSQLでは他ワーカーがロック中の行を読み飛ばす (SQLiteでは無視される)
+            ids = list(
+                claimable.select_for_update(skip_locked=True)
+                .order_by("next_attempt_at")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                return []
+
+            # 条件付きで更新し、同時に取得した他ワーカーと重複しないようにする
+            claimable.filter(pk__in=ids).update(
+                status=EmailOutboxStatus.SENDING,
+                next_attempt_at=lease_until,
+                updated_at=now,
+                updated_method=process_name,
+            )
+
+        return list(
+            self._get_alive_queryset()
+            .filter(
+                pk__in=ids,
+                status=EmailOutboxStatus.SENDING,
+                next_attempt_at=lease_until,
+            )
+            .order_by("pk")
+        )
+
+    def mark_sent(self, ids: List[int], process_name: str) -> int:
+        """送信済みのメールを一括で送信済みに更新する"""
+        if not ids:
+            return 0
+        now = timezone.now()
+        return self._get_alive_queryset().filter(pk__in=ids).update(
+            status=EmailOutboxStatus.SENT,
+            attempt_count=F("attempt_count") + 1,
+            sent_at=now,
+            last_error=None,
+            updated_at=now,
+            updated_method=process_name,
+        )
+
+    def mark_failed(
+        self,
+        instance: T_EmailOutbox,
+        error: str,
+        next_attempt_at: Optional[datetime.datetime],
+        process_name: str,
+    ) -> T_EmailOutbox:
+        """
+        送信に失敗したメールを更新する。
+        next_attempt_at が None の場合は再送上限に達したものとして送信失敗にする。
+        """
+        instance.attempt_count += 1
+        instance.last_error = error
+        if next_attempt_at is None:
+            instance.status = EmailOutboxStatus.FAILED
+        else:
+            instance.status = EmailOutboxStatus.PENDING
+            instance.next_attempt_at = next_attempt_at
+        instance.updated_method = process_name
+        instance.save(
+            update_fields=[
+                "attempt_count",
+                "last_error",
+                "status",
+                "next_attempt_at",
+                "updated_at",
+                "updated_method",
+            ]
+        )
+        return instance
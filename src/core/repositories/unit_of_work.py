@@ -0,0 +1,78 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from django.db import transaction
+
+from core.models import BaseModel
+
+# 役割: 複数のリポジトリ操作で変更したインスタンスをまとめ、変更された列のみを1行1回のUPDATEで書き込む。
+# 利用例: サービス層で `with self.user_repo.unit_of_work():` の中で get_* / update() を呼び出す。
+#         ブロック内の update() / soft_delete() / restore() は即時保存せず、ブロックを抜けた時点で反映する。
+
+_current_unit_of_work: ContextVar[Optional["UnitOfWork"]] = ContextVar(
+    "current_unit_of_work", default=None
+)
+
+
+class UnitOfWork:
+    """
+    読み込んだインスタンスを保持し、コミット時に変更された列のみを
+    save(update_fields=...) で書き込むクラス (変更の検出は BaseModel.get_dirty_fields を使用)。
+    変更のないインスタンス、監査列 (更新者・更新処理) のみが変わったインスタンスは書き込まない。
+    """
+
+    def __init__(self, using: Optional[str] = None):
+        self.using = using
+        # id(instance) -> instance (登録順に書き込む)
+        self._tracked: Dict[int, BaseModel] = {}
+
+    def register(self, instance: Optional[BaseModel]) -> Optional[BaseModel]:
+        """読み込んだ (または作成した) インスタンスを登録する"""
+        if instance is not None:
+            self._tracked.setdefault(id(instance), instance)
+        return instance
+
+    def discard(self, instance: BaseModel) -> None:
+        """インスタンスを登録から外す (物理削除したインスタンスを書き込まないようにする)"""
+        self._tracked.pop(id(instance), None)
+
+    def flush(self) -> int:
+        """
+        変更されたインスタンスを書き込み、書き込んだ件数を返す。
+        ブロックの途中で、変更をDBに反映してから検索したい場合にも使用する。
+        """
+        return sum(
+            1
+            for instance in list(self._tracked.values())
+            if instance.save_dirty_fields(using=self.using)
+        )
+
+
+def get_current_unit_of_work() -> Optional[UnitOfWork]:
+    """有効なユニットオブワークを返す (ブロック外の場合はNone)"""
+    return _current_unit_of_work.get()
+
+
+@contextmanager
+def unit_of_work(using: Optional[str] = None) -> Iterator[UnitOfWork]:
+    """
+    ユニットオブワークを有効にするコンテキストマネージャ。
+
+    ブロックを正常に抜けた時点で変更をまとめて書き込み、例外の場合は書き込まずにロールバックする。
+    既に有効なユニットオブワークがある場合はそれに参加し、書き込みは最も外側のブロックで行う。
+    """
+    current = get_current_unit_of_work()
+    if current is not None:
+        yield current
+        return
+
+    uow = UnitOfWork(using=using)
+    token = _current_unit_of_work.set(uow)
+    try:
+        # ブロック内の作成 (INSERT) と最後の書き込みを同じトランザクションで行う
+        with transaction.atomic(using=using):
+            yield uow
+            uow.flush()
+    finally:
+        _current_unit_of_work.reset(token)
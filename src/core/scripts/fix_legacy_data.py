@@ -1,3 +1,4 @@
+import itertools
 import os
 import sys
 
@@ -6,6 +7,8 @@ from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.utils import timezone
 
+from account.repositories.m_user_repository import M_UserRepository
+
 # ----------------------------------------------------
 # 1. Django環境のセットアップ (必須)
 # ----------------------------------------------------
@@ -21,6 +24,9 @@ from django.utils import timezone
 # ----------------------------------------------------
 User = get_user_model()
 
+# 1回のSELECTで取得するユーザー数 (全件をメモリに読み込まないよう、主キー順に分割して取得する)
+CHUNK_SIZE = 2000
+
 
 def fix_legacy_unverified_users(dry_run=True):
     """
@@ -49,7 +55,10 @@ def fix_legacy_unverified_users(dry_run=True):
     # トランザクションを確保
     try:
         with transaction.atomic():
-            for user in target_users.iterator():
+            # 主キー順に CHUNK_SIZE 件ずつ取得する
+            # (変更履歴 (simple_history) は保存時に全列を参照するため、列は絞り込まない)
+            chunks = M_UserRepository().iter_chunks(target_users, chunk_size=CHUNK_SIZE)
+            for user in itertools.chain.from_iterable(chunks):
                 # ユーザーが実際にメール認証を受けていないことを確認する高度なロジックをここに記述
                 # 例: if not user.has_active_activation_token():  など
 
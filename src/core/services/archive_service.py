@@ -0,0 +1,163 @@
+import datetime
+import gzip
+import json
+import os
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from account.models import T_LoginHisory
+from core.consts import LOG_METHOD
+from core.services.sweeper_service import SweeperService, SweepTarget
+from core.utils.log_helpers import log_output_by_msg_id
+
+
+@dataclass
+class ArchiveTarget(SweepTarget):
+    """アーカイブ対象のテーブル1件分 (月ごとのファイルに振り分ける日時の列を追加で持つ)"""
+
+    date_field: str = "created_at"
+
+
+class HistoryArchiveService:
+    """
+    変更履歴・ログイン履歴のうち、settings.HISTORY_ARCHIVE_AFTER_DAYS 日より前のレコードを
+    月ごとの圧縮ファイル (JSON Lines + gzip) に書き出してからDBから削除するサービス。
+
+    SQLiteにはテーブルのパーティションがないため、古いレコードを月単位のファイルに移して
+    履歴テーブルの件数を一定に保ち、管理サイト・監査での直近のレコードの検索を速く保つ。
+    書き出し・削除は SweeperService.sweep() で batch_size 件ずつ行い、書き出したバッチのみを削除する。
+
+    出力先: {HISTORY_ARCHIVE_DIR}/{テーブル名}/{テーブル名}_{YYYYMM}.jsonl.gz
+    (同じ月のファイルには追記する。gzip の複数メンバーとして連結されるため gzip.open でそのまま読める)
+    """
+
+    FILE_NAME = "{0}_{1:%Y%m}.jsonl.gz"
+    FILE_MONTH_PATTERN = re.compile(r"_(\d{6})\.jsonl\.gz$")
+
+    def __init__(self, archive_dir: Optional[str] = None):
+        self.archive_dir = Path(archive_dir or settings.HISTORY_ARCHIVE_DIR)
+        self.sweeper = SweeperService()
+
+    def get_targets(self, now: Optional[datetime.datetime] = None) -> List[ArchiveTarget]:
+        """アーカイブ対象のテーブルと条件を返す"""
+        now = now or timezone.now()
+        cutoff = now - datetime.timedelta(days=settings.HISTORY_ARCHIVE_AFTER_DAYS)
+        targets = [
+            ArchiveTarget(
+                T_LoginHisory._meta.db_table,
+                T_LoginHisory.objects.filter(created_at__lt=cutoff),
+                date_field="created_at",
+            )
+        ]
+        for history_model in self.sweeper.get_history_models():
+            targets.append(
+                ArchiveTarget(
+                    history_model._meta.db_table,
+                    history_model.objects.filter(history_date__lt=cutoff),
+                    date_field="history_date",
+                )
+            )
+        return targets
+
+    def get_archive_path(self, table_name: str, month: datetime.date) -> Path:
+        return self.archive_dir / table_name / self.FILE_NAME.format(table_name, month)
+
+    def archive(
+        self,
+        target: ArchiveTarget,
+        batch_size: Optional[int] = None,
+        interval: Optional[float] = None,
+    ) -> int:
+        """対象のレコードを月ごとのファイルに書き出してから削除し、件数を返す"""
+        field_names = [field.attname for field in target.queryset.model._meta.concrete_fields]
+
+        def write_batch(batch: QuerySet) -> None:
+            rows_by_month: Dict[datetime.date, list] = defaultdict(list)
+            for row in batch.order_by("pk").values(*field_names):
+                date = row[target.date_field]
+                if timezone.is_aware(date):
+                    date = timezone.localtime(date)
+                rows_by_month[date.date().replace(day=1)].append(row)
+
+            for month, rows in rows_by_month.items():
+                path = self.get_archive_path(target.name, month)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "ab") as raw_file:
+                    with gzip.GzipFile(fileobj=raw_file, mode="wb") as gzip_file:
+                        for row in rows:
+                            gzip_file.write(
+                                json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False).encode()
+                                + b"\n"
+                            )
+                    # 書き出しがディスクに反映されてから削除する
+                    raw_file.flush()
+                    os.fsync(raw_file.fileno())
+
+        return self.sweeper.sweep(
+            target, batch_size=batch_size, interval=interval, before_delete=write_batch
+        )
+
+    def archive_all(
+        self, batch_size: Optional[int] = None, interval: Optional[float] = None
+    ) -> Dict[str, int]:
+        """全ての対象をアーカイブし、テーブル名ごとの件数を返す"""
+        results = {}
+        for target in self.get_targets():
+            archived = self.archive(target, batch_size=batch_size, interval=interval)
+            if archived:
+                log_output_by_msg_id(
+                    log_id="MSGI103",
+                    params=[target.name, archived, self.archive_dir / target.name],
+                    logger_name=LOG_METHOD.APPLICATION.value,
+                )
+            results[target.name] = archived
+        return results
+
+    def prune_archives(self, now: Optional[datetime.datetime] = None) -> List[Path]:
+        """
+        保存期間 (settings.HISTORY_ARCHIVE_RETENTION_DAYS) を過ぎた月のファイルを削除し、削除したファイルを返す
+        (保存日数が0の場合は削除しない)。
+        """
+        if settings.HISTORY_ARCHIVE_RETENTION_DAYS <= 0 or not self.archive_dir.exists():
+            return []
+
+        now = timezone.localtime(now or timezone.now())
+        cutoff = (now - datetime.timedelta(days=settings.HISTORY_ARCHIVE_RETENTION_DAYS)).date()
+        pruned = []
+        for path in sorted(self.archive_dir.glob("*/*.jsonl.gz")):
+            matched = self.FILE_MONTH_PATTERN.search(path.name)
+            if matched is None:
+                continue
+            month = datetime.datetime.strptime(matched.group(1), "%Y%m")
+            # 月末までのレコードが全て保存期間を過ぎた場合のみ削除する
+            next_month = (month.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+            if next_month.date() <= cutoff:
+                path.unlink()
+                pruned.append(path)
+        if pruned:
+            log_output_by_msg_id(
+                log_id="MSGI104",
+                params=[len(pruned), self.archive_dir],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+        return pruned
+
+    def count(self, target: ArchiveTarget) -> int:
+        """アーカイブ対象の件数を返す (ドライラン用)"""
+        return self.sweeper.count(target)
+
+
+def run_archiver() -> Dict[str, int]:
+    """定期ジョブ (settings.PERIODIC_JOBS) から呼び出す、履歴のアーカイブ処理"""
+    service = HistoryArchiveService()
+    results = service.archive_all()
+    service.prune_archives()
+    return results
@@ -1,14 +1,20 @@
+import datetime
 import os
-from typing import List, Optional
+import random
+from typing import List, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils import timezone
 
+from core.consts import LOG_METHOD
 from core.exceptions import ExternalServiceError
+from core.repositories import T_EmailOutboxRepository
+from core.utils.log_helpers import log_output_by_msg_id
 
 User = get_user_model()
 
@@ -20,7 +26,7 @@ class NotificationService:
     """
 
     def __init__(self):
-        pass
+        self.outbox_repo = T_EmailOutboxRepository()
 
     def _get_site_url(self, path: str) -> str:
         """Siteフレームワークと設定に基づき絶対URLを構築するヘルパー"""
@@ -41,6 +47,10 @@ class NotificationService:
         全てのメール送信が通る共通エントリーポイント。
         全てのメール処理の変更は、このメソッド内部で行う。
 
+        メールはその場では送信せず、メール送信キュー (t_email_outbox) に登録する。
+        呼び出し元のトランザクションに参加するため、業務処理がロールバックされた場合はメールも送信されない。
+        実際の送信はワーカーコマンド (common_email_outbox_worker) が行う。
+
         Args:
             subject: メールの件名
             message: プレーンテキストのメール本文
@@ -48,22 +58,22 @@ class NotificationService:
             html_message: HTMLメール本文（指定された場合、これが優先される）
 
         Returns:
-            送信成功時True
+            登録成功時True
 
         Raises:
-            ExternalServiceError: メール送信に失敗した場合
+            ExternalServiceError: メール送信キューへの登録に失敗した場合
         """
         if not recipient_list:
             return False
 
         try:
-            send_mail(
+            self.outbox_repo.enqueue(
                 subject=subject,
-                message=message,
+                body=message,
+                html_body=html_message if html_message else message,
                 from_email=settings.EMAIL_FROM,
-                recipient_list=recipient_list,
-                html_message=html_message if html_message else message,
-                fail_silently=False,
+                recipient_list=list(recipient_list),
+                process_name=self.__class__.__name__,
             )
             return True
         except Exception as e:
@@ -73,6 +83,103 @@ class NotificationService:
                 details={"recipient": recipient_list, "internal_error": str(e)},
             )
 
+    def deliver_outbox(
+        self, batch_size: Optional[int] = None, process_name: str = "EmailOutboxWorker"
+    ) -> Tuple[int, int]:
+        """
+        メール送信キューから送信対象を最大 batch_size 件取得し、1つのSMTP接続を使い回して送信する。
+        失敗したメールは指数バックオフで再送を予約し、再送上限に達した場合は送信失敗とする。
+
+        Returns:
+            (送信成功件数, 送信失敗件数)
+        """
+        batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+        outbox_messages = self.outbox_repo.claim_batch(
+            batch_size=batch_size,
+            lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+            process_name=process_name,
+        )
+        if not outbox_messages:
+            return 0, 0
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as e:
+            # 接続できない場合は今回取得した全件を再送予約にする
+            log_output_by_msg_id(
+                log_id="MSGE902",
+                params=[str(e)],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+            for outbox_message in outbox_messages:
+                self._reschedule_outbox_message(outbox_message, str(e), process_name)
+            return 0, len(outbox_messages)
+
+        sent_ids = []
+        failed_count = 0
+        try:
+            for outbox_message in outbox_messages:
+                email = EmailMultiAlternatives(
+                    subject=outbox_message.subject,
+                    body=outbox_message.body,
+                    from_email=outbox_message.from_email,
+                    to=outbox_message.recipient_list,
+                    connection=connection,
+                )
+                if outbox_message.html_body:
+                    email.attach_alternative(outbox_message.html_body, "text/html")
+                try:
+                    email.send()
+                    sent_ids.append(outbox_message.pk)
+                except Exception as e:
+                    failed_count += 1
+                    self._reschedule_outbox_message(outbox_message, str(e), process_name)
+        finally:
+            connection.close()
+            # 送信済みはまとめて1回のUPDATEで反映する
+            self.outbox_repo.mark_sent(sent_ids, process_name=process_name)
+
+        return len(sent_ids), failed_count
+
+    def _reschedule_outbox_message(self, outbox_message, error: str, process_name: str):
+        """送信に失敗したメールの再送を予約する（再送上限に達した場合は送信失敗とする）"""
+        attempt_count = outbox_message.attempt_count + 1
+        if attempt_count >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            log_output_by_msg_id(
+                log_id="MSGE901",
+                params=[outbox_message.pk, attempt_count, error],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+            next_attempt_at = None
+        else:
+            next_attempt_at = timezone.now() + self._get_retry_delay(attempt_count)
+            log_output_by_msg_id(
+                log_id="MSGW101",
+                params=[outbox_message.pk, attempt_count, next_attempt_at, error],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+
+        self.outbox_repo.mark_failed(
+            outbox_message,
+            error=error,
+            next_attempt_at=next_attempt_at,
+            process_name=process_name,
+        )
+
+    @staticmethod
+    def _get_retry_delay(attempt_count: int) -> datetime.timedelta:
+        """
+        再送までの待機時間を返す（指数バックオフ + ジッター）。
+        例: 基準60秒の場合 60秒 → 120秒 → 240秒 ... (上限 EMAIL_OUTBOX_RETRY_MAX_SECONDS)
+        """
+        delay = min(
+            settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * (2 ** (attempt_count - 1)),
+            settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS,
+        )
+        # 複数のメールが同時に再送されて再び失敗しないよう、最大10%の揺らぎを加える
+        return datetime.timedelta(seconds=delay * (1 + random.random() * 0.1))
+
     def send_templated_email(
         self,
         subject: str,
@@ -0,0 +1,160 @@
+import datetime
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+from simple_history.exceptions import NotHistoricalModelError
+from simple_history.utils import get_history_manager_for_model
+
+from account.models import T_LoginHisory
+from account.repositories.t_user_session_repository import T_UserSessionRepository
+from account.repositories.t_user_token_repository import T_UserTokenRepository
+from core.consts import LOG_METHOD
+from core.models import EmailOutboxStatus, T_EmailOutbox
+from core.utils.log_helpers import log_output_by_msg_id
+
+
+@dataclass
+class SweepTarget:
+    """削除対象のテーブル1件分 (テーブル名と、削除するレコードのQuerySet)"""
+
+    name: str
+    queryset: QuerySet
+
+
+class SweeperService:
+    """
+    期限切れのトークン・セッション、保存期間を過ぎた変更履歴・ログイン履歴・送信済みのメールを削除するサービス。
+
+    削除は条件の列 (有効期限・日時) のインデックスで絞り込んだ batch_size 件ずつの DELETE で行い、
+    バッチの間に待機することで、通常のリクエストとロック・I/Oを長時間競合させない。
+    """
+
+    def __init__(self):
+        self.token_repo = T_UserTokenRepository()
+        self.session_repo = T_UserSessionRepository()
+
+    def get_targets(self, now: Optional[datetime.datetime] = None) -> List[SweepTarget]:
+        """削除対象のテーブルと条件を返す (保存日数が0の履歴は対象外)"""
+        now = now or timezone.now()
+        targets = [
+            SweepTarget(
+                self.session_repo.model._meta.db_table,
+                self.session_repo.get_expired_records(now),
+            ),
+            SweepTarget(
+                self.token_repo.model._meta.db_table,
+                self.token_repo.get_expired_records(
+                    now - datetime.timedelta(days=settings.EXPIRED_TOKEN_RETENTION_DAYS)
+                ),
+            ),
+        ]
+
+        if settings.LOGIN_HISTORY_RETENTION_DAYS > 0:
+            cutoff = now - datetime.timedelta(days=settings.LOGIN_HISTORY_RETENTION_DAYS)
+            targets.append(
+                SweepTarget(
+                    T_LoginHisory._meta.db_table,
+                    T_LoginHisory.objects.filter(created_at__lt=cutoff),
+                )
+            )
+
+        if settings.EMAIL_OUTBOX_RETENTION_DAYS > 0:
+            # 送信失敗のメールは調査のため残す
+            cutoff = now - datetime.timedelta(days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+            targets.append(
+                SweepTarget(
+                    T_EmailOutbox._meta.db_table,
+                    T_EmailOutbox.objects.filter(
+                        status=EmailOutboxStatus.SENT, sent_at__lt=cutoff
+                    ),
+                )
+            )
+
+        if settings.HISTORY_RETENTION_DAYS > 0:
+            cutoff = now - datetime.timedelta(days=settings.HISTORY_RETENTION_DAYS)
+            for history_model in self.get_history_models():
+                targets.append(
+                    SweepTarget(
+                        history_model._meta.db_table,
+                        history_model.objects.filter(history_date__lt=cutoff),
+                    )
+                )
+        return targets
+
+    @staticmethod
+    def get_history_models() -> list:
+        """HistoricalRecords で作成された変更履歴のモデルを返す"""
+        history_models = []
+        for model in apps.get_models():
+            try:
+                history_models.append(get_history_manager_for_model(model).model)
+            except NotHistoricalModelError:
+                continue
+        return sorted(history_models, key=lambda model: model._meta.db_table)
+
+    def sweep(
+        self,
+        target: SweepTarget,
+        batch_size: Optional[int] = None,
+        interval: Optional[float] = None,
+        before_delete: Optional[Callable[[QuerySet], None]] = None,
+    ) -> int:
+        """
+        対象のレコードを batch_size 件ずつ物理削除し、削除した件数を返す。
+
+        削除済みのレコードは条件から外れるため、毎回先頭から batch_size 件を取得して削除する。
+        シグナル (履歴の登録など) は発行せず、1回のDELETEで削除する
+        (削除対象のテーブルを参照する外部キーがないことが前提)。
+        before_delete を指定した場合は、削除する batch_size 件のQuerySetを渡して削除前に呼び出す
+        (例外が発生した場合はそのバッチを削除せずに中断する)。
+        """
+        batch_size = batch_size or settings.SWEEPER_BATCH_SIZE
+        if interval is None:
+            interval = settings.SWEEPER_BATCH_INTERVAL_SECONDS
+
+        model = target.queryset.model
+        pk_queryset = target.queryset.order_by().values_list("pk", flat=True)
+        total = 0
+        while True:
+            pks = list(pk_queryset[:batch_size])
+            if not pks:
+                break
+            batch = model._base_manager.using(target.queryset.db).filter(pk__in=pks)
+            if before_delete is not None:
+                before_delete(batch)
+            total += batch._raw_delete(target.queryset.db)
+            if len(pks) < batch_size:
+                break
+            # 通常のリクエストの書き込みを待たせ続けないよう、バッチの間に待機する
+            time.sleep(interval)
+        return total
+
+    def sweep_all(
+        self, batch_size: Optional[int] = None, interval: Optional[float] = None
+    ) -> Dict[str, int]:
+        """全ての対象を削除し、テーブル名ごとの削除件数を返す (削除したテーブルはログに出力する)"""
+        results = {}
+        for target in self.get_targets():
+            deleted = self.sweep(target, batch_size=batch_size, interval=interval)
+            if deleted:
+                log_output_by_msg_id(
+                    log_id="MSGI102",
+                    params=[target.name, deleted],
+                    logger_name=LOG_METHOD.APPLICATION.value,
+                )
+            results[target.name] = deleted
+        return results
+
+    def count(self, target: SweepTarget) -> int:
+        """削除対象の件数を返す (ドライラン用)"""
+        return target.queryset.order_by().count()
+
+
+def run_sweeper() -> Dict[str, int]:
+    """定期ジョブ (settings.PERIODIC_JOBS) から呼び出す、期限切れデータの削除処理"""
+    return SweeperService().sweep_all()
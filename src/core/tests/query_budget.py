@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import URLPattern
+
+from core.middlewares.query_budget_middleware import get_query_budget
+
+User = get_user_model()
+
+# 役割: ビューのクエリバジェットを検証するテストの基底クラス。
+# 利用例: 各アプリの tests/test_query_budgets.py で継承し、urls.py の全URLにリクエストを送る。
+#         バジェットを超えた場合は QueryBudgetMiddleware が QueryBudgetExceededError を送出する
+#         (テスト実行時は settings.QUERY_BUDGET_MODE が常に raise となる)。
+
+
+class QueryBudgetTestCase(TestCase):
+    """
+    URLごとにリクエストを送り、クエリバジェット内で処理されることを検証するテストの基底クラス。
+    """
+
+    # 対象アプリの urls.py モジュール (子クラスで設定)
+    urls_module = None
+    # 子クラスのテストでリクエストを送るURL名 (urls.py の全URLを含むことを検証する)
+    tested_url_names: tuple = ()
+
+    PASSWORD = "Budget-Test-Pass-123"
+
+    def setUp(self):
+        # テストごとにDBはロールバックされるため、前のテストでキャッシュしたユーザーを残さない
+        cache.clear()
+
+    @classmethod
+    def create_active_user(cls, email: str, **extra_fields) -> User:
+        """ログイン可能な (有効化済み・初回設定済みの) ユーザーを作成する"""
+        extra_fields.setdefault("is_active", True)
+        user = User.objects.create_user(email=email, password=cls.PASSWORD, **extra_fields)
+        user.is_first_login = extra_fields.get("is_first_login", False)
+        user.save(update_fields=["is_first_login"])
+        return user
+
+    def request_within_budget(self, method: str, path: str, data=None, **extra):
+        """
+        リクエストを送り、ビューにクエリバジェットが宣言されていること・
+        サーバーエラーにならないことを検証する。バジェットの超過はミドルウェアが例外で報告する。
+        """
+        response = getattr(self.client, method.lower())(path, data or {}, **extra)
+
+        request = response.wsgi_request
+        self.assertIsNotNone(
+            request.query_budget,
+            f"{method} {path} のビューにクエリバジェットが宣言されていません。",
+        )
+        self.assertLess(response.status_code, 500)
+        return response
+
+    def test_all_urls_are_tested(self):
+        """urls.py の全URLがテスト対象に含まれ、クエリバジェットが宣言されていることを検証する"""
+        if self.urls_module is None:
+            return
+
+        for pattern in self.urls_module.urlpatterns:
+            if not isinstance(pattern, URLPattern):
+                continue
+            with self.subTest(url_name=pattern.name):
+                self.assertIn(pattern.name, self.tested_url_names)
+                self.assertIsNotNone(get_query_budget(pattern.callback, "GET"))
@@ -0,0 +1,43 @@
+from django.db import connection
+from django.test import TestCase, skipUnlessDBFeature
+
+from account.models import M_User, M_UserProfile
+from core.models import ALIVE_CONDITION, alive_index
+
+
+class AliveIndexTest(TestCase):
+    """
+    alive_index() で宣言した部分インデックスが、論理削除されていないレコードのみを対象に作成されることを検証する。
+    """
+
+    # (モデル, インデックス名, 列)
+    ALIVE_INDEXES = (
+        (M_User, "idx_user_email_active", ["email", "is_active"]),
+        (M_UserProfile, "idx_user_profile_public", ["is_public", "created_at"]),
+    )
+
+    def test_alive_index_has_soft_delete_condition(self):
+        index = alive_index("is_public", "created_at", name="idx_test_alive")
+
+        self.assertEqual(index.fields, ["is_public", "created_at"])
+        self.assertEqual(index.condition, ALIVE_CONDITION)
+
+    @skipUnlessDBFeature("supports_partial_indexes")
+    def test_partial_indexes_are_created(self):
+        for model, name, columns in self.ALIVE_INDEXES:
+            with self.subTest(index=name), connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(
+                    cursor, model._meta.db_table
+                )
+                self.assertIn(name, constraints)
+                self.assertEqual(constraints[name]["columns"], columns)
+
+    @skipUnlessDBFeature("supports_partial_indexes")
+    def test_alive_email_lookup_uses_partial_index(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("実行計画の書式がDBごとに異なるため、SQLiteでのみ検証する")
+        queryset = M_User.objects.filter(
+            email="alive-index@example.com", is_active=False, deleted_at__isnull=True
+        )
+
+        self.assertIn("idx_user_email_active", queryset.explain())
@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from account.models import M_User, M_UserProfile
+from account.repositories.m_user_profile_repository import M_UserProfileRepository
+
+
+class BaseModelDirtyFieldsTest(TestCase):
+    """
+    BaseModel の変更列の追跡と、BaseRepository.update() が変更列のみを保存することを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="dirty-fields@example.com", password="Dirty-Fields-123", is_active=True
+        )
+
+    def setUp(self):
+        self.repo = M_UserProfileRepository()
+        self.profile = M_UserProfile.objects.get(pk=self.user.pk)
+
+    def test_loaded_instance_has_no_dirty_fields(self):
+        self.assertEqual(self.profile.get_dirty_fields(), [])
+
+        self.profile.theme = "dark"
+        self.assertEqual(self.profile.get_dirty_fields(), ["theme"])
+
+    def test_update_saves_only_changed_columns(self):
+        history_count = self.profile.history.count()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.repo.update(self.profile, theme="dark", updated_by=self.user)
+
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"theme"', updates[0])
+        self.assertIn('"updated_at"', updates[0])
+        self.assertNotIn('"bio"', updates[0])
+        self.assertEqual(self.profile.get_dirty_fields(), [])
+        self.assertEqual(self.profile.history.count(), history_count + 1)
+
+    def test_update_without_changes_skips_write(self):
+        history_count = self.profile.history.count()
+
+        with self.assertNumQueries(0):
+            self.repo.update(
+                self.profile,
+                theme=self.profile.theme,
+                updated_by=self.user,
+                updated_method="DirtyFieldsTest",
+            )
+        self.assertEqual(self.profile.history.count(), history_count)
+
+    def test_deferred_fields_are_not_loaded(self):
+        profile = M_UserProfile.objects.only("pk", "theme").get(pk=self.user.pk)
+
+        with self.assertNumQueries(0):
+            profile.theme = "dark"
+            self.assertEqual(profile.get_dirty_fields(), ["theme"])
@@ -0,0 +1,128 @@
+import hashlib
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from account.models import M_User, M_UserProfile
+from account.models.t_user_token import T_UserToken, TokenTypes
+from account.repositories.m_user_profile_repository import M_UserProfileRepository
+from account.repositories.t_user_token_repository import T_UserTokenRepository
+
+
+class BulkOperationTest(TestCase):
+    """
+    BaseRepository の一括操作が、件数に比例しない回数のSQLで監査列と履歴を書き込むことを検証する。
+    """
+
+    PROCESS_NAME = "BulkOperationTest"
+    TOKEN_COUNT = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="bulk-operation@example.com", password="Bulk-Operation-123", is_active=True
+        )
+
+    def setUp(self):
+        self.token_repo = T_UserTokenRepository()
+        self.profile_repo = M_UserProfileRepository()
+
+    def _build_tokens(self):
+        return [
+            T_UserToken(
+                m_user=self.user,
+                token_hash=hashlib.sha256(f"bulk:{i}".encode()).hexdigest(),
+                token_type=TokenTypes.PASSWORD_RESET,
+                expired_at=timezone.now() + timezone.timedelta(hours=1),
+            )
+            for i in range(self.TOKEN_COUNT)
+        ]
+
+    def test_bulk_create_fills_audit_fields_and_history(self):
+        tokens = self.token_repo.bulk_create(
+            self._build_tokens(), self.user, self.PROCESS_NAME, batch_size=2
+        )
+
+        self.assertTrue(all(token.pk for token in tokens))
+        self.assertEqual(
+            T_UserToken.objects.filter(
+                created_by=self.user, updated_method=self.PROCESS_NAME
+            ).count(),
+            self.TOKEN_COUNT,
+        )
+        self.assertEqual(
+            T_UserToken.history.filter(history_type="+").count(), self.TOKEN_COUNT
+        )
+
+    def test_bulk_soft_delete_and_restore_queryset_in_chunks(self):
+        self.token_repo.bulk_create(self._build_tokens(), self.user, self.PROCESS_NAME)
+        queryset = self.token_repo.get_alive_records().filter(m_user=self.user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            deleted = self.token_repo.bulk_soft_delete(
+                queryset, self.user, self.PROCESS_NAME, batch_size=2
+            )
+        self.assertEqual(deleted, self.TOKEN_COUNT)
+        # 3チャンク分の UPDATE のみ (1件ずつの UPDATE ではない)
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 3)
+        self.assertFalse(self.token_repo.get_alive_records().exists())
+        self.assertEqual(T_UserToken.history.filter(history_type="~").count(), self.TOKEN_COUNT)
+
+        # 削除済みのレコードは再度論理削除しない
+        self.assertEqual(self.token_repo.bulk_soft_delete(queryset, self.user, "Again"), 0)
+
+        restored = self.token_repo.bulk_restore(
+            self.token_repo.get_deleted_records(), self.user, self.PROCESS_NAME
+        )
+        self.assertEqual(restored, self.TOKEN_COUNT)
+        self.assertEqual(self.token_repo.get_alive_records().count(), self.TOKEN_COUNT)
+
+    def test_bulk_soft_delete_instances_updates_in_memory_values(self):
+        tokens = self.token_repo.bulk_create(
+            self._build_tokens(), self.user, self.PROCESS_NAME
+        )
+
+        deleted = self.token_repo.bulk_soft_delete(tokens[:2], self.user, "SoftDelete")
+
+        self.assertEqual(deleted, 2)
+        self.assertIsNotNone(tokens[0].deleted_at)
+        self.assertEqual(tokens[0].updated_method, "SoftDelete")
+        self.assertFalse(tokens[0].get_dirty_fields())
+        self.assertEqual(self.token_repo.get_alive_records().count(), self.TOKEN_COUNT - 2)
+
+    def test_history_is_recorded_only_for_updated_rows(self):
+        tokens = self.token_repo.bulk_create(
+            self._build_tokens(), self.user, self.PROCESS_NAME
+        )
+        now = timezone.now()
+        # 他の処理が同じ日時で論理削除済みのレコード (対象外) は履歴に含めない
+        T_UserToken.objects.filter(pk=tokens[1].pk).update(deleted_at=now, updated_at=now)
+
+        with mock.patch.object(timezone, "now", return_value=now):
+            deleted = self.token_repo.bulk_soft_delete(tokens[:2], self.user, "SoftDelete")
+
+        self.assertEqual(deleted, 1)
+        self.assertEqual(
+            list(T_UserToken.history.filter(history_type="~").values_list("id", flat=True)),
+            [tokens[0].pk],
+        )
+        self.assertIsNotNone(tokens[0].deleted_at)
+
+    def test_bulk_update_writes_fields_and_history(self):
+        profile = M_UserProfile.objects.get(m_user=self.user)
+        profile.display_name = "bulk-updated"
+
+        updated = self.profile_repo.bulk_update(
+            [profile], ["display_name"], self.user, self.PROCESS_NAME
+        )
+
+        self.assertEqual(updated, 1)
+        profile.refresh_from_db()
+        self.assertEqual(profile.display_name, "bulk-updated")
+        self.assertEqual(profile.updated_method, self.PROCESS_NAME)
+        latest = M_UserProfile.history.filter(m_user=self.user).latest("history_date")
+        self.assertEqual(latest.display_name, "bulk-updated")
@@ -0,0 +1,54 @@
+from django.test import TestCase
+
+from account.models import M_User
+from account.repositories.m_user_repository import M_UserRepository
+
+
+class ChunkedIteratorTest(TestCase):
+    """
+    BaseRepository.iter_chunks() / iter_alive_records() が主キー順に一定件数ずつ取得することを検証する。
+    """
+
+    USER_COUNT = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            M_User.objects.create_user(
+                email=f"chunked-{i}@example.com", password="Chunked-Iter-123", is_active=True
+            )
+            for i in range(cls.USER_COUNT)
+        ]
+
+    def setUp(self):
+        self.user_repo = M_UserRepository()
+
+    def test_chunks_are_ordered_by_pk_with_bounded_size(self):
+        queryset = self.user_repo.get_alive_records().filter(email__startswith="chunked-")
+
+        # 最後のチャンクが chunk_size 未満の場合は、空のチャンクを確認するSELECTを発行しない
+        with self.assertNumQueries(3):
+            chunks = list(self.user_repo.iter_chunks(queryset, chunk_size=2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(
+            [user.pk for chunk in chunks for user in chunk],
+            sorted(user.pk for user in self.users),
+        )
+
+    def test_only_defers_other_columns(self):
+        user = next(self.user_repo.iter_alive_records(chunk_size=2, only=("email",)))
+
+        self.assertIn("password", user.get_deferred_fields())
+        self.assertNotIn("email", user.get_deferred_fields())
+
+    def test_updating_rows_during_iteration_does_not_skip_rows(self):
+        queryset = self.user_repo.get_alive_records().filter(email__startswith="chunked-")
+
+        visited = []
+        for chunk in self.user_repo.iter_chunks(queryset, chunk_size=2):
+            visited.extend(user.pk for user in chunk)
+            # 走査中に条件から外れるよう更新しても、次のチャンクの開始位置は変わらない
+            self.user_repo.bulk_soft_delete(chunk, self.users[0], "ChunkedIteratorTest")
+
+        self.assertEqual(sorted(visited), sorted(user.pk for user in self.users))
@@ -0,0 +1,176 @@
+import datetime
+from io import StringIO
+from smtplib import SMTPException
+
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import EmailOutboxStatus, T_EmailOutbox
+from core.repositories.t_email_outbox_repository import T_EmailOutboxRepository
+from core.services.notification_service import NotificationService
+from core.services.sweeper_service import SweeperService
+
+process_name = "EmailOutboxTest"
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    """送信が常に失敗するメールバックエンド"""
+
+    def send_messages(self, email_messages):
+        raise SMTPException("connection reset")
+
+
+@override_settings(
+    EMAIL_OUTBOX_LEASE_SECONDS=300,
+    EMAIL_OUTBOX_MAX_ATTEMPTS=3,
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS=60,
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS=200,
+)
+class EmailOutboxTest(TestCase):
+    """
+    メール送信キューの取得 (リース)、送信、指数バックオフでの再送予約、再送上限での送信失敗を検証する。
+    """
+
+    def setUp(self):
+        self.repo = T_EmailOutboxRepository()
+
+    def enqueue(self, subject: str = "subject") -> T_EmailOutbox:
+        return self.repo.enqueue(
+            subject=subject,
+            body="body",
+            recipient_list=["to@example.com"],
+            from_email="from@example.com",
+            process_name=process_name,
+        )
+
+    def test_claim_batch_leases_messages_once(self):
+        messages = [self.enqueue(f"subject-{i}") for i in range(3)]
+
+        claimed = self.repo.claim_batch(batch_size=2, lease_seconds=300, process_name=process_name)
+        self.assertEqual([message.pk for message in claimed], [m.pk for m in messages[:2]])
+        for message in claimed:
+            self.assertEqual(message.status, EmailOutboxStatus.SENDING)
+            self.assertGreater(message.next_attempt_at, timezone.now())
+
+        # リース中のメールは他のワーカーから取得されない
+        claimed = self.repo.claim_batch(batch_size=2, lease_seconds=300, process_name=process_name)
+        self.assertEqual([message.pk for message in claimed], [messages[2].pk])
+        self.assertEqual(
+            self.repo.claim_batch(batch_size=2, lease_seconds=300, process_name=process_name), []
+        )
+
+    def test_expired_lease_is_claimed_again(self):
+        message = self.enqueue()
+        self.repo.claim_batch(batch_size=1, lease_seconds=300, process_name=process_name)
+        # ワーカーが異常終了し、リースの期限を過ぎた
+        T_EmailOutbox.objects.filter(pk=message.pk).update(
+            next_attempt_at=timezone.now() - datetime.timedelta(seconds=1)
+        )
+
+        claimed = self.repo.claim_batch(batch_size=1, lease_seconds=300, process_name=process_name)
+        self.assertEqual([m.pk for m in claimed], [message.pk])
+
+    def test_deliver_marks_messages_sent(self):
+        message = self.enqueue()
+
+        self.assertEqual(NotificationService().deliver_outbox(process_name=process_name), (1, 0))
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutboxStatus.SENT)
+        self.assertEqual(message.attempt_count, 1)
+        self.assertIsNotNone(message.sent_at)
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(EMAIL_BACKEND="core.tests.test_email_outbox.FailingEmailBackend")
+    def test_failed_message_is_retried_with_backoff(self):
+        message = self.enqueue()
+        service = NotificationService()
+
+        expected_delays = [60, 120]  # 基準60秒 × 2^(試行回数-1)
+        for attempt_count, delay in enumerate(expected_delays, start=1):
+            before = timezone.now()
+            self.assertEqual(service.deliver_outbox(process_name=process_name), (0, 1))
+
+            message.refresh_from_db()
+            self.assertEqual(message.status, EmailOutboxStatus.PENDING)
+            self.assertEqual(message.attempt_count, attempt_count)
+            self.assertEqual(message.last_error, "connection reset")
+            # 揺らぎは最大10%
+            wait = (message.next_attempt_at - before).total_seconds()
+            self.assertGreaterEqual(wait, delay)
+            self.assertLessEqual(wait, delay * 1.1 + 1)
+
+            # 再送予定日時になるまでは取得されない
+            self.assertEqual(service.deliver_outbox(process_name=process_name), (0, 0))
+            T_EmailOutbox.objects.filter(pk=message.pk).update(next_attempt_at=timezone.now())
+
+        # 待機時間は EMAIL_OUTBOX_RETRY_MAX_SECONDS で打ち切られる
+        delay = service._get_retry_delay(5).total_seconds()
+        self.assertGreaterEqual(delay, 200)
+        self.assertLessEqual(delay, 220)
+
+    @override_settings(EMAIL_BACKEND="core.tests.test_email_outbox.FailingEmailBackend")
+    def test_message_fails_after_max_attempts(self):
+        message = self.enqueue()
+        T_EmailOutbox.objects.filter(pk=message.pk).update(attempt_count=2)
+
+        self.assertEqual(NotificationService().deliver_outbox(process_name=process_name), (0, 1))
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, EmailOutboxStatus.FAILED)
+        self.assertEqual(message.attempt_count, 3)
+        # 送信失敗のメールは再送されない
+        T_EmailOutbox.objects.filter(pk=message.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(NotificationService().deliver_outbox(process_name=process_name), (0, 0))
+
+    def test_worker_command_drains_queue(self):
+        for i in range(3):
+            self.enqueue(f"subject-{i}")
+
+        out = StringIO()
+        call_command("common_email_outbox_worker", "--batch-size", "2", stdout=out)
+
+        self.assertIn("送信成功: 3件 送信失敗: 0件", out.getvalue())
+        self.assertEqual(len(mail.outbox), 3)
+
+
+@override_settings(EMAIL_OUTBOX_RETENTION_DAYS=30, SWEEPER_BATCH_INTERVAL_SECONDS=0)
+class EmailOutboxRetentionTest(TestCase):
+    """
+    保存期間を過ぎた送信済みのメールのみが SweeperService で削除されることを検証する。
+    """
+
+    def create_message(self, status: str, sent_days_ago: int) -> T_EmailOutbox:
+        sent_at = timezone.now() - datetime.timedelta(days=sent_days_ago)
+        return T_EmailOutbox.objects.create(
+            subject="subject",
+            body="body",
+            from_email="from@example.com",
+            recipient_list=["to@example.com"],
+            status=status,
+            next_attempt_at=sent_at,
+            sent_at=sent_at if status == EmailOutboxStatus.SENT else None,
+        )
+
+    def test_old_sent_messages_are_swept(self):
+        self.create_message(EmailOutboxStatus.SENT, sent_days_ago=31)
+        recent = self.create_message(EmailOutboxStatus.SENT, sent_days_ago=1)
+        failed = self.create_message(EmailOutboxStatus.FAILED, sent_days_ago=60)
+        pending = self.create_message(EmailOutboxStatus.PENDING, sent_days_ago=60)
+
+        results = SweeperService().sweep_all()
+
+        self.assertEqual(results["t_email_outbox"], 1)
+        self.assertEqual(
+            set(T_EmailOutbox.objects.values_list("pk", flat=True)),
+            {recent.pk, failed.pk, pending.pk},
+        )
+
+    @override_settings(EMAIL_OUTBOX_RETENTION_DAYS=0)
+    def test_zero_retention_keeps_sent_messages(self):
+        names = [target.name for target in SweeperService().get_targets()]
+
+        self.assertNotIn("t_email_outbox", names)
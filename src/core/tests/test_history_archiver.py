@@ -0,0 +1,103 @@
+import datetime
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from account.models import M_User, T_LoginHisory
+from core.services.archive_service import HistoryArchiveService
+
+
+class HistoryArchiverTest(TestCase):
+    """
+    common_history_archiver が古い履歴を月ごとの圧縮ファイルに移し、DBから削除することを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="archiver@example.com", password="Archiver-Test-123", is_active=True
+        )
+
+    def setUp(self):
+        archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(archive_dir.cleanup)
+        self.archive_dir = Path(archive_dir.name)
+        settings_override = override_settings(
+            HISTORY_ARCHIVE_DIR=archive_dir.name,
+            HISTORY_ARCHIVE_AFTER_DAYS=30,
+            HISTORY_ARCHIVE_RETENTION_DAYS=365,
+            SWEEPER_BATCH_INTERVAL_SECONDS=0,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def create_login_history(self, identifier: str, created_at: datetime.datetime) -> T_LoginHisory:
+        history = T_LoginHisory.objects.create(
+            m_user=self.user, login_identifier=identifier, is_successful=True
+        )
+        T_LoginHisory.objects.filter(pk=history.pk).update(created_at=created_at)
+        return history
+
+    def read_archive(self, table_name: str, month: datetime.date) -> list:
+        path = HistoryArchiveService().get_archive_path(table_name, month)
+        with gzip.open(path, "rt", encoding="utf-8") as archive_file:
+            return [json.loads(line) for line in archive_file]
+
+    def test_old_rows_are_moved_to_monthly_files(self):
+        now = timezone.localtime()
+        old_month = (now - datetime.timedelta(days=90)).replace(day=10)
+        older_month = (now - datetime.timedelta(days=150)).replace(day=10)
+        self.create_login_history("old-1", old_month)
+        self.create_login_history("old-2", old_month + datetime.timedelta(days=1))
+        self.create_login_history("older", older_month)
+        recent = self.create_login_history("recent", now - datetime.timedelta(days=1))
+
+        out = StringIO()
+        call_command("common_history_archiver", "--batch-size", "2", stdout=out)
+
+        self.assertIn("t_login_history: 3件をアーカイブしました。", out.getvalue())
+        self.assertEqual(list(T_LoginHisory.objects.values_list("pk", flat=True)), [recent.pk])
+
+        rows = self.read_archive("t_login_history", old_month.date().replace(day=1))
+        self.assertEqual([row["login_identifier"] for row in rows], ["old-1", "old-2"])
+        self.assertEqual(rows[0]["m_user_id"], self.user.pk)
+        rows = self.read_archive("t_login_history", older_month.date().replace(day=1))
+        self.assertEqual([row["login_identifier"] for row in rows], ["older"])
+
+        # 同じ月のファイルには追記する
+        self.create_login_history("old-3", old_month)
+        call_command("common_history_archiver", stdout=StringIO())
+        rows = self.read_archive("t_login_history", old_month.date().replace(day=1))
+        self.assertEqual(len(rows), 3)
+
+    def test_dry_run_does_not_archive(self):
+        self.create_login_history("old", timezone.now() - datetime.timedelta(days=60))
+
+        out = StringIO()
+        call_command("common_history_archiver", "--dry-run", stdout=out)
+
+        self.assertIn("t_login_history: アーカイブ対象 1件", out.getvalue())
+        self.assertEqual(T_LoginHisory.objects.count(), 1)
+        self.assertFalse(any(self.archive_dir.iterdir()))
+
+    def test_expired_archive_files_are_pruned(self):
+        service = HistoryArchiveService()
+        now = timezone.localtime()
+        expired = service.get_archive_path(
+            "t_login_history", (now - datetime.timedelta(days=400)).date().replace(day=1)
+        )
+        kept = service.get_archive_path(
+            "t_login_history", (now - datetime.timedelta(days=300)).date().replace(day=1)
+        )
+        for path in (expired, kept):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(gzip.compress(b""))
+
+        self.assertEqual(service.prune_archives(), [expired])
+        self.assertTrue(kept.exists())
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from core.exceptions import JobQueueFullError
+from core.utils.job_runner import CacheLeaderElection, JobRunner
+
+
+class JobRunnerTest(SimpleTestCase):
+    """
+    JobRunner の実行待ちの上限・定期ジョブ・リーダー選出・集計値を検証する。
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown, wait=True)
+
+    def create_runner(self, owner_id: str = "worker-1", max_pending: int = 10) -> JobRunner:
+        return JobRunner(
+            executor=self.executor,
+            max_pending=max_pending,
+            leader_election=CacheLeaderElection(lease_seconds=30, owner_id=owner_id),
+        )
+
+    def test_submit_records_metrics(self):
+        runner = self.create_runner()
+
+        self.assertEqual(runner.submit(sum, [1, 2], job_name="sum").result(), 3)
+        with self.assertRaises(ZeroDivisionError):
+            runner.submit(lambda: 1 / 0, job_name="fail").result()
+
+        metrics = {m.name: m for m in runner.get_metrics()}
+        self.assertEqual((metrics["sum"].runs, metrics["sum"].failures), (1, 0))
+        self.assertEqual((metrics["fail"].runs, metrics["fail"].failures), (1, 1))
+        self.assertIsNotNone(metrics["sum"].last_duration)
+
+    def test_submit_rejects_when_pending_limit_is_reached(self):
+        runner = self.create_runner(max_pending=1)
+        release = threading.Event()
+        future = runner.submit(release.wait, job_name="blocking")
+
+        with self.assertRaises(JobQueueFullError):
+            runner.submit(print, job_name="rejected")
+
+        release.set()
+        future.result()
+        # 実行が終わると枠が空き、再び登録できる
+        runner.submit(int, job_name="after").result()
+        metrics = {m.name: m for m in runner.get_metrics()}
+        self.assertEqual(metrics["rejected"].rejected, 1)
+
+    def test_periodic_job_does_not_overlap(self):
+        runner = self.create_runner()
+        release = threading.Event()
+        job = runner.schedule(release.wait, interval=10, job_name="periodic", initial_delay=0)
+
+        self.assertEqual(runner.run_pending(now=job.next_run_at), ["periodic"])
+        # 実行時刻前は登録しない
+        self.assertEqual(runner.run_pending(now=job.next_run_at - 1), [])
+        # 前回の実行が終わっていない場合は見送る
+        self.assertEqual(runner.run_pending(now=job.next_run_at), [])
+
+        release.set()
+        job.future.result()
+        self.assertEqual(runner.run_pending(now=job.next_run_at), ["periodic"])
+        job.future.result()
+
+    def test_only_leader_runs_periodic_job(self):
+        leader = self.create_runner(owner_id="worker-1")
+        follower = self.create_runner(owner_id="worker-2")
+        for runner in (leader, follower):
+            runner.schedule(int, interval=10, job_name="leader-only", initial_delay=0)
+
+        self.assertEqual(leader.run_pending(now=10**9), ["leader-only"])
+        self.assertEqual(follower.run_pending(now=10**9), [])
+
+        # リーダーが停止して辞退すると、他のワーカーが引き継ぐ
+        leader.shutdown()
+        self.assertEqual(follower.run_pending(now=10**9), ["leader-only"])
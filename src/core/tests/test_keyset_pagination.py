@@ -0,0 +1,91 @@
+import datetime
+
+from django.core import signing
+from django.test import TestCase
+from django.utils import timezone
+
+from account.models import M_User, M_UserProfile
+from account.repositories.m_user_profile_repository import M_UserProfileRepository
+from core.repositories import COUNT_MODE_EXACT
+from core.repositories.base_repository import KEYSET_CURSOR_SALT
+
+
+class KeysetPaginationTest(TestCase):
+    """
+    paginate_by_keyset のカーソルによる前後のページ移動、改ざんされたカーソルの扱い、
+    作成日時が NULL の行の扱いを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.expected_order = []
+        created_ats = [now - datetime.timedelta(days=i) for i in range(5)] + [None, None]
+        for i, created_at in enumerate(created_ats):
+            user = M_User.objects.create_user(
+                email=f"keyset-{i}@example.com", password="Keyset-Test-123"
+            )
+            M_UserProfile.objects.filter(m_user=user).update(created_at=created_at)
+            cls.expected_order.append(user.pk)
+        # NULL の行は末尾に主キーの降順で並ぶ
+        cls.expected_order[5:] = sorted(cls.expected_order[5:], reverse=True)
+
+    def setUp(self):
+        self.repo = M_UserProfileRepository()
+        self.queryset = M_UserProfile.objects.filter(pk__in=self.expected_order)
+
+    def paginate(self, cursor=None, **kwargs):
+        return self.repo.paginate_by_keyset(self.queryset, cursor=cursor, page_size=3, **kwargs)
+
+    def collect_forward(self):
+        pages = [self.paginate()]
+        while pages[-1].has_next:
+            pages.append(self.paginate(pages[-1].next_cursor))
+        return pages
+
+    def test_forward_paging_reaches_rows_with_null_keys(self):
+        pages = self.collect_forward()
+
+        self.assertEqual(
+            [[profile.pk for profile in page] for page in pages],
+            [self.expected_order[0:3], self.expected_order[3:6], self.expected_order[6:]],
+        )
+        self.assertFalse(pages[0].has_previous)
+        self.assertTrue(pages[-1].has_previous)
+
+    def test_backward_paging_returns_previous_pages_in_order(self):
+        last_page = self.collect_forward()[-1]
+
+        page = self.paginate(last_page.prev_cursor)
+        self.assertEqual([profile.pk for profile in page], self.expected_order[3:6])
+        self.assertTrue(page.has_next)
+
+        page = self.paginate(page.prev_cursor)
+        self.assertEqual([profile.pk for profile in page], self.expected_order[0:3])
+        self.assertFalse(page.has_previous)
+
+    def test_cursor_is_signed_and_carries_count(self):
+        first_page = self.paginate(count_mode=COUNT_MODE_EXACT)
+        self.assertEqual(first_page.count, 7)
+
+        payload = signing.loads(first_page.next_cursor, salt=KEYSET_CURSOR_SALT)
+        self.assertEqual(payload["d"], "n")
+        self.assertEqual(payload["k"][-1], self.expected_order[2])
+        self.assertEqual(payload["c"], 7)
+
+        # 2ページ目以降は件数を数え直さず、カーソルの件数を引き継ぐ
+        with self.assertNumQueries(1):
+            second_page = self.paginate(first_page.next_cursor, count_mode=COUNT_MODE_EXACT)
+        self.assertEqual(second_page.count, 7)
+
+    def test_tampered_cursor_returns_first_page(self):
+        cursor = self.paginate().next_cursor
+        forged = signing.dumps(
+            {"k": ["2000-01-01T00:00:00+00:00", 1], "d": "n"}, salt="other-salt", compress=True
+        )
+
+        for invalid_cursor in (cursor[:-2] + "xx", forged, "not-a-cursor"):
+            with self.subTest(cursor=invalid_cursor):
+                page = self.paginate(invalid_cursor)
+                self.assertEqual([profile.pk for profile in page], self.expected_order[0:3])
+                self.assertFalse(page.has_previous)
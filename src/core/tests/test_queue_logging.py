@@ -0,0 +1,95 @@
+import logging
+import queue
+import threading
+
+from django.test import SimpleTestCase
+
+from core.utils.queue_logging import (
+    DROP_POLICY_BLOCK,
+    DROP_POLICY_DROP_NEW,
+    DROP_POLICY_DROP_OLDEST,
+    DROPPED_MESSAGE,
+    BoundedQueueHandler,
+)
+
+
+class BoundedQueueHandlerTest(SimpleTestCase):
+    """
+    BoundedQueueHandler がキューの満杯時に drop_policy ごとにログを破棄し、破棄件数を通知することを検証する。
+    """
+
+    def make_handler(self, drop_policy: str, maxsize: int = 2, **kwargs):
+        log_queue = queue.Queue(maxsize=maxsize)
+        return log_queue, BoundedQueueHandler(
+            log_queue, route="application", drop_policy=drop_policy, **kwargs
+        )
+
+    @staticmethod
+    def emit(handler: BoundedQueueHandler, message: str) -> None:
+        handler.handle(
+            logging.LogRecord("application", logging.INFO, __file__, 0, message, None, None)
+        )
+
+    @staticmethod
+    def drain(log_queue: queue.Queue) -> list:
+        messages = []
+        while not log_queue.empty():
+            messages.append(log_queue.get_nowait().getMessage())
+        return messages
+
+    def test_drop_new_discards_incoming_records(self):
+        log_queue, handler = self.make_handler(DROP_POLICY_DROP_NEW)
+
+        for message in ("first", "second", "third", "fourth"):
+            self.emit(handler, message)
+
+        self.assertEqual(self.drain(log_queue), ["first", "second"])
+
+        # 空きができると、次のログの前に破棄件数を通知する
+        self.emit(handler, "fifth")
+        self.assertEqual(self.drain(log_queue), [DROPPED_MESSAGE.format(2), "fifth"])
+
+    def test_drop_oldest_evicts_queued_records(self):
+        log_queue, handler = self.make_handler(DROP_POLICY_DROP_OLDEST)
+
+        for message in ("first", "second", "third", "fourth"):
+            self.emit(handler, message)
+
+        self.assertEqual(self.drain(log_queue), ["third", "fourth"])
+
+        self.emit(handler, "fifth")
+        records = [log_queue.get_nowait() for _ in range(2)]
+        self.assertEqual(records[0].getMessage(), DROPPED_MESSAGE.format(2))
+        self.assertEqual(records[0].levelno, logging.WARNING)
+        self.assertEqual(records[0].queue_route, "application")
+        self.assertEqual(records[1].getMessage(), "fifth")
+
+    def test_block_drops_after_timeout(self):
+        log_queue, handler = self.make_handler(DROP_POLICY_BLOCK, block_timeout=0.01)
+
+        # 空きができなければ block_timeout 秒待ってから破棄する
+        for message in ("first", "second", "third"):
+            self.emit(handler, message)
+
+        self.assertEqual(self.drain(log_queue), ["first", "second"])
+        self.emit(handler, "fourth")
+        self.assertEqual(self.drain(log_queue), [DROPPED_MESSAGE.format(1), "fourth"])
+
+    def test_block_waits_for_space(self):
+        log_queue, handler = self.make_handler(DROP_POLICY_BLOCK, maxsize=1, block_timeout=5)
+        self.emit(handler, "first")
+
+        # 待機中に空きができれば破棄せずに積む
+        consumer = threading.Timer(0.05, log_queue.get_nowait)
+        consumer.start()
+        self.emit(handler, "second")
+        consumer.join()
+
+        self.assertEqual(self.drain(log_queue), ["second"])
+
+    def test_records_carry_route(self):
+        log_queue, handler = self.make_handler(DROP_POLICY_DROP_NEW)
+
+        self.emit(handler, "message")
+
+        self.assertEqual(log_queue.get_nowait().queue_route, "application")
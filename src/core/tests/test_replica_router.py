@@ -0,0 +1,96 @@
+from django.db import DEFAULT_DB_ALIAS, router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from account.models import M_User
+from account.repositories.m_user_profile_repository import M_UserProfileRepository
+from account.repositories.m_user_repository import M_UserRepository
+from core.db_router import (
+    PrimaryReplicaRouter,
+    ReadRoutingState,
+    activate_read_routing,
+    deactivate_read_routing,
+    get_current_read_routing_state,
+    get_read_database,
+)
+from core.middlewares.replica_routing_middleware import (
+    PRIMARY_STICKY_COOKIE_NAME,
+    ReplicaRoutingMiddleware,
+)
+
+
+@override_settings(REPLICA_DATABASES=["replica_1"], READ_YOUR_WRITES_SECONDS=10)
+class ReplicaRouterTest(SimpleTestCase):
+    """
+    リポジトリの参照系メソッドがレプリカに振り分けられ、書き込んだクライアントはプライマリに固定されることを検証する。
+    (クエリは実行せず、QuerySetの読み込み先のみを確認する)
+    """
+
+    def activate(self, state: ReadRoutingState) -> None:
+        token = activate_read_routing(state)
+        self.addCleanup(deactivate_read_routing, token)
+
+    def test_outside_request_reads_from_primary(self):
+        self.assertEqual(get_read_database(), DEFAULT_DB_ALIAS)
+        self.assertEqual(M_UserRepository().get_alive_records().db, DEFAULT_DB_ALIAS)
+
+    def test_repository_reads_from_replica(self):
+        self.activate(ReadRoutingState())
+
+        self.assertEqual(M_UserRepository().get_alive_records().db, "replica_1")
+        self.assertEqual(M_UserProfileRepository().find_public_profiles().db, "replica_1")
+        # 書き込みは常にプライマリ
+        self.assertEqual(router.db_for_write(M_User), DEFAULT_DB_ALIAS)
+
+    def test_write_pins_request_to_primary(self):
+        state = ReadRoutingState()
+        self.activate(state)
+
+        router.db_for_write(M_User)
+
+        self.assertTrue(state.wrote)
+        self.assertEqual(M_UserRepository().get_alive_records().db, DEFAULT_DB_ALIAS)
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(PrimaryReplicaRouter().allow_migrate("replica_1", "account"))
+        self.assertIsNone(PrimaryReplicaRouter().allow_migrate(DEFAULT_DB_ALIAS, "account"))
+
+
+@override_settings(REPLICA_DATABASES=["replica_1"], READ_YOUR_WRITES_SECONDS=10)
+class ReplicaRoutingMiddlewareTest(SimpleTestCase):
+    """
+    書き込みを行ったレスポンスでCookieを設定し、以降のリクエストをプライマリに固定することを検証する。
+    """
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.states = []
+
+    def view(self, write: bool = False):
+        def get_response(request):
+            state = get_current_read_routing_state()
+            self.states.append((state.pinned_to_primary, get_read_database()))
+            if write:
+                router.db_for_write(M_User)
+            return HttpResponse()
+
+        return ReplicaRoutingMiddleware(get_response)
+
+    def test_read_only_request_uses_replica(self):
+        response = self.view()(self.factory.get("/"))
+
+        self.assertEqual(self.states, [(False, "replica_1")])
+        self.assertNotIn(PRIMARY_STICKY_COOKIE_NAME, response.cookies)
+
+    def test_write_sets_sticky_cookie(self):
+        response = self.view(write=True)(self.factory.post("/"))
+
+        self.assertEqual(self.states, [(True, DEFAULT_DB_ALIAS)])
+        cookie = response.cookies[PRIMARY_STICKY_COOKIE_NAME]
+        self.assertEqual(cookie["max-age"], 10)
+
+        # Cookieが有効な間は、読み込みのみのリクエストもプライマリから読み込む
+        request = self.factory.get("/")
+        request.COOKIES[PRIMARY_STICKY_COOKIE_NAME] = cookie.value
+        self.view()(request)
+        self.assertEqual(self.states[-1], (True, DEFAULT_DB_ALIAS))
@@ -0,0 +1,79 @@
+import hashlib
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from account.models import M_User, T_UserToken
+from account.models.t_user_token import TokenTypes
+from core.models import SelectiveHistoricalRecords
+from core.utils.history_buffer import HistoryBuffer
+
+
+class SelectiveHistoryTest(TestCase):
+    """
+    SelectiveHistoricalRecords が対象外の列のみの更新で履歴を登録しないこと、
+    非同期モードでコミット後にまとめて登録することを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="history@example.com", password="History-Test-123", is_active=True
+        )
+
+    def test_ignored_fields_do_not_create_history(self):
+        user = M_User.objects.get(pk=self.user.pk)
+        history_count = user.history.count()
+
+        user.last_login = timezone.now()
+        user.save()
+        self.assertEqual(user.history.count(), history_count)
+
+        user.is_first_login = False
+        user.save()
+        self.assertEqual(user.history.count(), history_count + 1)
+
+    def test_update_fields_limit_changed_fields(self):
+        user = M_User.objects.get(pk=self.user.pk)
+        history_count = user.history.count()
+
+        # is_first_login も変更しているが、保存するのは last_login のみ
+        user.is_first_login = not user.is_first_login
+        user.last_login = timezone.now()
+        user.save(update_fields=["last_login"])
+        self.assertEqual(user.history.count(), history_count)
+
+    def test_tracked_fields(self):
+        history = SelectiveHistoricalRecords(tracked_fields=["display_name"])
+        profile = self.user.user_profile
+
+        profile.bio = "bio"
+        self.assertFalse(history.has_tracked_changes(profile))
+        profile.display_name = "renamed"
+        self.assertTrue(history.has_tracked_changes(profile))
+
+    @override_settings(HISTORY_ASYNC=True)
+    def test_async_history_is_bulk_inserted_after_commit(self):
+        buffer = HistoryBuffer(batch_size=100, flush_interval=3600, asynchronous=True)
+        with mock.patch("core.utils.history_buffer.get_history_buffer", return_value=buffer):
+            with self.captureOnCommitCallbacks(execute=True):
+                tokens = [
+                    T_UserToken.objects.create(
+                        m_user=self.user,
+                        token_hash=hashlib.sha256(f"async-{i}".encode()).hexdigest(),
+                        token_type=TokenTypes.PASSWORD_RESET,
+                        expired_at=timezone.now(),
+                    )
+                    for i in range(3)
+                ]
+                # コミット前はバッファにも追加しない
+                self.assertEqual(len(buffer), 0)
+
+        history = T_UserToken.history.filter(id__in=[token.pk for token in tokens])
+        self.assertEqual(len(buffer), 3)
+        self.assertFalse(history.exists())
+
+        with self.assertNumQueries(1):
+            self.assertEqual(buffer.flush(), 3)
+        self.assertEqual(history.filter(history_type="+").count(), 3)
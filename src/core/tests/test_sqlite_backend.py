@@ -0,0 +1,108 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase
+
+from core.db_backends.sqlite3.base import apply_pragmas
+
+PRAGMAS = {
+    "busy_timeout": 3000,
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -2000,
+    "mmap_size": 1048576,
+    "temp_store": "MEMORY",
+}
+
+hooked_connections = []
+
+
+def record_connection(conn):
+    hooked_connections.append(conn)
+
+
+class SqliteBackendTest(SimpleTestCase):
+    """
+    core.db_backends.sqlite3 が接続ごとにPRAGMAと初期化フックを適用することを検証する。
+    """
+
+    # テスト用のDBは使用せず、一時ファイル・インメモリDBに別の接続を開く (SimpleTestCase の接続の禁止を解除する)
+    databases = {"default"}
+
+    def connect(self, name: str):
+        handler = ConnectionHandler(
+            {
+                "default": {
+                    "ENGINE": "core.db_backends.sqlite3",
+                    "NAME": name,
+                    "OPTIONS": {
+                        "pragmas": PRAGMAS,
+                        "init_hooks": ["core.tests.test_sqlite_backend.record_connection"],
+                    },
+                }
+            }
+        )
+        connection = handler["default"]
+        connection.ensure_connection()
+        self.addCleanup(connection.close)
+        return connection
+
+    def pragma(self, connection, name: str):
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_pragmas_are_applied_on_connect(self):
+        work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(work_dir.cleanup)
+        hooked_connections.clear()
+
+        connection = self.connect(str(Path(work_dir.name) / "tuned.sqlite3"))
+
+        self.assertEqual(self.pragma(connection, "journal_mode"), "wal")
+        self.assertEqual(self.pragma(connection, "synchronous"), 1)  # NORMAL
+        self.assertEqual(self.pragma(connection, "busy_timeout"), 3000)
+        self.assertEqual(self.pragma(connection, "cache_size"), -2000)
+        self.assertEqual(self.pragma(connection, "mmap_size"), 1048576)
+        self.assertEqual(self.pragma(connection, "temp_store"), 2)  # MEMORY
+        # Django標準のPRAGMAも適用されたまま
+        self.assertEqual(self.pragma(connection, "foreign_keys"), 1)
+        self.assertEqual(hooked_connections, [connection.connection])
+
+    def test_journal_mode_is_skipped_for_in_memory_db(self):
+        connection = self.connect(":memory:")
+
+        self.assertEqual(self.pragma(connection, "journal_mode"), "memory")
+        self.assertEqual(self.pragma(connection, "busy_timeout"), 3000)
+
+    def test_invalid_pragma_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            apply_pragmas(None, {"foreign_keys": "OFF"})
+        with self.assertRaises(ImproperlyConfigured):
+            apply_pragmas(None, {"journal_mode": "WAL; DROP TABLE m_user"})
+
+
+class SqliteBenchmarkCommandTest(SimpleTestCase):
+    """
+    common_sqlite_benchmark が既定の設定とチューニング後の設定のスループットを出力することを検証する。
+    """
+
+    def test_benchmark_reports_both_settings(self):
+        out = StringIO()
+        call_command(
+            "common_sqlite_benchmark",
+            "--readers", "1",
+            "--writers", "1",
+            "--duration", "0.2",
+            "--rows", "100",
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn("default: 読み込み", output)
+        self.assertIn("tuned: 読み込み", output)
+        self.assertIn("tuned/default:", output)
@@ -0,0 +1,86 @@
+import hashlib
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from account.models import M_User, T_UserSession
+from account.models.t_user_token import T_UserToken, TokenTypes
+from core.services.sweeper_service import SweeperService
+
+
+@override_settings(
+    SWEEPER_BATCH_INTERVAL_SECONDS=0,
+    EXPIRED_TOKEN_RETENTION_DAYS=7,
+    HISTORY_RETENTION_DAYS=30,
+)
+class SweeperTest(TestCase):
+    """
+    common_expired_data_sweeper が期限切れ・保存期間切れのレコードのみを少量ずつ削除することを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="sweeper@example.com", password="Sweeper-Test-123", is_active=True
+        )
+
+    @classmethod
+    def create_token(cls, name: str, expired_days_ago: int) -> T_UserToken:
+        return T_UserToken.objects.create(
+            m_user=cls.user,
+            token_hash=hashlib.sha256(name.encode()).hexdigest(),
+            token_type=TokenTypes.PASSWORD_RESET,
+            expired_at=timezone.now() - timezone.timedelta(days=expired_days_ago),
+        )
+
+    def test_expired_tokens_and_sessions_are_deleted_in_batches(self):
+        for i in range(3):
+            self.create_token(f"old-{i}", expired_days_ago=8)
+        recent = self.create_token("recent", expired_days_ago=1)
+        now = timezone.now()
+        T_UserSession.objects.create(
+            session_key="expired", session_data="", expire_date=now - timezone.timedelta(minutes=1)
+        )
+        T_UserSession.objects.create(
+            session_key="alive", session_data="", expire_date=now + timezone.timedelta(hours=1)
+        )
+
+        service = SweeperService()
+        targets = {target.name: target for target in service.get_targets()}
+
+        # 1件ずつ削除する場合: 3件の削除 + 残りがないことの確認 の4回の取得
+        with self.assertNumQueries(3 + 4):
+            deleted = service.sweep(targets["t_user_token"], batch_size=1, interval=0)
+        self.assertEqual(deleted, 3)
+        self.assertEqual(list(T_UserToken.objects.values_list("pk", flat=True)), [recent.pk])
+
+        self.assertEqual(service.sweep(targets["t_user_session"]), 1)
+        self.assertEqual(
+            list(T_UserSession.objects.values_list("session_key", flat=True)), ["alive"]
+        )
+
+    def test_old_history_is_deleted(self):
+        token = self.create_token("history", expired_days_ago=0)
+        history = T_UserToken.history.filter(id=token.pk)
+        history.update(history_date=timezone.now() - timezone.timedelta(days=31))
+        token.revoked_at = timezone.now()
+        token.save()
+
+        out = StringIO()
+        call_command("common_expired_data_sweeper", stdout=out)
+
+        # 保存期間を過ぎた作成時の履歴のみが削除され、変更時の履歴は残る
+        self.assertEqual(list(history.values_list("history_type", flat=True)), ["~"])
+        self.assertIn(f"{T_UserToken.history.model._meta.db_table}: 1件", out.getvalue())
+        self.assertTrue(T_UserToken.objects.filter(pk=token.pk).exists())
+
+    def test_dry_run_does_not_delete(self):
+        self.create_token("dry-run", expired_days_ago=8)
+
+        out = StringIO()
+        call_command("common_expired_data_sweeper", "--dry-run", stdout=out)
+
+        self.assertIn("t_user_token: 削除対象 1件", out.getvalue())
+        self.assertEqual(T_UserToken.objects.count(), 1)
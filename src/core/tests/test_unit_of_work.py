@@ -0,0 +1,74 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from account.models import M_User
+from account.repositories.m_user_profile_repository import M_UserProfileRepository
+from account.repositories.m_user_repository import M_UserRepository
+
+
+class UnitOfWorkTest(TestCase):
+    """
+    BaseRepository.unit_of_work() で変更した列のみが1行1回のUPDATEで書き込まれることを検証する。
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = M_User.objects.create_user(
+            email="unit-of-work@example.com", password="Unit-Of-Work-123", is_active=True
+        )
+
+    def setUp(self):
+        self.user_repo = M_UserRepository()
+        self.profile_repo = M_UserProfileRepository()
+
+    @staticmethod
+    def _get_updates(queries):
+        return [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+
+    def test_changes_are_flushed_once_per_row(self):
+        with CaptureQueriesContext(connection) as ctx:
+            with self.user_repo.unit_of_work():
+                profile = self.profile_repo.get_alive_one_or_none(m_user=self.user.pk)
+                self.profile_repo.update(profile, display_name="first")
+                self.profile_repo.update(profile, theme="dark", updated_method="Test")
+                self.assertEqual(self._get_updates(ctx.captured_queries), [])
+
+        updates = self._get_updates(ctx.captured_queries)
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"display_name"', updates[0])
+        self.assertIn('"theme"', updates[0])
+        self.assertNotIn('"bio"', updates[0])
+
+        profile.refresh_from_db()
+        self.assertEqual((profile.display_name, profile.theme), ("first", "dark"))
+
+    def test_unchanged_rows_are_not_written(self):
+        with CaptureQueriesContext(connection) as ctx:
+            with self.user_repo.unit_of_work():
+                user = self.user_repo.get_alive_by_pk(self.user.pk)
+                self.user_repo.update(
+                    user, is_active=True, updated_by=self.user, updated_method="Test"
+                )
+
+        self.assertEqual(self._get_updates(ctx.captured_queries), [])
+
+    def test_changes_are_discarded_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.user_repo.unit_of_work():
+                user = self.user_repo.get_alive_by_pk(self.user.pk)
+                self.user_repo.update(user, is_first_login=False)
+                raise RuntimeError()
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_first_login)
+
+    def test_soft_delete_is_deferred_until_exit(self):
+        with self.user_repo.unit_of_work() as uow:
+            profile = self.profile_repo.get_alive_one_or_none(m_user=self.user.pk)
+            self.profile_repo.soft_delete(profile, user=self.user, process_name="Test")
+            self.assertIsNotNone(self.profile_repo.get_alive_by_pk(self.user.pk))
+
+            # flush() で途中の変更をDBに反映できる
+            self.assertEqual(uow.flush(), 1)
+            self.assertIsNone(self.profile_repo.get_alive_by_pk(self.user.pk))
@@ -0,0 +1,87 @@
+import threading
+
+from django.db import OperationalError
+from django.test import SimpleTestCase
+
+from core.utils.write_behind_buffer import WriteBehindBuffer
+
+
+class ListBuffer(WriteBehindBuffer):
+    """書き込んだ内容をリストに記録するテスト用のバッファ"""
+
+    def __init__(self, asynchronous: bool, fail_times: int = 0):
+        super().__init__(batch_size=100, flush_interval=3600, asynchronous=asynchronous)
+        self.fail_times = fail_times
+        self.items = []
+        self.written = []
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def _append(self, item):
+        self.items.append(item)
+
+    def _take(self):
+        items, self.items = self.items, []
+        return items
+
+    def _restore(self, items):
+        self.items[:0] = items
+
+    def _size(self):
+        return len(self.items)
+
+    def _write(self, items):
+        self.writing.set()
+        self.release.wait(5)
+        if self.fail_times:
+            self.fail_times -= 1
+            raise OperationalError("database is locked")
+        self.written.extend(items)
+
+
+class WriteBehindBufferTest(SimpleTestCase):
+    """
+    WriteBehindBuffer が同期モードで同時に追加された内容を取り残さず、
+    反映に失敗した内容をバッファに戻すことを検証する。
+    """
+
+    def test_sync_add_during_other_write_is_not_stranded(self):
+        buffer = ListBuffer(asynchronous=False)
+        buffer.release.clear()
+
+        # 1つ目のスレッドの書き込み中に、2つ目のスレッドが追加する
+        thread = threading.Thread(target=buffer.add, args=("A",))
+        thread.start()
+        self.assertTrue(buffer.writing.wait(5))
+        adder = threading.Thread(target=buffer.add, args=("B",))
+        adder.start()
+        buffer.release.set()
+        thread.join()
+        adder.join()
+
+        self.assertEqual(sorted(buffer.written), ["A", "B"])
+        self.assertEqual(len(buffer), 0)
+
+    def test_sync_write_failure_is_raised_to_caller(self):
+        buffer = ListBuffer(asynchronous=False, fail_times=1)
+
+        with self.assertRaises(OperationalError):
+            buffer.add("A")
+
+        buffer.add("B")
+        self.assertEqual(buffer.written, ["B"])
+
+    def test_failed_flush_restores_items_in_order(self):
+        buffer = ListBuffer(asynchronous=True, fail_times=1)
+        for item in ("A", "B"):
+            buffer.add(item)
+
+        with self.assertRaises(OperationalError):
+            buffer.flush()
+
+        # 戻した内容は、失敗後に追加された内容より先に書き込む
+        buffer.add("C")
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.flush(), 3)
+        self.assertEqual(buffer.written, ["A", "B", "C"])
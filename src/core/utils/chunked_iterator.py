@@ -0,0 +1,55 @@
+from typing import Iterator, List, Optional, Sequence
+
+from django.db.models import Model, QuerySet
+
+# 役割: 大量のレコードを主キーの昇順に一定件数ずつ取得し、メモリ使用量を件数によらず一定に保つ。
+# 利用例: BaseRepository.iter_chunks() / iter_alive_records() から使用する
+#         (バッチ処理・管理コマンド・データ修正スクリプトでの全件走査)。
+
+# 1回のSELECTで取得する件数
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def iterate_in_chunks(
+    queryset: QuerySet,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    only: Optional[Sequence[str]] = None,
+) -> Iterator[List[Model]]:
+    """
+    QuerySet を主キーの昇順に chunk_size 件ずつのリストで返す。
+
+    OFFSET ではなく「前のチャンクの末尾の主キーより後」を条件に LIMIT するため、
+    走査の途中でも1回のSELECTは chunk_size 件分の読み取りで済み、
+    走査中に対象のレコードを更新しても (条件から外れても) 読み飛ばしは発生しない。
+    各チャンクは QuerySet.iterator() で取得するため、サーバーサイドカーソルに対応した
+    DB (PostgreSQL など) では結果セット全体をクライアントに読み込まない。
+
+    Args:
+        queryset: 走査対象のQuerySet (並び順は主キーの昇順で上書きされる)
+        chunk_size: 1回のSELECTで取得する件数
+        only: 取得する列 (省略した場合は全列。主キーは常に取得される)
+    """
+    if only:
+        queryset = queryset.only(*only)
+    queryset = queryset.order_by("pk")
+
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size].iterator(chunk_size=chunk_size))
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_size:
+            return
+        last_pk = chunk[-1].pk
+
+
+def iterate_records(
+    queryset: QuerySet,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    only: Optional[Sequence[str]] = None,
+) -> Iterator[Model]:
+    """iterate_in_chunks() で取得したレコードを1件ずつ返す"""
+    for chunk in iterate_in_chunks(queryset, chunk_size=chunk_size, only=only):
+        yield from chunk
@@ -1,7 +1,8 @@
 import os
 import random
 import string
-from typing import Any, Dict, Optional, Union
+import unicodedata
+from typing import Any, Dict, List, Optional, Union
 
 # 役割: 上記のテーマ（日付/ストレージ/メール）に分類されない、汎用的なヘルパー関数やデータクレンジング処理を定義する。
 # 利用例: ランダムなトークンの生成、フォーム入力値のNull/空白チェック。
@@ -78,3 +79,30 @@ def clean_input_data(data: Dict[str, Any]) -> Dict[str, Any]:
         else:
             cleaned_data[key] = value
     return cleaned_data
+
+
+def normalize_tag(name: str) -> str:
+    """
+    タグ名を検索キーとして正規化する（NFKC正規化 + 小文字化 + 前後の空白除去）。
+    例: "Ｐｙｔｈｏｎ " -> "python"
+    """
+    return unicodedata.normalize("NFKC", name).strip().casefold()
+
+
+def split_tags(raw: Optional[str], max_length: int = 64) -> List[str]:
+    """
+    カンマ区切りのタグ文字列をリストに変換する。
+    空要素は除外し、正規化後に重複するタグは最初の表記のみを残す。
+    """
+    if not raw:
+        return []
+
+    tags = []
+    seen = set()
+    for name in raw.split(","):
+        name = name.strip()[:max_length]
+        key = normalize_tag(name)
+        if key and key not in seen:
+            seen.add(key)
+            tags.append(name)
+    return tags
@@ -0,0 +1,75 @@
+import threading
+from collections import defaultdict
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Model
+
+from core.utils.write_behind_buffer import WriteBehindBuffer
+
+# 役割: 変更履歴 (simple_history の履歴モデル) の INSERT をプロセス内に溜め、履歴モデルごとに一括で登録する。
+# 利用例: core.models.SelectiveHistoricalRecords が settings.HISTORY_ASYNC=True の場合に、
+#         トランザクションのコミット後に record() で履歴を追加する (リクエストでは履歴の INSERT を待たない)。
+
+
+class HistoryBuffer(WriteBehindBuffer):
+    """変更履歴のインスタンスを溜めておき、履歴モデル・DBごとに bulk_create で登録するクラス"""
+
+    job_name = "HistoryBuffer"
+
+    def __init__(self, batch_size: int = 500, flush_interval: float = 5.0, asynchronous: bool = True):
+        super().__init__(batch_size, flush_interval, asynchronous)
+        self._histories: List[Tuple[Model, Optional[str]]] = []
+
+    def record(self, history_instance: Model, using: Optional[str] = None) -> None:
+        """登録する履歴のインスタンスを追加する"""
+        self.add((history_instance, using))
+
+    def _append(self, item: Tuple[Model, Optional[str]]) -> None:
+        self._histories.append(item)
+
+    def _take(self) -> List[Tuple[Model, Optional[str]]]:
+        histories, self._histories = self._histories, []
+        return histories
+
+    def _restore(self, items: List[Tuple[Model, Optional[str]]]) -> None:
+        self._histories[:0] = items
+
+    def _size(self) -> int:
+        return len(self._histories)
+
+    def _write(self, items: List[Tuple[Model, Optional[str]]]) -> None:
+        grouped = defaultdict(lambda: defaultdict(list))
+        for history_instance, using in items:
+            grouped[using][type(history_instance)].append(history_instance)
+        # 失敗時に再登録しても重複しないよう、DBごとに全ての履歴モデルを1トランザクションで登録する
+        for using, histories_by_model in grouped.items():
+            with transaction.atomic(using=using, savepoint=False):
+                for history_model, histories in histories_by_model.items():
+                    history_model._default_manager.db_manager(using).bulk_create(
+                        histories, batch_size=self.batch_size
+                    )
+
+
+# プロセス内で共有するバッファ (get_history_buffer() で初回に作成する)
+_history_buffer: Optional[HistoryBuffer] = None
+_history_buffer_lock = threading.Lock()
+
+
+def get_history_buffer() -> HistoryBuffer:
+    """設定値に基づいて作成した、プロセス内で共有する変更履歴のバッファを返す"""
+    global _history_buffer
+    with _history_buffer_lock:
+        if _history_buffer is None:
+            _history_buffer = HistoryBuffer(
+                batch_size=settings.HISTORY_BATCH_SIZE,
+                flush_interval=settings.HISTORY_FLUSH_INTERVAL_SECONDS,
+            )
+            _history_buffer.register_atexit()
+        return _history_buffer
+
+
+def flush_history() -> int:
+    """定期ジョブ (settings.PERIODIC_JOBS) から呼び出す、変更履歴の登録処理"""
+    return get_history_buffer().flush()
@@ -0,0 +1,60 @@
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple, Type
+
+from django.db.models import Model
+
+# 役割: 1リクエスト内で取得したモデルインスタンスを主キーごとに保持する (アイデンティティマップ)。
+# 利用例: IdentityMapMiddleware がリクエストごとに作成し、リポジトリ・コンテキストプロセッサから
+#         get_current_identity_map() で参照する。リクエスト外 (管理コマンドなど) ではNoneが返り、保持しない。
+
+# 未登録を表す値 (「存在しない」ことを登録した場合の None と区別する)
+MISSING = object()
+
+_current_identity_map: ContextVar[Optional["IdentityMap"]] = ContextVar(
+    "current_identity_map", default=None
+)
+
+
+class IdentityMap:
+    """
+    モデルと主キーの組み合わせごとにインスタンスを保持するクラス。
+    同じレコードを何度参照しても、DBからの取得は最初の1回のみとする。
+    """
+
+    def __init__(self):
+        self._objects: Dict[Tuple[str, Any], Optional[Model]] = {}
+
+    @staticmethod
+    def _make_key(model: Type[Model], pk: Any) -> Tuple[str, Any]:
+        return model._meta.label_lower, pk
+
+    def get(self, model: Type[Model], pk: Any) -> Any:
+        """
+        保持しているインスタンスを返す。
+        未登録の場合は MISSING、レコードが存在しないことを登録済みの場合は None を返す。
+        """
+        return self._objects.get(self._make_key(model, pk), MISSING)
+
+    def add(self, model: Type[Model], pk: Any, instance: Optional[Model]) -> None:
+        """インスタンスを登録する (instance=None の場合はレコードが存在しないことを登録する)"""
+        self._objects[self._make_key(model, pk)] = instance
+
+    def discard(self, model: Type[Model], pk: Any) -> None:
+        self._objects.pop(self._make_key(model, pk), None)
+
+    def clear(self) -> None:
+        self._objects.clear()
+
+
+def get_current_identity_map() -> Optional[IdentityMap]:
+    """処理中のリクエストのアイデンティティマップを返す (リクエスト外の場合はNone)"""
+    return _current_identity_map.get()
+
+
+def activate_identity_map(identity_map: Optional[IdentityMap]):
+    """アイデンティティマップを有効にする。戻り値は deactivate_identity_map() に渡す"""
+    return _current_identity_map.set(identity_map)
+
+
+def deactivate_identity_map(token) -> None:
+    _current_identity_map.reset(token)
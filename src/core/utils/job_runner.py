@@ -0,0 +1,345 @@
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from core.consts import LOG_METHOD
+from core.exceptions import JobQueueFullError
+from core.utils.log_helpers import log_output_by_msg_id
+
+# 役割: core.utils.thread_pool_executor のスレッドプール上でジョブを実行する、プロセス内のジョブランナー。
+# 利用例: get_job_runner().submit(func, ...) で時間のかかる処理をリクエストから切り離して実行する。
+#         settings.PERIODIC_JOBS に定義した定期ジョブは、gunicorn.py の post_worker_init フックから
+#         start_job_runner() で開始し、リーダーに選出された1つのワーカーのみが実行する。
+
+
+@dataclass
+class JobMetrics:
+    """ジョブ1件分の実行回数・処理時間の集計値"""
+
+    name: str
+    runs: int = 0
+    failures: int = 0
+    # 実行待ちの上限により登録を拒否した回数
+    rejected: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    last_duration: Optional[float] = None
+    last_finished_at: Optional[Any] = None
+
+    @property
+    def avg_duration(self) -> float:
+        return self.total_duration / self.runs if self.runs else 0.0
+
+
+@dataclass
+class PeriodicJob:
+    """定期ジョブ1件分の定義と次回の実行時刻"""
+
+    name: str
+    func: Callable
+    interval: float
+    leader_only: bool = True
+    # 次回の実行時刻 (time.monotonic() の値)
+    next_run_at: float = 0.0
+    future: Optional[Future] = field(default=None, repr=False)
+
+
+class CacheLeaderElection:
+    """
+    キャッシュの add (キーが存在しない場合のみ登録) を使い、ジョブごとに1つのプロセスをリーダーに選出する。
+
+    リーダーは acquire() を呼び出すたびに期限を延長し、停止した場合は期限切れ後に他のプロセスが引き継ぐ。
+    ※プロセス間で共有するキャッシュ (settings.CACHE_URL に redis:// など) が必要。
+      プロセスごとのキャッシュ (locmem) では、全てのプロセスがリーダーとなる。
+    """
+
+    CACHE_KEY = "job_leader:{0}"
+
+    def __init__(self, lease_seconds: int, owner_id: Optional[str] = None):
+        self.lease_seconds = lease_seconds
+        self.owner_id = owner_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def acquire(self, name: str) -> bool:
+        """リーダーであれば期限を延長して True、他のプロセスがリーダーの場合は False を返す"""
+        cache_key = self.CACHE_KEY.format(name)
+        if cache.add(cache_key, self.owner_id, timeout=self.lease_seconds):
+            return True
+        if cache.get(cache_key) == self.owner_id:
+            cache.touch(cache_key, timeout=self.lease_seconds)
+            return True
+        return False
+
+    def release(self, name: str) -> None:
+        """リーダーの場合は辞退する (停止時に他のプロセスがすぐに引き継げるようにする)"""
+        cache_key = self.CACHE_KEY.format(name)
+        if cache.get(cache_key) == self.owner_id:
+            cache.delete(cache_key)
+
+
+class JobRunner:
+    """
+    スレッドプールでジョブを実行するクラス。
+
+    - 実行中・実行待ちのジョブ数は max_pending 件までとし、超えた場合は JobQueueFullError を送出する
+      (スレッドプールの内部キューは上限がないため、登録時に件数を制限して呼び出し元に背圧をかける)
+    - ジョブの前後で close_old_connections() を呼び出し、期限切れ・切断されたDB接続を残さない
+    - ジョブごとに実行回数・失敗回数・処理時間を集計する (get_metrics)
+    - schedule() で登録した定期ジョブは、スケジューラスレッドが実行時刻になったものを登録する
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_pending: int = 100,
+        leader_election: Optional[CacheLeaderElection] = None,
+        tick_seconds: float = 5.0,
+    ):
+        if executor is None:
+            from core.utils.thread_pool_executor import executor
+        self.executor = executor
+        self.max_pending = max_pending
+        self.leader_election = leader_election or CacheLeaderElection(lease_seconds=30)
+        self.tick_seconds = tick_seconds
+
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._metrics: Dict[str, JobMetrics] = {}
+        self._metrics_lock = threading.Lock()
+        self._periodic_jobs: Dict[str, PeriodicJob] = {}
+        self._stop_event = threading.Event()
+        self._scheduler_thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # ジョブの登録
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        func: Callable,
+        *args,
+        job_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Future:
+        """
+        ジョブをスレッドプールに登録する。
+
+        実行中・実行待ちのジョブが max_pending 件に達している場合は、timeout 秒まで空きを待ち
+        (None の場合は待たない)、空かなければ JobQueueFullError を送出する。
+        """
+        name = job_name or getattr(func, "__qualname__", repr(func))
+        acquired = (
+            self._slots.acquire(timeout=timeout)
+            if timeout is not None
+            else self._slots.acquire(blocking=False)
+        )
+        if not acquired:
+            with self._metrics_lock:
+                self._get_metrics(name).rejected += 1
+            raise JobQueueFullError(
+                details={"job_name": name, "max_pending": self.max_pending}
+            )
+
+        try:
+            future = self.executor.submit(self._run, name, func, args, kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        # 実行前に取り消されたジョブは _run() を通らないため、ここで枠を空ける
+        future.add_done_callback(lambda f: f.cancelled() and self._slots.release())
+        return future
+
+    def schedule(
+        self,
+        func: Callable,
+        interval: float,
+        job_name: Optional[str] = None,
+        leader_only: bool = True,
+        initial_delay: Optional[float] = None,
+    ) -> PeriodicJob:
+        """
+        定期ジョブを登録する。
+
+        前回の実行が終わっていない場合は、その回の実行を見送る (同じジョブを重ねて実行しない)。
+        leader_only=True の場合は、リーダーに選出されたプロセスのみが実行する。
+        """
+        name = job_name or getattr(func, "__qualname__", repr(func))
+        delay = interval if initial_delay is None else initial_delay
+        job = PeriodicJob(
+            name=name,
+            func=func,
+            interval=interval,
+            leader_only=leader_only,
+            next_run_at=time.monotonic() + delay,
+        )
+        self._periodic_jobs[name] = job
+        return job
+
+    # ------------------------------------------------------------------
+    # スケジューラ
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """定期ジョブのスケジューラスレッドを起動する"""
+        if self._scheduler_thread is not None:
+            return
+        self._stop_event.clear()
+        self._scheduler_thread = threading.Thread(
+            target=self._scheduler_loop, name="JobRunnerScheduler", daemon=True
+        )
+        self._scheduler_thread.start()
+
+    def shutdown(self) -> None:
+        """スケジューラスレッドを停止し、リーダーを辞退する (実行中のジョブは待たない)"""
+        self._stop_event.set()
+        if self._scheduler_thread is not None:
+            self._scheduler_thread.join(timeout=self.tick_seconds * 2)
+            self._scheduler_thread = None
+        for job in self._periodic_jobs.values():
+            if job.leader_only:
+                self.leader_election.release(job.name)
+
+    def run_pending(self, now: Optional[float] = None) -> List[str]:
+        """実行時刻になった定期ジョブを登録し、登録したジョブ名を返す"""
+        now = time.monotonic() if now is None else now
+        submitted = []
+        for job in list(self._periodic_jobs.values()):
+            # リーダーは実行時刻でなくても毎回期限を延長し、リーダーであり続ける
+            if job.leader_only and not self.leader_election.acquire(job.name):
+                continue
+            if now < job.next_run_at:
+                continue
+            job.next_run_at = now + job.interval
+            if job.future is not None and not job.future.done():
+                continue
+
+            try:
+                job.future = self.submit(job.func, job_name=job.name)
+            except JobQueueFullError:
+                log_output_by_msg_id(
+                    log_id="MSGW104",
+                    params=[job.name, self.max_pending],
+                    logger_name=LOG_METHOD.APPLICATION.value,
+                )
+                continue
+            submitted.append(job.name)
+        return submitted
+
+    def _scheduler_loop(self) -> None:
+        while not self._stop_event.wait(self.tick_seconds):
+            try:
+                self.run_pending()
+            except Exception as e:
+                # キャッシュの障害などでスケジューラスレッドを終了させない
+                log_output_by_msg_id(
+                    log_id="MSGE1001",
+                    params=["JobRunnerScheduler", str(e)],
+                    logger_name=LOG_METHOD.APPLICATION.value,
+                )
+
+    # ------------------------------------------------------------------
+    # ジョブの実行・集計
+    # ------------------------------------------------------------------
+    def _run(self, name: str, func: Callable, args: tuple, kwargs: dict) -> Any:
+        # スレッドプールのスレッドはリクエストの開始・終了シグナルを受けないため、DB接続をここで整理する
+        close_old_connections()
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            result = func(*args, **kwargs)
+            succeeded = True
+            return result
+        except Exception as e:
+            log_output_by_msg_id(
+                log_id="MSGE1001",
+                params=[name, str(e)],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self._record(name, duration, succeeded)
+            log_output_by_msg_id(
+                log_id="MSGD002",
+                params=[f"ジョブ: {name}", f"{duration * 1000:.1f}ms"],
+                logger_name=LOG_METHOD.APPLICATION.value,
+            )
+            close_old_connections()
+            # 結果を受け取った呼び出し元がすぐに次のジョブを登録できるよう、完了前に枠を空ける
+            self._slots.release()
+
+    def _record(self, name: str, duration: float, succeeded: bool) -> None:
+        with self._metrics_lock:
+            metrics = self._get_metrics(name)
+            metrics.runs += 1
+            if not succeeded:
+                metrics.failures += 1
+            metrics.total_duration += duration
+            metrics.max_duration = max(metrics.max_duration, duration)
+            metrics.last_duration = duration
+            metrics.last_finished_at = timezone.now()
+
+    def _get_metrics(self, name: str) -> JobMetrics:
+        metrics = self._metrics.get(name)
+        if metrics is None:
+            metrics = self._metrics[name] = JobMetrics(name)
+        return metrics
+
+    def get_metrics(self) -> List[JobMetrics]:
+        """ジョブごとの集計値 (呼び出し時点の複製) を返す"""
+        with self._metrics_lock:
+            return [replace(metrics) for metrics in self._metrics.values()]
+
+
+# プロセス内で共有するジョブランナー (get_job_runner() で初回に作成する)
+_job_runner: Optional[JobRunner] = None
+_job_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """設定値に基づいて作成した、プロセス内で共有するジョブランナーを返す"""
+    global _job_runner
+    with _job_runner_lock:
+        if _job_runner is None:
+            _job_runner = JobRunner(
+                max_pending=settings.JOB_RUNNER_MAX_PENDING,
+                leader_election=CacheLeaderElection(
+                    lease_seconds=settings.JOB_LEADER_LEASE_SECONDS
+                ),
+                tick_seconds=settings.JOB_RUNNER_TICK_SECONDS,
+            )
+        return _job_runner
+
+
+def start_job_runner() -> Optional[JobRunner]:
+    """
+    settings.PERIODIC_JOBS の定期ジョブを登録し、スケジューラを開始する
+    (settings.PERIODIC_JOBS_ENABLED が False の場合は何もしない)。
+    """
+    if not settings.PERIODIC_JOBS_ENABLED:
+        return None
+
+    runner = get_job_runner()
+    for definition in settings.PERIODIC_JOBS:
+        runner.schedule(
+            import_string(definition["func"]),
+            interval=definition["interval"],
+            job_name=definition["name"],
+            leader_only=definition.get("leader_only", True),
+        )
+    runner.start()
+    return runner
+
+
+def stop_job_runner() -> None:
+    """スケジューラを停止する (ワーカー終了時に呼び出す)"""
+    if _job_runner is not None:
+        _job_runner.shutdown()
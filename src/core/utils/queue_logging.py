@@ -0,0 +1,214 @@
+import atexit
+import logging
+import logging.config
+import multiprocessing
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+# 役割: ログ出力をキュー経由の非同期処理に切り替え、リクエスト処理中にファイルI/Oを行わないようにする。
+# 利用例: CoreConfig.ready() から setup_queue_logging() を呼び出す。
+#         gunicorn.py の on_starting フックから start_host_log_listener() を呼び出すと、
+#         ファイルへの書き込みをマスタープロセスの1スレッドに集約する (ホスト単位の書き込み)。
+
+# キューが満杯の場合の動作
+DROP_POLICY_DROP_NEW = "drop_new"  # 新しいログを破棄する (リクエストを待たせない)
+DROP_POLICY_DROP_OLDEST = "drop_oldest"  # 最も古いログを破棄して新しいログを入れる
+DROP_POLICY_BLOCK = "block"  # 一定時間だけ空きを待ち、空かなければ破棄する
+
+# 破棄件数を通知するログのメッセージ (log_output_by_msg_id を使うと再帰するため直接組み立てる)
+DROPPED_MESSAGE = "ログキューが満杯のため、ログを{0}件破棄しました。"
+
+# gunicornマスタープロセスで作成したプロセス間キュー (fork後のワーカーに引き継がれる)
+_host_queue: Optional[multiprocessing.Queue] = None
+# 起動済みのリスナーと、起動したプロセスのID (fork後のワーカーからは停止しない)
+_listener: Optional[QueueListener] = None
+_listener_pid: Optional[int] = None
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    上限付きキューにログを積むハンドラ。
+
+    キューが満杯の場合は drop_policy に従ってログを破棄し、破棄件数は次にキューへ
+    積めたタイミングでWARNINGログとして出力する。
+    リスナー側で出力先を振り分けるため、ログには対象ロガー名 (route) を付与する。
+    """
+
+    def __init__(
+        self,
+        queue_,
+        route: str,
+        drop_policy: str = DROP_POLICY_DROP_NEW,
+        block_timeout: float = 0.05,
+    ):
+        super().__init__(queue_)
+        self.route = route
+        self.drop_policy = drop_policy
+        self.block_timeout = block_timeout
+        self._dropped_count = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.queue_route = self.route
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # 破棄件数の通知は空きがある場合のみ積む (通知のために他のログを破棄しない)
+        if self._dropped_count and self._put(self._make_dropped_record(), evict=False):
+            with self._dropped_lock:
+                self._dropped_count = 0
+
+        if not self._put(record):
+            with self._dropped_lock:
+                self._dropped_count += 1
+
+    def _put(self, record: logging.LogRecord, evict: bool = True) -> bool:
+        """キューにログを積む。積めなかった場合はFalseを返す"""
+        try:
+            if self.drop_policy == DROP_POLICY_BLOCK and evict:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            pass
+
+        if self.drop_policy == DROP_POLICY_DROP_OLDEST and evict:
+            try:
+                self.queue.get_nowait()
+                with self._dropped_lock:
+                    self._dropped_count += 1
+                self.queue.put_nowait(record)
+                return True
+            except (queue.Empty, queue.Full):
+                pass
+        return False
+
+    def _make_dropped_record(self) -> logging.LogRecord:
+        record = logging.LogRecord(
+            name=self.route,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=DROPPED_MESSAGE.format(self._dropped_count),
+            args=None,
+            exc_info=None,
+        )
+        record.queue_route = self.route
+        return record
+
+
+class RoutingQueueListener(QueueListener):
+    """
+    キューからログを取り出し、ログに付与された route (ロガー名) ごとのハンドラへ出力するリスナー。
+    1つのスレッドで全ロガーのファイル書き込みを行う。
+    """
+
+    def __init__(self, queue_, handlers_by_route: Dict[str, List[logging.Handler]]):
+        super().__init__(queue_)
+        self.handlers_by_route = handlers_by_route
+
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        for handler in self.handlers_by_route.get(getattr(record, "queue_route", ""), []):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def stop(self) -> None:
+        super().stop()
+        for handlers in self.handlers_by_route.values():
+            for handler in handlers:
+                handler.close()
+
+
+def _collect_handlers(logger_names: List[str]) -> Dict[str, List[logging.Handler]]:
+    """ロガー名ごとに、現在設定されているハンドラを取得する"""
+    return {
+        name: list(logging.getLogger(name).handlers)
+        for name in logger_names
+        if logging.getLogger(name).handlers
+    }
+
+
+def _start_listener(queue_, handlers_by_route: Dict[str, List[logging.Handler]]) -> None:
+    global _listener, _listener_pid
+    _listener = RoutingQueueListener(queue_, handlers_by_route)
+    _listener_pid = os.getpid()
+    _listener.start()
+    # プロセス終了時にキューに残ったログを書き出す
+    atexit.register(stop_queue_logging)
+
+
+def setup_queue_logging(
+    logger_names: List[str],
+    maxsize: int = 10000,
+    drop_policy: str = DROP_POLICY_DROP_NEW,
+) -> None:
+    """
+    指定ロガーのハンドラをキュー経由の非同期出力に切り替える。
+
+    gunicornマスタープロセスでリスナーが起動済みの場合 (start_host_log_listener) は
+    そのプロセス間キューに積み、本プロセスのファイルハンドラは閉じる。
+    それ以外の場合は本プロセス内にリスナースレッドを1つ起動する。
+
+    Args:
+        logger_names: 対象のロガー名 (settings.LOGGING の loggers)
+        maxsize: キューの上限件数
+        drop_policy: キューが満杯の場合の動作 (DROP_POLICY_*)
+    """
+    if _listener_pid == os.getpid():
+        # 本プロセスで設定済み
+        return
+
+    handlers_by_route = _collect_handlers(logger_names)
+    if not handlers_by_route:
+        return
+
+    if _host_queue is not None:
+        log_queue = _host_queue
+        for handlers in handlers_by_route.values():
+            for handler in handlers:
+                handler.close()
+    else:
+        log_queue = queue.Queue(maxsize=maxsize)
+        _start_listener(log_queue, handlers_by_route)
+
+    for name in handlers_by_route:
+        logging.getLogger(name).handlers = [
+            BoundedQueueHandler(log_queue, route=name, drop_policy=drop_policy)
+        ]
+
+
+def start_host_log_listener(logging_config: dict, maxsize: int = 10000) -> None:
+    """
+    gunicornマスタープロセスでログ出力用のリスナーを起動する。
+
+    ワーカーはfork時にプロセス間キューを引き継ぎ、setup_queue_logging() でそのキューへ積む。
+    ファイルへの書き込み・日次ローテーションはマスタープロセスの1スレッドのみが行うため、
+    複数プロセスが同じファイルをローテーションすることによる競合が起きない。
+
+    Args:
+        logging_config: settings.LOGGING
+        maxsize: キューの上限件数
+    """
+    global _host_queue
+    if _host_queue is not None:
+        return
+
+    logging.config.dictConfig(logging_config)
+    handlers_by_route = _collect_handlers(list(logging_config.get("loggers", {})))
+    _host_queue = multiprocessing.Queue(maxsize=maxsize)
+    _start_listener(_host_queue, handlers_by_route)
+
+
+def stop_queue_logging() -> None:
+    """リスナーを停止し、キューに残ったログを書き出す"""
+    global _listener
+    # fork元 (gunicornマスター) のリスナーはワーカーから停止しない
+    if _listener is not None and _listener_pid == os.getpid():
+        listener, _listener = _listener, None
+        listener.stop()
@@ -0,0 +1,72 @@
+import hashlib
+import time
+from typing import Optional
+
+from django.core.cache import cache
+
+# 役割: キャッシュ上のカウンタで、直近 window_seconds 秒間の発生回数を数える (スライディングウィンドウ)。
+# 利用例: ログイン失敗回数をメールアドレス・IPアドレスごとに数え、一定回数を超えた試行を拒否する。
+#         現在と1つ前の固定ウィンドウのカウンタを経過時間で按分するため、キーごとに2件のみを保持する。
+
+
+class SlidingWindowCounter:
+    """
+    直近 window_seconds 秒間の発生回数を、キャッシュの incr で数えるクラス。
+
+    1つ前のウィンドウの回数を「現在のウィンドウに重なっている割合」で按分して加算するため、
+    固定ウィンドウの境界をまたいだ連続試行も取りこぼさない。
+    ※プロセス間で共有するキャッシュ (settings.CACHE_URL) を使用しない場合、回数はプロセスごとになる。
+    """
+
+    CACHE_KEY = "sliding_window:{0}:{1}:{2}"
+
+    def __init__(self, prefix: str, window_seconds: int):
+        self.prefix = prefix
+        self.window_seconds = window_seconds
+
+    def _make_key(self, key: str, bucket: int) -> str:
+        # メールアドレスなどをそのままキーにしないよう (キャッシュのキーの文字種・長さの制限)、ハッシュ化する
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.CACHE_KEY.format(self.prefix, digest, bucket)
+
+    def _get_buckets(self, key: str, now: float):
+        bucket = int(now // self.window_seconds)
+        elapsed_ratio = (now % self.window_seconds) / self.window_seconds
+        return (
+            self._make_key(key, bucket),
+            self._make_key(key, bucket - 1),
+            elapsed_ratio,
+        )
+
+    def count(self, key: str, now: Optional[float] = None) -> float:
+        """直近 window_seconds 秒間の発生回数 (推定値) を返す"""
+        current_key, previous_key, elapsed_ratio = self._get_buckets(
+            key, time.time() if now is None else now
+        )
+        values = cache.get_many([current_key, previous_key])
+        return values.get(current_key, 0) + values.get(previous_key, 0) * (1 - elapsed_ratio)
+
+    def hit(self, key: str, now: Optional[float] = None) -> float:
+        """発生回数を1増やし、増やした後の直近 window_seconds 秒間の発生回数 (推定値) を返す"""
+        current_key, previous_key, elapsed_ratio = self._get_buckets(
+            key, time.time() if now is None else now
+        )
+        # 次のウィンドウで按分に使うため、2ウィンドウ分の期間は残す
+        if cache.add(current_key, 1, timeout=self.window_seconds * 2):
+            current = 1
+        else:
+            try:
+                current = cache.incr(current_key)
+            except ValueError:
+                # add と incr の間に期限切れになった場合
+                cache.set(current_key, 1, timeout=self.window_seconds * 2)
+                current = 1
+        previous = cache.get(previous_key, 0)
+        return current + previous * (1 - elapsed_ratio)
+
+    def reset(self, key: str, now: Optional[float] = None) -> None:
+        """発生回数を0に戻す"""
+        current_key, previous_key, _ = self._get_buckets(
+            key, time.time() if now is None else now
+        )
+        cache.delete_many([current_key, previous_key])
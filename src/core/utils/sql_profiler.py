@@ -0,0 +1,201 @@
+import os
+import re
+import sys
+import time
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+
+# 役割: 実行されたSQLをフィンガープリント (リテラルを除いた正規化SQL) 単位で集計するプロファイラ。
+# 利用例: core.decorators.logging_sql_queries / NPlusOneDetectionMiddleware から、
+#         サンプリング対象のリクエストでのみ使用する。
+#         件数のみを数える QueryCounter は QueryBudgetMiddleware から全リクエストで使用する。
+
+# 正規化用の正規表現 (モジュール読み込み時に1回だけコンパイル)
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# 呼び出し元の判定に使用するパス
+_PROJECT_ROOT = str(settings.BASE_DIR)
+_EXCLUDED_PATHS = (
+    os.path.abspath(__file__),
+    os.sep + "site-packages" + os.sep,
+    os.sep + "dist-packages" + os.sep,
+)
+
+
+def _is_project_file(filename: str) -> bool:
+    """プロジェクト内のソース (ライブラリと本モジュールを除く) か判定する"""
+    if not filename.startswith(_PROJECT_ROOT):
+        return False
+    return not any(path in filename for path in _EXCLUDED_PATHS)
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    SQLからリテラルとプレースホルダの個数の違いを取り除き、同じ形のクエリを同一視できる文字列にする。
+    例: SELECT ... WHERE id IN (%s, %s, %s) AND name = 'abc' -> SELECT ... WHERE id IN (?) AND name = ?
+    """
+    sql = _STRING_LITERAL_RE.sub("?", sql)
+    sql = _NUMBER_LITERAL_RE.sub("?", sql)
+    sql = _PLACEHOLDER_LIST_RE.sub("(?)", sql)
+    sql = sql.replace("%s", "?")
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+class QueryCounter:
+    """
+    connection.execute_wrapper に渡され、実行されたクエリの件数のみを数えるクラス。
+    SQLの正規化を行わないため、全リクエストで常時使用できる (クエリバジェットの計測用)。
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: Any
+    ) -> Any:
+        """クエリ実行時に呼び出されるフック"""
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def install(self) -> ExitStack:
+        """全てのDB接続にフックを設定する (with文で使用し、抜けると解除される)"""
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(self))
+        return stack
+
+
+class QueryStats:
+    """フィンガープリント1件分の集計値"""
+
+    __slots__ = ("fingerprint", "count", "duration")
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.count = 0
+        self.duration = 0.0
+
+
+class QueryProfiler:
+    """
+    connection.execute_wrapper に渡され、実行されたクエリの件数・DB時間を
+    フィンガープリント単位で集計するクラス。
+    """
+
+    def __init__(self, keep_queries: bool = False):
+        # keep_queries=True の場合は実行したSQLとパラメータもそのまま保持する (DEBUG時の詳細出力用)
+        self.keep_queries = keep_queries
+        self.queries: List[Tuple[str, Any]] = []
+        self.stats: Dict[str, QueryStats] = {}
+        self.total_count = 0
+        self.total_duration = 0.0
+
+    def __call__(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: Any
+    ) -> Any:
+        """クエリ実行時に呼び出されるフック"""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, params, time.perf_counter() - start)
+
+    def record(self, sql: str, params: Any, duration: float) -> QueryStats:
+        fingerprint = fingerprint_sql(sql)
+        stats = self.stats.get(fingerprint)
+        if stats is None:
+            stats = self.stats[fingerprint] = QueryStats(fingerprint)
+        stats.count += 1
+        stats.duration += duration
+
+        self.total_count += 1
+        self.total_duration += duration
+        if self.keep_queries:
+            self.queries.append((sql, params))
+        return stats
+
+    def top_stats(self, limit: int = 5) -> List[QueryStats]:
+        """DB時間の長い順にフィンガープリントの集計値を返す"""
+        return sorted(self.stats.values(), key=lambda s: s.duration, reverse=True)[
+            :limit
+        ]
+
+    def install(self) -> ExitStack:
+        """全てのDB接続にフックを設定する (with文で使用し、抜けると解除される)"""
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(self))
+        return stack
+
+
+class CallSiteStats:
+    """フィンガープリント + 呼び出し元1件分の集計値"""
+
+    __slots__ = ("fingerprint", "call_site", "count", "stack_summary")
+
+    def __init__(self, fingerprint: str, call_site: str, stack_summary: List[str]):
+        self.fingerprint = fingerprint
+        self.call_site = call_site
+        self.count = 0
+        # 最初に実行された時点の呼び出し履歴 (プロジェクト内のフレームのみ)
+        self.stack_summary = stack_summary
+
+
+class NPlusOneDetector(QueryProfiler):
+    """
+    同じ形のSELECTが同じ呼び出し元から閾値を超えて実行されたもの (N+1クエリ) を検出するプロファイラ。
+    呼び出し元はプロジェクト内のコードで最も内側のフレーム (ファイル名:行番号) とする。
+    """
+
+    # 呼び出し履歴に含めるフレームの件数
+    STACK_SUMMARY_LIMIT = 5
+
+    def __init__(self, threshold: int):
+        super().__init__()
+        self.threshold = threshold
+        self.call_sites: Dict[Tuple[str, str], CallSiteStats] = {}
+
+    def record(self, sql: str, params: Any, duration: float) -> QueryStats:
+        stats = super().record(sql, params, duration)
+        # INSERT/UPDATE (履歴の登録など) は対象外とし、ループ内の参照クエリのみを検出する
+        if stats.fingerprint[:6].upper() != "SELECT":
+            return stats
+
+        stack_summary = self._get_stack_summary()
+        call_site = stack_summary[0] if stack_summary else "<unknown>"
+        key = (stats.fingerprint, call_site)
+        site_stats = self.call_sites.get(key)
+        if site_stats is None:
+            site_stats = self.call_sites[key] = CallSiteStats(
+                stats.fingerprint, call_site, stack_summary
+            )
+        site_stats.count += 1
+        return stats
+
+    def find_n_plus_one(self) -> List[CallSiteStats]:
+        """閾値を超えて実行されたフィンガープリント + 呼び出し元を実行回数の多い順に返す"""
+        return sorted(
+            (s for s in self.call_sites.values() if s.count > self.threshold),
+            key=lambda s: s.count,
+            reverse=True,
+        )
+
+    def _get_stack_summary(self) -> List[str]:
+        """プロジェクト内のフレームを内側から STACK_SUMMARY_LIMIT 件取得する"""
+        summary = []
+        frame: Optional[Any] = sys._getframe(1)
+        while frame is not None and len(summary) < self.STACK_SUMMARY_LIMIT:
+            filename = frame.f_code.co_filename
+            if _is_project_file(filename):
+                summary.append(
+                    f"{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.f_lineno}"
+                    f" in {frame.f_code.co_name}"
+                )
+            frame = frame.f_back
+        return summary
@@ -0,0 +1,118 @@
+import atexit
+import threading
+import time
+from typing import Any, List
+
+from core.exceptions import JobQueueFullError
+
+# 役割: リクエスト中の書き込みをプロセス内に溜め、一定件数・一定間隔ごとにまとめてDBに反映する (ライトビハインド)。
+# 利用例: サブクラスで _append() / _take() / _restore() / _write() / _size() を実装し、add() で溜めた内容を
+#         ジョブランナーのスレッドで _write() する。asynchronous=False の場合は add() の中で即時に反映する。
+
+
+class WriteBehindBuffer:
+    """
+    書き込みを溜めておき、まとめて反映するクラスの基底クラス。
+
+    - 溜めた件数が batch_size に達した場合、または前回の反映から flush_interval 秒が経過した場合に
+      ジョブランナーへ反映処理 (flush) を登録する (実行中・実行待ちの反映処理は1件まで)
+    - ジョブの実行待ちが上限で登録できない場合は、次の add() または定期ジョブで反映する
+    - 反映に失敗した内容はバッファの先頭に戻し、次の反映処理で再度書き込む
+    - asynchronous=False の場合は溜めずに、add() を呼び出したスレッドで1件ずつ書き込む
+    """
+
+    # ジョブランナーに登録するジョブ名
+    job_name = "WriteBehindBuffer"
+
+    def __init__(self, batch_size: int, flush_interval: float, asynchronous: bool = True):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.asynchronous = asynchronous
+
+        self._lock = threading.Lock()
+        # 反映処理を実行中または実行待ちか
+        self._flush_pending = False
+        self._last_flushed_at = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # サブクラスで実装する処理 (_append / _take / _restore / _size は self._lock の取得中に呼び出される)
+    # ------------------------------------------------------------------
+    def _append(self, item: Any) -> None:
+        raise NotImplementedError
+
+    def _take(self) -> List[Any]:
+        """溜めている内容を全て取り出して空にする"""
+        raise NotImplementedError
+
+    def _restore(self, items: List[Any]) -> None:
+        """反映に失敗した内容をバッファの先頭に戻す (上限がある場合は上限を超えないようにする)"""
+        raise NotImplementedError
+
+    def _size(self) -> int:
+        raise NotImplementedError
+
+    def _write(self, items: List[Any]) -> None:
+        """
+        取り出した内容をDBに反映する (ロックの外で呼び出される)。
+        失敗した場合は items 全体を戻して再度書き込むため、一部だけが反映された状態で例外を送出しない。
+        """
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------
+    # 共通処理
+    # ------------------------------------------------------------------
+    def add(self, item: Any) -> None:
+        if not self.asynchronous:
+            # 他のスレッドの反映処理中でも取り残さないよう、バッファを経由せずに書き込む
+            # (失敗した場合は例外を呼び出し元に送出する)
+            self._write([item])
+            return
+
+        with self._lock:
+            self._append(item)
+            should_flush = not self._flush_pending and (
+                self._size() >= self.batch_size
+                or time.monotonic() - self._last_flushed_at >= self.flush_interval
+            )
+            if should_flush:
+                self._flush_pending = True
+
+        if not should_flush:
+            return
+
+        from core.utils.job_runner import get_job_runner
+
+        try:
+            get_job_runner().submit(self.flush, job_name=self.job_name)
+        except JobQueueFullError:
+            with self._lock:
+                self._flush_pending = False
+
+    def flush(self) -> int:
+        """
+        溜めている内容をDBに反映し、反映した件数を返す。
+        反映に失敗した場合は取り出した内容をバッファの先頭に戻してから例外を送出する。
+        """
+        with self._lock:
+            items = self._take()
+            self._last_flushed_at = time.monotonic()
+
+        try:
+            if items:
+                self._write(items)
+        except Exception:
+            with self._lock:
+                self._restore(items)
+            raise
+        finally:
+            with self._lock:
+                self._flush_pending = False
+        return len(items)
+
+    def register_atexit(self) -> None:
+        """プロセスの正常終了時に、溜めている内容を反映する"""
+        atexit.register(self.flush)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size()
@@ -0,0 +1,22 @@
+from django.urls import reverse
+
+from core.tests.query_budget import QueryBudgetTestCase
+from dashboard import urls as dashboard_urls
+
+
+class DashboardQueryBudgetTest(QueryBudgetTestCase):
+    """
+    dashboard/urls.py の全URLがクエリバジェット内で処理されることを検証する。
+    """
+
+    urls_module = dashboard_urls
+    tested_url_names = ("dashboard",)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls.create_active_user("budget-dashboard@example.com")
+
+    def test_dashboard(self):
+        self.client.force_login(self.user)
+        response = self.request_within_budget("GET", reverse("dashboard:dashboard"))
+        self.assertEqual(response.status_code, 200)
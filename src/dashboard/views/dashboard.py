@@ -9,6 +9,7 @@ class DashboardView(LoginRequiredMixin, TemplateView):
     """
 
     template_name = "dashboard/dashboard.html"
+    query_budget = {"GET": 5}
 
     # 必要に応じて、ここで get_context_data を実装してDBからデータを取得します。
     # 現在は一旦空でOKです。
@@ -63,3 +63,47 @@ error_log_handler = TimedRotatingFileHandler(
 )
 error_log_handler.setFormatter(log_format)
 error_logger.addHandler(error_log_handler)
+
+
+# Server Hooks
+# ========================================
+def on_starting(server):
+    """
+    マスタープロセス起動時に、Djangoのログ出力 (access/application) の書き込みスレッドを起動する。
+    ワーカーはfork時にログキューを引き継いで積むだけとなり、ファイルの書き込みと
+    日次ローテーションはマスタープロセスの1スレッドのみが行う (プロセス間でのローテーション競合を防ぐ)。
+    """
+    import os
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    from django.conf import settings
+
+    if settings.LOG_QUEUE_ENABLED:
+        from core.utils.queue_logging import start_host_log_listener
+
+        start_host_log_listener(settings.LOGGING, maxsize=settings.LOG_QUEUE_MAXSIZE)
+
+
+def on_exit(server):
+    """マスタープロセス終了時に、キューに残ったログを書き出す"""
+    from core.utils.queue_logging import stop_queue_logging
+
+    stop_queue_logging()
+
+
+def post_worker_init(worker):
+    """
+    ワーカー起動時 (Djangoアプリ読み込み後) に定期ジョブのスケジューラを開始する。
+    各ワーカーで開始し、ジョブごとにリーダーに選出された1ワーカーのみが実行する
+    (settings.PERIODIC_JOBS_ENABLED が False の場合は開始しない)。
+    """
+    from core.utils.job_runner import start_job_runner
+
+    start_job_runner()
+
+
+def worker_exit(server, worker):
+    """ワーカー終了時にスケジューラを停止し、他のワーカーがすぐにリーダーを引き継げるようにする"""
+    from core.utils.job_runner import stop_job_runner
+
+    stop_job_runner()